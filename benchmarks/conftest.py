@@ -0,0 +1,64 @@
+import sys
+from pathlib import Path
+import pytest
+
+# Add the python directory to PYTHONPATH
+python_dir = str(Path(__file__).parent.parent / 'python')
+if python_dir not in sys.path:
+    sys.path.insert(0, python_dir)
+
+import harness
+
+_RESULTS = harness.BenchmarkResults()
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("benchmarks")
+    group.addoption("--bench-save", default=None,
+                    help="Save benchmark results to a JSON file")
+    group.addoption("--bench-compare", default=None,
+                    help="Compare benchmark results against a saved JSON baseline, fails on regressions")
+    group.addoption("--bench-threshold", type=float, default=harness.DEFAULT_THRESHOLD,
+                    help="Allowed slowdown before a result is a regression, eg: 0.25")
+    group.addoption("--bench-sizes", default=",".join(str(size) for size in harness.DEFAULT_SIZES),
+                    help="Comma separated hierarchy sizes, eg: 100,1000")
+
+
+def pytest_generate_tests(metafunc):
+    if "hierarchy_size" in metafunc.fixturenames:
+        sizes = [int(size) for size in metafunc.config.getoption("--bench-sizes").split(",") if size]
+        metafunc.parametrize("hierarchy_size", sizes)
+
+
+class _Bench(object):
+    """Times a function and records the result for the session"""
+    def __call__(self, name, func, size=None):
+        seconds = harness.best_time(func)
+        key = _RESULTS.record(name, seconds, size)
+        print(f"\n{key}: {harness.format_time(seconds)}", end="")
+        return seconds
+
+
+@pytest.fixture
+def bench():
+    return _Bench()
+
+
+def pytest_sessionfinish(session, exitstatus):
+    config = session.config
+    if not _RESULTS.results:
+        return
+    save_path = config.getoption("--bench-save")
+    if save_path:
+        _RESULTS.save(save_path)
+
+    compare_path = config.getoption("--bench-compare")
+    if compare_path:
+        threshold = config.getoption("--bench-threshold")
+        regressions = harness.compare(harness.load(compare_path), _RESULTS.results, threshold)
+        reporter = config.pluginmanager.get_plugin("terminalreporter")
+        if reporter:
+            reporter.write_sep("=", "benchmark comparison")
+            reporter.write_line(harness.format_regressions(regressions, threshold))
+        if regressions and session.exitstatus == 0:
+            session.exitstatus = pytest.ExitCode.TESTS_FAILED
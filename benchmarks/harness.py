@@ -0,0 +1,166 @@
+"""Benchmark timing, JSON baselines and regression comparison
+
+Benchmarks record their timings through the `bench` fixture, see conftest.py:
+    pytest benchmarks -s --bench-save=baseline.json
+    pytest benchmarks -s --bench-compare=baseline.json --bench-threshold=0.25
+
+Two saved result files can also be compared directly:
+    python benchmarks/harness.py baseline.json results.json --threshold 0.25
+"""
+import argparse
+import json
+import platform
+import random
+import sys
+import timeit
+
+DEFAULT_THRESHOLD = 0.25
+# 100000 is supported but slow, pass --bench-sizes=100,1000,10000,100000
+DEFAULT_SIZES = (100, 1000, 10000)
+
+
+def best_time(func, repeat=5, max_seconds=1.0):
+    """Best time per call in seconds
+
+    The number of calls per run is chosen automatically,
+    slow functions are only run once.
+
+    Args:
+        func(Callable): function to time, takes no arguments
+        repeat(int): number of runs to take the best of
+        max_seconds(float): skip repeats once a single run takes this long
+
+    Returns:
+        float
+    """
+    timer = timeit.Timer(func)
+    number, elapsed = timer.autorange()
+    best = elapsed / number
+    if elapsed * (repeat - 1) > max_seconds:
+        return best
+    return min([best] + [each / number for each in timer.repeat(repeat - 1, number)])
+
+
+def result_key(name, size=None):
+    """Name used to store a result, eg: mesh.compute_bounds[1000]"""
+    if size is None:
+        return name
+    return f"{name}[{size}]"
+
+
+class BenchmarkResults(object):
+    """Collected timings for a benchmark session"""
+    def __init__(self):
+        self.results = {}
+
+    def record(self, name, seconds, size=None):
+        key = result_key(name, size)
+        self.results[key] = {"seconds": seconds, "size": size}
+        return key
+
+    def to_dict(self):
+        return {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "results": self.results,
+        }
+
+    def save(self, path):
+        with open(path, "w") as handle:
+            json.dump(self.to_dict(), handle, indent=2, sort_keys=True)
+
+
+def load(path):
+    """Load the results of a saved benchmark file
+
+    Returns:
+        Dict[str, dict]
+    """
+    with open(path) as handle:
+        return json.load(handle)["results"]
+
+
+def compare(baseline, current, threshold=DEFAULT_THRESHOLD):
+    """Find results that are slower than the baseline by more than the threshold
+
+    Results missing from either side are ignored.
+
+    Args:
+        baseline(Dict[str, dict]): baseline results
+        current(Dict[str, dict]): new results
+        threshold(float): allowed slowdown, 0.25 is 25% slower
+
+    Returns:
+        List[Tuple[str, float, float]]: key, baseline seconds, current seconds
+    """
+    regressions = []
+    for key, result in sorted(current.items()):
+        base = baseline.get(key)
+        if not base or not base["seconds"]:
+            continue
+        if result["seconds"] > base["seconds"] * (1.0 + threshold):
+            regressions.append((key, base["seconds"], result["seconds"]))
+    return regressions
+
+
+def format_time(seconds):
+    """Format a duration with a readable unit"""
+    for unit, scale in (("s", 1.0), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.2f}{unit}"
+    return f"{seconds / 1e-9:.0f}ns"
+
+
+def format_regressions(regressions, threshold=DEFAULT_THRESHOLD):
+    """Format regressions from compare as a report"""
+    if not regressions:
+        return f"No benchmark regressions over {threshold:.0%}"
+    lines = [f"{len(regressions)} benchmark regression(s) over {threshold:.0%}:"]
+    for key, base, current in regressions:
+        lines.append(f"  {key}: {format_time(base)} -> {format_time(current)} ({current / base - 1.0:+.0%})")
+    return "\n".join(lines)
+
+
+def build_hierarchy(count, item_type, branching=10, seed=0, **kwargs):
+    """Build a balanced hierarchy of items for benchmarking
+
+    Items are positioned randomly within a 1000x1000 area relative to their parent.
+
+    Args:
+        count(int): total number of items including the root
+        item_type(type): IHierarchyItem subclass to create
+        branching(int): children per item
+        seed(int): random seed so hierarchies are repeatable
+        kwargs: attributes to set on every item, eg: is2d=True
+
+    Returns:
+        IHierarchyItem: root item
+    """
+    rng = random.Random(seed)
+    items = []
+    for i in range(count):
+        item = item_type()
+        item.name = f"item{i}"
+        for key, value in kwargs.items():
+            setattr(item, key, value)
+        if hasattr(item, "position"):
+            item.position = [rng.uniform(0, 1000), rng.uniform(0, 1000), 0]
+        if i:
+            item.parent = items[(i - 1) // branching]
+        items.append(item)
+    return items[0]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compare two benchmark result files")
+    parser.add_argument("baseline")
+    parser.add_argument("current")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    args = parser.parse_args(argv)
+    regressions = compare(load(args.baseline), load(args.current), args.threshold)
+    print(format_regressions(regressions, args.threshold))
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,76 @@
+"""Benchmarks for IHierarchyItem structure changes
+
+Run with: pytest benchmarks -s --bench-sizes=100,1000
+"""
+import pytest
+import harness
+from met_viewport_utils.constants import TraversalOrder
+from met_viewport_utils.interfaces.hierachy import IHierarchyItem
+
+
+def test_hierarchy_append_children(bench, hierarchy_size):
+    """Append many children to a single parent, this should scale linearly"""
+    children = [IHierarchyItem() for _ in range(hierarchy_size)]
+
+    def build():
+        parent = IHierarchyItem()
+        for child in children:
+            child.parent = parent
+    bench("hierarchy.append_children", build, hierarchy_size)
+
+
+def test_hierarchy_reparent(bench, hierarchy_size):
+    """Move a child between two large parents"""
+    parent1 = IHierarchyItem()
+    parent2 = IHierarchyItem()
+    parent1.append([IHierarchyItem() for _ in range(hierarchy_size)])
+    parent2.append([IHierarchyItem() for _ in range(hierarchy_size)])
+    child = parent1.children[hierarchy_size // 2]
+
+    def reparent():
+        child.parent = parent2
+        child.parent = parent1
+    bench("hierarchy.reparent", reparent, hierarchy_size)
+
+
+def _chain(depth):
+    root = item = IHierarchyItem()
+    for i in range(depth):
+        child = IHierarchyItem()
+        child.name = f"item{i}"
+        child.parent = item
+        item = child
+    return root, item
+
+
+def test_hierarchy_path_and_root(bench, hierarchy_size):
+    """Path and root lookups on the leaf of a deep chain"""
+    root, leaf = _chain(hierarchy_size)
+    bench("hierarchy.path", lambda: leaf.path, hierarchy_size)
+    bench("hierarchy.get_root", leaf.get_root, hierarchy_size)
+
+
+@pytest.mark.parametrize("order", list(TraversalOrder), ids=lambda order: order.name)
+def test_hierarchy_iter_descendants_chain(bench, hierarchy_size, order):
+    """Traversal of a deep chain should scale linearly with its length"""
+    root, _ = _chain(hierarchy_size)
+    bench(f"hierarchy.iter_descendants_chain.{order.name}",
+          lambda: sum(1 for _ in root.iter_descendants(order=order)), hierarchy_size)
+
+
+@pytest.mark.parametrize("order", list(TraversalOrder), ids=lambda order: order.name)
+def test_hierarchy_iter_descendants_scaling(order):
+    """10x the items should take about 10x the time, a quadratic walk is about 100x"""
+    small, _ = _chain(2000)
+    large, _ = _chain(20000)
+    ratio = (harness.best_time(lambda: sum(1 for _ in large.iter_descendants(order=order)))
+             / harness.best_time(lambda: sum(1 for _ in small.iter_descendants(order=order))))
+    print(f"\nhierarchy.iter_descendants_chain.{order.name} 10x scaling: {ratio:.1f}x", end="")
+    assert ratio < 30
+
+
+def test_hierarchy_iter_descendants_tree(bench, hierarchy_size):
+    """Traversal of a balanced tree"""
+    root = harness.build_hierarchy(hierarchy_size, IHierarchyItem)
+    bench("hierarchy.iter_descendants_tree",
+          lambda: sum(1 for _ in root.iter_descendants()), hierarchy_size)
@@ -0,0 +1,51 @@
+"""Import time benchmarks
+
+Run with: pytest benchmarks -s
+Each import is timed in a fresh interpreter so nothing is cached.
+"""
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+_PYTHON_DIR = str(Path(__file__).parent.parent / "python")
+
+# Generous budget, numpy alone accounts for most of this
+POINT_ITEM_IMPORT_BUDGET_MS = 500
+
+_SCRIPT = """
+import json, sys, time
+start = time.perf_counter()
+import {module}
+elapsed = (time.perf_counter() - start) * 1000
+print(json.dumps({{"ms": elapsed, "matplotlib": "matplotlib" in sys.modules}}))
+"""
+
+
+def _time_import(module, repeat=3):
+    """Best import time of a module in milliseconds and whether it loaded matplotlib"""
+    results = []
+    for _ in range(repeat):
+        output = subprocess.check_output(
+            [sys.executable, "-c", _SCRIPT.format(module=module)],
+            cwd=_PYTHON_DIR,
+            env=dict(os.environ, PYTHONPATH=_PYTHON_DIR),
+        )
+        results.append(json.loads(output))
+    return min(result["ms"] for result in results), any(result["matplotlib"] for result in results)
+
+
+def test_point_item_import_budget():
+    """Importing PointItem must not load matplotlib and stays within budget"""
+    elapsed_ms, matplotlib_loaded = _time_import("met_viewport_utils.items.point_item")
+    print(f"\nimport met_viewport_utils.items.point_item: {elapsed_ms:.1f}ms")
+    assert not matplotlib_loaded
+    assert elapsed_ms < POINT_ITEM_IMPORT_BUDGET_MS
+
+
+def test_gpu_font_import_is_lazy():
+    """matplotlib is deferred until a font is resolved"""
+    elapsed_ms, matplotlib_loaded = _time_import("met_viewport_utils.interfaces.gpu_font")
+    print(f"\nimport met_viewport_utils.interfaces.gpu_font: {elapsed_ms:.1f}ms")
+    assert not matplotlib_loaded
@@ -0,0 +1,46 @@
+"""Micro-benchmarks for shape.mesh and shape.generate
+
+Run with: pytest benchmarks -s
+Sizes are the number of mesh divisions.
+"""
+import pytest
+from met_viewport_utils.shape import generate
+from met_viewport_utils.shape.rect import Rect
+
+DIVISIONS = (32, 256, 4096)
+
+
+@pytest.mark.parametrize("divisions", DIVISIONS)
+def test_mesh_compute_bounds(bench, divisions):
+    mesh = generate.circle2d(Rect([0, 0], [100, 100]), divisions)
+    bench("mesh.compute_bounds", mesh.compute_bounds, divisions)
+
+
+@pytest.mark.parametrize("divisions", DIVISIONS)
+def test_mesh_rotate_around(bench, divisions):
+    mesh = generate.circle2d(Rect([0, 0], [100, 100]), divisions)
+    bench("mesh.rotate_around", lambda: mesh.rotate_around(1.0, [50, 50]), divisions)
+
+
+@pytest.mark.parametrize("divisions", DIVISIONS)
+def test_mesh_compute_uvs(bench, divisions):
+    mesh = generate.circle2d(Rect([0, 0], [100, 100]), divisions)
+    bench("mesh.compute_uvs", mesh.compute_uvs, divisions)
+
+
+@pytest.mark.parametrize("divisions", DIVISIONS)
+def test_generate_circle2d(bench, divisions):
+    rect = Rect([0, 0], [100, 100])
+    bench("generate.circle2d", lambda: generate.circle2d(rect, divisions), divisions)
+
+
+@pytest.mark.parametrize("divisions", DIVISIONS)
+def test_generate_arc2d(bench, divisions):
+    rect = Rect([0, 0], [100, 100])
+    bench("generate.arc2d", lambda: generate.arc2d(rect, 10, 0, 270, divisions), divisions)
+
+
+@pytest.mark.parametrize("heads", (1, 2, 4))
+def test_generate_arrow2d(bench, heads):
+    rect = Rect([0, 0], [100, 20])
+    bench("generate.arrow2d", lambda: generate.arrow2d(rect, heads=heads), heads)
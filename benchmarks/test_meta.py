@@ -0,0 +1,72 @@
+"""Micro-benchmarks for algorithm.meta
+
+Run with: pytest benchmarks -s
+"""
+from met_viewport_utils.algorithm import meta
+from met_viewport_utils.items.point_item import PointItem
+from met_viewport_utils.shape.rect import Rect
+
+
+class _Plain:
+    def __init__(self):
+        self.x = 1.0
+
+
+def test_alias_property_get_vs_plain_attribute(bench):
+    """Index alias get compared with a plain attribute and a direct index"""
+    plain = _Plain()
+    rect = Rect([1, 2], [3, 4])
+    position = rect.position
+
+    plain_ns = bench("attribute.get", lambda: plain.x)
+    bench("array.index", lambda: position[0])
+    alias_ns = bench("alias_property.index_get", lambda: rect.x)
+    # Compiled alias should be a small constant on top of the typed property get
+    assert alias_ns < plain_ns * 50
+
+
+def test_alias_property_path_get(bench):
+    """Alias through a dotted and callable path"""
+    class Inner:
+        def __init__(self):
+            self.value = 1.0
+
+        def ref(self):
+            return self
+
+    class Outer:
+        def __init__(self):
+            self._inner = Inner()
+
+        @property
+        def inner(self):
+            return self._inner
+
+        value = meta.alias_property(inner, "ref().value")
+
+    obj = Outer()
+    direct_ns = bench("direct_path.get", lambda: obj.inner.ref().value)
+    alias_ns = bench("alias_property.path_get", lambda: obj.value)
+    assert alias_ns < direct_ns * 5
+
+
+class _Typed:
+    value = meta.typed_property(float, 0.0)
+    flags = meta.typed_property(int, 0, notify=lambda self: None)
+
+
+def test_typed_property_get_set(bench):
+    """Scalar typed property get and set, with and without notify"""
+    obj = _Typed()
+    obj.value = 1.0
+    bench("typed_property.get", lambda: obj.value)
+    bench("typed_property.set", lambda: setattr(obj, "value", 2.0))
+    bench("typed_property.set_notify", lambda: setattr(obj, "flags", 2))
+
+
+def test_typed_property_vector_get_set(bench):
+    """In place vector typed property, eg: PointItem.position"""
+    item = PointItem()
+    position = [1.0, 2.0, 3.0]
+    bench("typed_property.vector_get", lambda: item.position)
+    bench("typed_property.vector_set", lambda: setattr(item, "position", position))
@@ -0,0 +1,137 @@
+"""Benchmarks for item event handling over synthetic hierarchies
+
+Run with: pytest benchmarks -s --bench-sizes=100,1000
+Hierarchies are balanced with 10 children per item.
+"""
+import pytest
+import harness
+from met_viewport_utils.algorithm import types
+from met_viewport_utils.constants import InteractionFlags, KeyboardModifier
+from met_viewport_utils.interfaces import IViewport
+from met_viewport_utils.items.point_item import PointItem
+
+
+class OrthoViewport(IViewport):
+    """Top down orthographic viewport, world xy maps directly to the screen"""
+    def screen_to_world(self, screen_position, depth_point):
+        return types.as_vector3f([screen_position[0], screen_position[1], depth_point[2]])
+
+    def screen_to_ray(self, screen_position):
+        return types.as_vector3f([screen_position[0], screen_position[1], 0]), types.as_vector3f([0, 0, -1])
+
+    def world_to_screen(self, world_position):
+        return types.as_vector2f(world_position)
+
+
+class BatchOrthoViewport(OrthoViewport):
+    """Projects many points in one call, as an adapter using a matrix would"""
+    def world_to_screen_many(self, world_positions):
+        return types.as_vector3f_array(world_positions)[:, :2].copy()
+
+
+@pytest.fixture
+def viewport():
+    return OrthoViewport()
+
+
+def test_point_item_mouse_moved(bench, viewport, hierarchy_size):
+    root = harness.build_hierarchy(hierarchy_size, PointItem, flags=InteractionFlags.Selectable | InteractionFlags.Draggable)
+    position = types.as_vector2f([500, 500])
+    bench(
+        "point_item.mouse_moved",
+        lambda: root.mouse_moved(viewport, position, position, KeyboardModifier.NoKeyboardModifier),
+        hierarchy_size)
+
+
+def test_point_item_mouse_moved_batch_viewport(bench, hierarchy_size):
+    root = harness.build_hierarchy(hierarchy_size, PointItem, flags=InteractionFlags.Selectable | InteractionFlags.Draggable)
+    viewport = BatchOrthoViewport()
+    position = types.as_vector2f([500, 500])
+    bench(
+        "point_item.mouse_moved_batch_viewport",
+        lambda: root.mouse_moved(viewport, position, position, KeyboardModifier.NoKeyboardModifier),
+        hierarchy_size)
+
+
+def test_point_item_global_position(bench, hierarchy_size):
+    # Deepest item of a chain, cached after the first call
+    item = root = PointItem()
+    for _ in range(min(hierarchy_size, 1000) - 1):
+        child = PointItem()
+        child.parent = item
+        item = child
+    bench("point_item.global_position", item.global_position, hierarchy_size)
+
+    def moved():
+        root.position = [1, 0, 0]
+        return item.global_position()
+    bench("point_item.global_position_invalidated", moved, hierarchy_size)
+
+
+def test_point_item_update_selection(bench, hierarchy_size):
+    root = harness.build_hierarchy(hierarchy_size, PointItem, flags=InteractionFlags.Selectable)
+    items = list(root.iter_descendants(PointItem))
+    first, last = items[0], items[-1]
+
+    def click():
+        first._update_selection(KeyboardModifier.NoKeyboardModifier)
+        last._update_selection(KeyboardModifier.NoKeyboardModifier)
+    bench("point_item.update_selection", click, hierarchy_size)
+
+
+def test_point_item_drag_group(bench, hierarchy_size):
+    from met_viewport_utils.items.drag_group import DragGroup
+    root = harness.build_hierarchy(hierarchy_size, PointItem, flags=InteractionFlags.Draggable)
+    # Leaf items so no item moves with a parent in the group
+    group = DragGroup(item for item in root.iter_descendants(PointItem) if not item.children)
+    delta = types.as_vector2f([1, 1])
+    bench(
+        "point_item.drag_group_move",
+        lambda: group.move(None, delta, KeyboardModifier.NoKeyboardModifier),
+        hierarchy_size)
+
+
+def test_point_item_event_queue(bench, viewport, hierarchy_size):
+    from met_viewport_utils.items.event_queue import EventQueue
+    root = harness.build_hierarchy(hierarchy_size, PointItem, flags=InteractionFlags.Selectable | InteractionFlags.Draggable)
+    queue = EventQueue(root)
+    positions = [types.as_vector2f([500 + x, 500]) for x in range(10)]
+
+    # Ten host moves in one frame, only the last is dispatched
+    def frame():
+        for position in positions:
+            queue.mouse_moved(viewport, position, position, KeyboardModifier.NoKeyboardModifier)
+        return queue.flush()
+    bench("point_item.event_queue_10_moves", frame, hierarchy_size)
+
+
+def test_point_item_mouse_moved_sparse(bench, viewport, hierarchy_size):
+    # One interactive item in a hundred, other subtrees are skipped
+    root = harness.build_hierarchy(hierarchy_size, PointItem, flags=InteractionFlags.NoInteraction)
+    for index, item in enumerate(root.iter_descendants(PointItem)):
+        if index % 100 == 0:
+            item.flags = InteractionFlags.Selectable | InteractionFlags.Draggable
+    position = types.as_vector2f([500, 500])
+    bench(
+        "point_item.mouse_moved_sparse",
+        lambda: root.mouse_moved(viewport, position, position, KeyboardModifier.NoKeyboardModifier),
+        hierarchy_size)
+
+
+def test_point_item_mouse_moved_jitter(bench, hierarchy_size):
+    # Sub-pixel jitter over an unchanged scene reuses the last hover result
+    from met_viewport_utils.interfaces import MatrixViewport
+    from met_viewport_utils.interfaces.matrix_viewport import orthographic_matrix
+    from met_viewport_utils.shape.rect import Rect
+    root = harness.build_hierarchy(hierarchy_size, PointItem, flags=InteractionFlags.Selectable | InteractionFlags.Draggable)
+    viewport = MatrixViewport(
+        projection=orthographic_matrix(0, 1000, 0, 1000, -1, 1),
+        rect=Rect([0, 0], [1000, 1000]))
+    positions = [types.as_vector2f([500.25, 500.25]), types.as_vector2f([500.5, 500.75])]
+
+    def jitter():
+        for position in positions:
+            root.mouse_moved(viewport, position, position, KeyboardModifier.NoKeyboardModifier)
+    # The first move dispatches, later ones are the steady state
+    jitter()
+    bench("point_item.mouse_moved_jitter", jitter, hierarchy_size)
@@ -0,0 +1,26 @@
+"""Micro-benchmarks for shape.rect
+
+Run with: pytest benchmarks -s
+"""
+from met_viewport_utils.shape.rect import Rect
+from met_viewport_utils.shape.margins import Margins
+
+
+def test_rect_intersect(bench):
+    first = Rect([0, 0], [100, 100])
+    second = Rect([50, 50], [100, 100])
+    bench("rect.intersect", lambda: first.intersect(second))
+
+
+def test_rect_contains(bench):
+    rect = Rect([0, 0], [100, 100])
+    other = Rect([50, 50], [100, 100])
+    point = [50.0, 50.0]
+    bench("rect.contains_point", lambda: rect.contains(point))
+    bench("rect.contains_rect", lambda: rect.contains(other))
+
+
+def test_rect_adjusted(bench):
+    rect = Rect([0, 0], [100, 100])
+    margins = Margins(1, 2, 3, 4)
+    bench("rect.adjusted", lambda: rect.adjusted(margins))
@@ -0,0 +1,75 @@
+"""Benchmarks for hover hit-testing, linear, batched and with a spatial index
+
+Run with: pytest benchmarks/test_spatial.py -s
+"""
+import pytest
+import harness
+from met_viewport_utils.algorithm import types
+from met_viewport_utils.algorithm.spatial import GridIndex, QuadTreeIndex
+from met_viewport_utils.constants import InteractionFlags, KeyboardModifier
+from met_viewport_utils.items.hit_test import batch_hit_test
+from met_viewport_utils.items.item_index import ItemIndex
+from met_viewport_utils.items.point_item import PointItem
+
+INDEX_TYPES = {
+    "grid": GridIndex,
+    "quadtree": QuadTreeIndex,
+}
+
+
+def _handles(size):
+    root = harness.build_hierarchy(size, PointItem, is2d=True, flags=InteractionFlags.Selectable | InteractionFlags.Draggable)
+    return root, [root] + list(root.iter_descendants(PointItem))
+
+
+def _rebuild(index, items):
+    for item in items:
+        index.mark_dirty(item)
+    index.update()
+
+
+def test_hit_test_linear(bench, hierarchy_size):
+    root, items = _handles(hierarchy_size)
+    position = types.as_vector2f(items[-1].global_position())
+    bench(
+        "hit_test.linear",
+        lambda: [item for item in items if item._is_under_mouse(None, position, position)],
+        hierarchy_size)
+
+
+def test_hit_test_batch(bench, hierarchy_size):
+    root, items = _handles(hierarchy_size)
+    position = types.as_vector2f(items[-1].global_position())
+    bench("hit_test.batch", lambda: batch_hit_test(items, None, position), hierarchy_size)
+
+
+@pytest.mark.parametrize("index_name", sorted(INDEX_TYPES))
+def test_hit_test_index(bench, hierarchy_size, index_name):
+    root, items = _handles(hierarchy_size)
+    index = ItemIndex(INDEX_TYPES[index_name]())
+    root.spatial_index = index
+    position = types.as_vector2f(items[-1].global_position())
+    # Initial build of every rect
+    bench(f"hit_test.{index_name}_build", lambda: _rebuild(index, items), hierarchy_size)
+    bench(f"hit_test.{index_name}", lambda: index.hit_test(None, position), hierarchy_size)
+
+    # Move a single item then query, the index is updated incrementally
+    item = items[len(items) // 2]
+    def move_and_query():
+        item.position = item.position + 1.0
+        return index.hit_test(None, position)
+    bench(f"hit_test.{index_name}_moved", move_and_query, hierarchy_size)
+
+
+@pytest.mark.parametrize("indexed", [False, True])
+def test_mouse_moved_indexed(bench, hierarchy_size, indexed):
+    root, items = _handles(hierarchy_size)
+    if indexed:
+        root.spatial_index = ItemIndex()
+        root.spatial_index.update()
+    position = types.as_vector2f(items[-1].global_position())
+    name = "point_item.mouse_moved_indexed" if indexed else "point_item.mouse_moved_2d"
+    bench(
+        name,
+        lambda: root.mouse_moved(None, position, position, KeyboardModifier.NoKeyboardModifier),
+        hierarchy_size)
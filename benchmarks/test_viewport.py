@@ -0,0 +1,33 @@
+"""Benchmarks for viewport projection, single points against batched matrices
+
+Run with: pytest benchmarks/test_viewport.py -s
+"""
+import math
+import numpy as np
+from met_viewport_utils.interfaces.matrix_viewport import MatrixViewport, look_at_matrix, perspective_matrix
+from met_viewport_utils.shape.rect import Rect
+
+
+def _viewport():
+    return MatrixViewport(
+        view=look_at_matrix([0, -2000, 500], [500, 500, 0]),
+        projection=perspective_matrix(math.radians(45), 16 / 9, 0.1, 10000),
+        rect=Rect([0, 0], [1920, 1080]))
+
+
+def test_world_to_screen_loop(bench, hierarchy_size):
+    viewport = _viewport()
+    points = np.random.default_rng(0).uniform(0, 1000, (hierarchy_size, 3)).astype(np.float32)
+    bench("viewport.world_to_screen_loop", lambda: [viewport.world_to_screen(point) for point in points], hierarchy_size)
+
+
+def test_world_to_screen_many(bench, hierarchy_size):
+    viewport = _viewport()
+    points = np.random.default_rng(0).uniform(0, 1000, (hierarchy_size, 3)).astype(np.float32)
+    bench("viewport.world_to_screen_many", lambda: viewport.world_to_screen_many(points), hierarchy_size)
+
+
+def test_screen_to_ray_many(bench, hierarchy_size):
+    viewport = _viewport()
+    points = np.random.default_rng(0).uniform(0, 1000, (hierarchy_size, 2)).astype(np.float32)
+    bench("viewport.screen_to_ray_many", lambda: viewport.screen_to_ray_many(points), hierarchy_size)
@@ -4,37 +4,129 @@
 class _ext:
     """ External Dependencies """
     from typing import List, Union
+    import functools
+    import numbers
+    import numpy as np
     from numpy import typing as npt
     from met_viewport_utils.algorithm import types
 
 
-def parse_color(color:_ext.Union[float, str, _ext.types.Vector3fCompat], alpha:float=None) ->_ext.npt.NDArray:
+ColorCompat = _ext.Union[int, str, _ext.types.Vector3fCompat, _ext.types.Vector4fCompat]
+
+
+@_ext.functools.lru_cache(maxsize=1024)
+def _parse_hex(color:str, alpha:float=None) ->_ext.npt.NDArray:
+    """Parse a hex string, results are cached and returned as read-only arrays
+
+    Args:
+        color (str): hex color, eg: #FF0000 or #FF0000FF
+        alpha(float): alpha to use
+
+    Raises:
+        ValueError: If color is not a 6 or 8 digit hex string
+
+    Returns:
+        Vector
+    """
+    hex = color.strip("#")
+    if len(hex) not in (6, 8):
+        raise ValueError(f"Invalid hex color, requires 6 or 8 digits, got {color!r}")
+    array = _ext.np.frombuffer(bytes.fromhex(hex), dtype=_ext.np.uint8).astype(_ext.np.float32)
+    array /= 255.0
+    if len(array) == 3:
+        array = _ext.np.append(array, _ext.np.float32(1.0 if alpha is None else alpha))
+    elif alpha is not None:
+        array[3] = alpha
+    array.flags.writeable = False
+    return array
+
+
+def parse_color(color:ColorCompat, alpha:float=None, readonly:bool=False) ->_ext.npt.NDArray:
     """Given a color as vector, float or hex, return a color vector
 
     Args:
         color (Union[float, str, _Vector, _List[float]]):
         alpha(float): alpha to use
+        readonly(bool): If True hex colors are returned as a shared read-only array from the cache,
+            instead of a copy. Intended for converters that store the result, eg: typed properties
 
     Raises:
-        ValueError: If color is a vec2
+        ValueError: If color is a vec2 or an invalid hex string
 
     Returns:
         Vector
     """
-    alpha_value:float = alpha if alpha is not None else 1.0
-    if isinstance(color, int):
-        return _ext.types.as_vector4f((color, color, color, alpha))
     if isinstance(color, str):
-        hex = color.strip("#")
-        if len(hex) == 6:
-            color = [int(hex[i:i+2], 16)/255.0  for i in (0, 2, 4)] + [alpha_value]
-        else:
-            color = [int(hex[i:i+2], 16)/255.0  for i in (0, 2, 4, 6)]
-            if alpha is not None:
-                color[3] = alpha_value
+        if readonly:
+            return _parse_hex(color, alpha)
+        return _parse_hex(color, alpha).copy()
+    alpha_value:float = alpha if alpha is not None else 1.0
+    if isinstance(color, _ext.numbers.Integral):
+        return _ext.types.as_vector4f((color, color, color, alpha_value))
     if len(color) == 2:
         raise ValueError("Invalid color, requires 3 or 4 channels, got 2")
     elif len(color) == 3:
         return _ext.types.as_vector4f((*color, 1.0))
     else:
         return _ext.types.as_vector4f(color)
+
+
+def parse_colors(colors:_ext.Union[_ext.List[ColorCompat], _ext.npt.ArrayLike], alpha:float=None) ->_ext.npt.NDArray:
+    """Parse a list of colors into an (N, 4) array, see parse_color
+
+    Hex strings are decoded together instead of one at a time.
+
+    Args:
+        colors (List[Union[int, str, _Vector, _List[float]]]|Array): colors to parse, may be mixed
+        alpha(float): alpha to use for hex and grayscale colors
+
+    Raises:
+        ValueError: If a color is a vec2 or an invalid hex string
+
+    Returns:
+        Array (N, 4)
+    """
+    alpha_value:float = alpha if alpha is not None else 1.0
+    if isinstance(colors, _ext.np.ndarray) and colors.ndim == 2:
+        if colors.shape[1] == 2:
+            raise ValueError("Invalid color, requires 3 or 4 channels, got 2")
+        result = _ext.types.as_vector4f_array(colors)
+        if colors.shape[1] == 3:
+            result[:, 3] = 1.0
+        return result
+    
+    result = _ext.np.empty((len(colors), 4), dtype=_ext.np.float32)
+    hex_rows = {6: ([], []), 8: ([], [])}
+    vector_rows = ([], [])
+    for i, color in enumerate(colors):
+        if isinstance(color, str):
+            hex = color.strip("#")
+            if len(hex) not in hex_rows:
+                raise ValueError(f"Invalid hex color, requires 6 or 8 digits, got {color!r}")
+            rows, values = hex_rows[len(hex)]
+            rows.append(i)
+            values.append(hex)
+        elif isinstance(color, _ext.numbers.Integral):
+            result[i] = (color, color, color, alpha_value)
+        else:
+            if len(color) == 2:
+                raise ValueError("Invalid color, requires 3 or 4 channels, got 2")
+            vector_rows[0].append(i)
+            vector_rows[1].append(color)
+    
+    for digits, (rows, values) in hex_rows.items():
+        if not rows:
+            continue
+        channels = _ext.np.frombuffer(bytes.fromhex("".join(values)), dtype=_ext.np.uint8)
+        channels = channels.reshape(-1, digits // 2) / 255.0
+        result[rows, :digits // 2] = channels
+        if digits == 6 or alpha is not None:
+            result[rows, 3] = alpha_value
+    
+    rows, values = vector_rows
+    if rows:
+        lengths = _ext.np.fromiter((len(value) for value in values), dtype=_ext.np.int64, count=len(values))
+        vectors = _ext.types.as_vector4f_array(values)
+        vectors[lengths == 3, 3] = 1.0
+        result[rows] = vectors
+    return result
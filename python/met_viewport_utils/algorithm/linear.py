@@ -1,66 +1,135 @@
 # copyright (c) 2024 Alex Telford, http://minimaleffort.tech
-""" linear algebra functions """
+""" linear algebra functions
 
+These accept floats or numpy arrays, arrays are broadcast against each other.
+Scalar inputs take a plain python path and return floats.
+"""
+class _ext:
+    """ External Dependencies """
+    from typing import Tuple, Union
+    import numpy as np
+    from numpy import typing as npt
 
-def lerp(a:float, b:float, t:float) -> float:
+Number = _ext.Union[float, _ext.npt.ArrayLike]
+
+
+def _is_array(*values)->bool:
+    """Check if any value needs the array path"""
+    for value in values:
+        if isinstance(value, (_ext.np.ndarray, list, tuple)):
+            return True
+    return False
+
+
+def lerp(a:Number, b:Number, t:Number) -> Number:
     """Standard lerp function
     interpolates between a and b by t
     where t is between 0 and 1
 
     Args:
-        a (float):
-        b (float):
-        t (float):
+        a (float|Array):
+        b (float|Array):
+        t (float|Array):
 
     Returns:
-        float
+        float|Array
     """
+    if _is_array(a, b, t):
+        a = _ext.np.asarray(a)
+        b = _ext.np.asarray(b)
+        t = _ext.np.asarray(t)
     return (1 - t) * a + t * b
 
 
-def inverse_lerp(a: float, b: float, v: float) -> float:
+def inverse_lerp(a:Number, b:Number, v:Number) -> Number:
     """Opposite of lerp, returns t value from value(v) between a and b
+    Where a == b the result is 0
 
     Args:
-        a (float):
-        b (float):
-        v (float):
+        a (float|Array):
+        b (float|Array):
+        v (float|Array):
 
     Returns:
-        float t
+        float|Array t
     """
+    if _is_array(a, b, v):
+        return remap(v, (a, b), (0.0, 1.0))
     if b == a:
         return 0.0
     return (v - a) / (b - a)
 
 
-def scale_number(a:float, a_min:float, a_max:float, b_min:float=0.0, b_max:float=1.0):
+def scale_number(a:Number, a_min:Number, a_max:Number, b_min:Number=0.0, b_max:Number=1.0) -> Number:
     """Scales (a) from within range(a_min->a_max) to relevant value between (b_min->b_max)
+    Where a_min == a_max the result is b_min
 
     Args:
-        a (float):
-        a_min (float):
-        a_max (float):
-        b_min (float, optional):. Defaults to 0.0.
-        b_max (float, optional):. Defaults to 1.0.
+        a (float|Array):
+        a_min (float|Array):
+        a_max (float|Array):
+        b_min (float|Array, optional):. Defaults to 0.0.
+        b_max (float|Array, optional):. Defaults to 1.0.
 
     Returns:
-        float
+        float|Array
     """
+    if _is_array(a, a_min, a_max, b_min, b_max):
+        return remap(a, (a_min, a_max), (b_min, b_max))
     if a_min == a_max:
         return b_min
     return b_min + ((a - a_min) / (a_max - a_min)) * (b_max - b_min)
 
 
-def clamp(value:float, min_value:float, max_value:float):
+def remap(values:_ext.npt.ArrayLike,
+          src_range:_ext.Tuple[Number, Number],
+          dst_range:_ext.Tuple[Number, Number]=(0.0, 1.0),
+          out:_ext.npt.NDArray=None) -> _ext.npt.NDArray:
+    """Remap an array from one range to another in a single pass, see scale_number
+    Ranges may be arrays, eg: per column (min, max) for an (N, 2) array of points.
+    Where the source range is empty the result is the destination minimum.
+
+    Args:
+        values (Array): values to remap
+        src_range (Tuple[float|Array, float|Array]): source (min, max)
+        dst_range (Tuple[float|Array, float|Array], optional): destination (min, max). Defaults to (0.0, 1.0).
+        out (Array, optional): array to write the result to
+
+    Returns:
+        Array
+    """
+    values = _ext.np.asarray(values)
+    src_min = _ext.np.asarray(src_range[0], dtype=_ext.np.float64)
+    src_span = _ext.np.asarray(src_range[1], dtype=_ext.np.float64) - src_min
+    dst_min = _ext.np.asarray(dst_range[0], dtype=_ext.np.float64)
+    dst_span = _ext.np.asarray(dst_range[1], dtype=_ext.np.float64) - dst_min
+    
+    degenerate = src_span == 0
+    scale = dst_span / _ext.np.where(degenerate, 1.0, src_span)
+    scale = _ext.np.where(degenerate, 0.0, scale)
+    
+    if out is None:
+        dtype = values.dtype if values.dtype.kind == "f" else _ext.np.float64
+        shape = _ext.np.broadcast_shapes(values.shape, src_min.shape, scale.shape, dst_min.shape)
+        out = _ext.np.empty(shape, dtype=dtype)
+    _ext.np.subtract(values, src_min, out=out)
+    out *= scale
+    out += dst_min
+    return out
+
+
+def clamp(value:Number, min_value:Number, max_value:Number, out:_ext.npt.NDArray=None) -> Number:
     """Clamps a value between two other values
 
     Args:
-        value (float):
-        min_value (float):
-        max_value (float):
+        value (float|Array):
+        min_value (float|Array):
+        max_value (float|Array):
+        out (Array, optional): array to write the result to, only used for arrays
 
     Returns:
-        float:
+        float|Array:
     """
+    if out is not None or _is_array(value, min_value, max_value):
+        return _ext.np.minimum(_ext.np.maximum(value, min_value), max_value, out=out)
     return min(max_value, max(min_value, value))
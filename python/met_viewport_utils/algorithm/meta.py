@@ -1,20 +1,283 @@
 # copyright (c) 2024 Alex Telford, http://minimaleffort.tech
 class _ext:
     """ External Dependencies """
-    import uuid
     import copy
+    import enum
+    import importlib
+    import operator
+    import pathlib
     import re
+    import typing
+    import numpy as np
+    from met_viewport_utils.constants import PropertyOwnership
     
 _ALIAS_ATTR_PATH_REGEX = _ext.re.compile(r"((?:[_a-zA-Z][_a-zA-Z0-9]*(?:\(\)|\.|$))+)")
 _ALIAS_ATTR_SETTER_REGEX = _ext.re.compile(r"^([_a-zA-Z][_a-zA-Z0-9]*)(\([a-zA-Z]+\))?$")
 
+# Values of these types are never copied on get or set
+_IMMUTABLE_TYPES = (
+    type(None), bool, int, float, complex, str, bytes, tuple, frozenset,
+    _ext.enum.Enum, _ext.pathlib.PurePath)
+
+# Cached set actions per value type
+_SET_CONVERT = 0
+_SET_COPY = 1
+_SET_STORE = 2
+_SET_VALIDATE = 3  # Subscripted type, eg: Vector3f, the converter checks the value
+
+
+def _runtime_type(typ):
+    """Class to check values against, subscripted types are resolved to their origin
+    eg: Vector3f -> numpy.ndarray, None if there is no class, eg: Union
+    """
+    while not isinstance(typ, type):
+        typ = getattr(typ, "__origin__", None)
+        if typ is None:
+            return None
+    return typ
+
+
+def _is_immutable(value):
+    """Check if a value can be shared instead of copied
+    Read-only arrays are not, they are only shared with PropertyOwnership.Share
+    """
+    return isinstance(value, _IMMUTABLE_TYPES)
+
+
+def _readonly_view(value):
+    """Return a read-only view of an array, other values are returned as is"""
+    if isinstance(value, _ext.np.ndarray):
+        value = value.view()
+        value.flags.writeable = False
+    return value
+
+
+class TypedProperty(object):
+    """Data descriptor that preserves type on property set
+
+    Values are stored on the instance under a deterministic attribute name,
+    "_typed_<name>" unless property_id is given. Classes using __slots__ must
+    declare that storage name in their slots, and "<storage>_view" to cache
+    read-only views.
+
+    Ownership controls how assigned values are stored:
+        Copy: a private copy is stored, this is the default.
+        Share: values of the property type are stored without copying,
+            the caller must not modify them afterwards.
+        InPlace: arrays are written into the existing buffer, references
+            returned by earlier gets will see the new value.
+
+    Args:
+        typ (type): Property type
+        default (Any): Default value to set
+        converter (Callable, optional): Function used to set value, defaults to typ, set to False to disable
+        notify(Callable, optional): Function to call when this value changes
+        property_id(str, optional): Optionally specify the data key, defaults to "_typed_<name>"
+            This should not be the same name as the property or it will create a loop
+        readonly(bool, optional): If True will not allow setting the value
+        ownership(PropertyOwnership, optional): How assigned values are stored
+        readonly_view(bool, optional): If True arrays are returned as read-only views
+    """
+    def __init__(
+        self,
+        typ,
+        default,
+        converter=None,
+        notify=None,
+        property_id=None,
+        readonly=False,
+        ownership=_ext.PropertyOwnership.Copy,
+        readonly_view=False
+    ):
+        self.typ = typ
+        self.default = default
+        self.converter = typ if converter is None else converter
+        self.notify = notify
+        self.readonly = readonly
+        self.ownership = ownership
+        self.readonly_view = readonly_view
+        self.name = None
+        # Fallback key if this is not assigned in a class body
+        self.key = property_id or f"_typed_{id(self):x}"
+        self.view_key = f"{self.key}_view"
+        self._auto_key = property_id is None
+        # Result of the instance check is cached per value type
+        self._set_actions = {}
+        self._runtime_typ = _runtime_type(typ)
+
+    def __set_name__(self, owner, name):
+        self.name = name
+        if self._auto_key:
+            self.key = f"_typed_{name}"
+            self.view_key = f"{self.key}_view"
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        try:
+            value = getattr(instance, self.key)
+        except AttributeError:
+            value = self._init_default(instance)
+        if self.readonly_view:
+            return self._view(instance, value)
+        return value
+
+    def _view(self, instance, value):
+        """Read-only view of value, cached until a new value is stored"""
+        if not isinstance(value, _ext.np.ndarray):
+            return value
+        try:
+            cached, view = getattr(instance, self.view_key)
+            if cached is value:
+                return view
+        except AttributeError:
+            pass
+        view = _readonly_view(value)
+        try:
+            setattr(instance, self.view_key, (value, view))
+        except AttributeError:
+            # __slots__ without the view slot
+            pass
+        return view
+
+    def __set__(self, instance, value):
+        if self.readonly:
+            raise AttributeError(f"property {self.name!r} of {type(instance).__name__!r} object has no setter")
+        if self.ownership is _ext.PropertyOwnership.InPlace:
+            self._set_in_place(instance, value)
+        else:
+            setattr(instance, self.key, self.convert(value))
+        if self.notify is not None:
+            self.notify(instance)
+
+    def fget(self, instance):
+        """Get the value for an instance, matches property.fget"""
+        if self.readonly_view:
+            return self.__get__(instance, type(instance))
+        try:
+            return getattr(instance, self.key)
+        except AttributeError:
+            return self._init_default(instance)
+
+    def set_silent(self, instance, value):
+        """Set the value without calling notify, this also bypasses readonly.
+
+        Intended for the owning class when bulk updating values.
+
+        Args:
+            instance (object): Instance to set the value on
+            value (Any): value to set
+        """
+        if self.ownership is _ext.PropertyOwnership.InPlace:
+            self._set_in_place(instance, value)
+        else:
+            setattr(instance, self.key, self.convert(value))
+
+    def set_many_silent(self, instances, values):
+        """Set a value on each instance without calling notify, see set_silent.
+        Intended for bulk updates, eg: writing the rows of an (N, k) array back to N items,
+        InPlace arrays of the same shape are written directly.
+
+        Args:
+            instances (Iterable[object]): Instances to set the values on
+            values (Iterable[Any]): value for each instance
+        """
+        if self.ownership is not _ext.PropertyOwnership.InPlace:
+            for instance, value in zip(instances, values):
+                setattr(instance, self.key, self.convert(value))
+            return
+        key = self.key
+        ndarray = _ext.np.ndarray
+        for instance, value in zip(instances, values):
+            current = getattr(instance, key, None)
+            if (type(current) is ndarray and current.flags.writeable
+                    and type(value) is ndarray and value.shape == current.shape):
+                current[...] = value
+            else:
+                self._set_in_place(instance, value)
+
+    def convert(self, value):
+        """Convert a value to be stored by this property
+
+        Args:
+            value (Any): value to convert
+
+        Raises:
+            TypeError: If value is the wrong type and converter is disabled
+
+        Returns:
+            Any: converted value or a copy of value
+        """
+        value_type = type(value)
+        action = self._set_actions.get(value_type)
+        if action is None:
+            action = self._set_actions[value_type] = self._set_action(value_type)
+        if action == _SET_STORE:
+            return value
+        if action == _SET_COPY:
+            if self.ownership is _ext.PropertyOwnership.Share:
+                return value
+            return _ext.copy.copy(value)
+        if self.converter:
+            converted = self.converter(value)
+        elif action == _SET_VALIDATE:
+            converted = value
+        else:
+            raise TypeError(f"Property expected a {self.typ}, got {value_type}")
+        if converted is value and self.ownership is not _ext.PropertyOwnership.Share \
+                and not _is_immutable(value):
+            # Converter passed the value through, never keep the caller's object
+            converted = _ext.copy.copy(converted)
+        return converted
+
+    def _set_action(self, value_type):
+        typ = self._runtime_typ
+        if typ is None or not issubclass(value_type, typ):
+            return _SET_CONVERT
+        if typ is not self.typ:
+            # Only the origin is known to match, eg: the dtype and shape of an array are not
+            return _SET_VALIDATE
+        if issubclass(value_type, _IMMUTABLE_TYPES):
+            return _SET_STORE
+        return _SET_COPY
+
+    def _set_in_place(self, instance, value):
+        current = getattr(instance, self.key, None)
+        if value is current:
+            return
+        if isinstance(current, _ext.np.ndarray) and current.flags.writeable:
+            if not (isinstance(value, _ext.np.ndarray) and value.shape == current.shape):
+                value = self.convert(value)
+            if isinstance(value, _ext.np.ndarray) and value.shape == current.shape:
+                _ext.np.copyto(current, value, casting="unsafe")
+                return
+            setattr(instance, self.key, value)
+            return
+        value = self.convert(value)
+        if isinstance(value, _ext.np.ndarray) and not value.flags.writeable:
+            # Shared read-only arrays cannot be written in place later
+            value = value.copy()
+        setattr(instance, self.key, value)
+
+    def _init_default(self, instance):
+        value = self.default
+        if self.converter and self._set_action(type(value)) in (_SET_CONVERT, _SET_VALIDATE) and value is not None:
+            value = self.converter(value)
+        if value is self.default and not _is_immutable(value):
+            value = _ext.copy.copy(value)
+        setattr(instance, self.key, value)
+        return value
+
+
 def typed_property(
     typ,
     default,
     converter=None,
     notify=None,
     property_id=None,
-    readonly=False
+    readonly=False,
+    ownership=_ext.PropertyOwnership.Copy,
+    readonly_view=False
 ):
     """Wrapper to create a typed property that preserves type on property set
 
@@ -23,45 +286,70 @@ def typed_property(
         default (Any): Default value to set
         converter (Callable, optional): Function used to set value, defaults to typ, set to False to disable
         notify(Callable, optional): Function to call when this value changes
-        property_id(str, optional): Optionally specify the data key, defaults to a uuid
+        property_id(str, optional): Optionally specify the data key, defaults to "_typed_<name>"
             This should not be the same name as the property or it will create a loop
         readonly(bool, optional): If True will not create a setter
+        ownership(PropertyOwnership, optional): How assigned values are stored, see TypedProperty
+        readonly_view(bool, optional): If True arrays are returned as read-only views
     
     Returns:
-        property
+        TypedProperty
     """
-    property_key = property_id or f"__{str(_ext.uuid.uuid4()).replace('-', '')}"
-    if converter is None:
-        converter = typ
-
-    @property
-    def _typed_property(self):
-        if not hasattr(self, property_key):
-            value = _ext.copy.copy(default) if default is not None else default
-            setattr(self, property_key, value)
-            return value
-        return getattr(self, property_key)
-    
-    if not readonly:
-        @_typed_property.setter
-        def _typed_property(self, value):
-            try:
-                instance_check = isinstance(value, typ)
-            except TypeError:
-                # subscripted type, assume always convert
-                instance_check = False
-            if not instance_check:
-                if not converter:
-                    raise TypeError(f"Property expected a {typ}, got {type(value)}")
-                value = converter(value)
-            else:
-                value = _ext.copy.copy(value)
-            
-            setattr(self, property_key, value)
-            if notify:
-                notify(self)
+    return TypedProperty(
+        typ,
+        default,
+        converter=converter,
+        notify=notify,
+        property_id=property_id,
+        readonly=readonly,
+        ownership=ownership,
+        readonly_view=readonly_view)
+
+def _compile_path(path):
+    """Compile an alias path into a list of single argument steps
+
+    Consecutive attributes are merged into one attrgetter and callables
+    become a methodcaller, eg: "a.b.c().d" -> [attrgetter("a.b"), methodcaller("c"), attrgetter("d")]
+
+    Args:
+        path(str): path to compile
+
+    Returns:
+        List[Callable]
+    """
+    steps = []
+    attrs = []
+    for each in path.split("."):
+        if not each:
+            continue
+        name = each.split("(")[0]
+        if "()" in each:
+            if attrs:
+                steps.append(_ext.operator.attrgetter(".".join(attrs)))
+                attrs = []
+            steps.append(_ext.operator.methodcaller(name))
+        else:
+            attrs.append(name)
+    if attrs:
+        steps.append(_ext.operator.attrgetter(".".join(attrs)))
+    return steps
+
+
+def _chain(accessor, steps):
+    """Combine an accessor and compiled steps into a single callable"""
+    if not steps:
+        return accessor
+    if len(steps) == 1:
+        step = steps[0]
+        return lambda self: step(accessor(self))
     
-    return _typed_property
+    def _resolve(self):
+        value = accessor(self)
+        for step in steps:
+            value = step(value)
+        return value
+    return _resolve
+
 
 def alias_property(
     prop,
@@ -70,7 +358,10 @@ def alias_property(
     readonly=False,
     index=None
 ):
-    """Aliases an existing property, this is to reduce boilerplate code and is not performant.
+    """Aliases an existing property, this is to reduce boilerplate code.
+
+    Paths are compiled once when the alias is created, an index only alias
+    eg: alias_property(position, index=0) resolves to prop.fget(self)[0].
 
     Args:
         prop(property): property to reference
@@ -97,7 +388,7 @@ def alias_property(
     if not readonly and set_path:
         if "." in set_path:
             set_path, setter = set_path.rsplit(".", 1)
-            if not _ALIAS_ATTR_PATH_REGEX.match():
+            if not _ALIAS_ATTR_PATH_REGEX.match(set_path):
                 raise ValueError("set_path is invalid, must be only attrs or callables without params, last part takes one param if callable, eg: attr.subattr().set_x(v)")
         else:
             setter = set_path
@@ -108,48 +399,78 @@ def alias_property(
         else:
             raise ValueError("set_path is invalid, last part takes one param if callable or must be attr")
     if prop == "self":
-        accessor = lambda self: self
-    elif isinstance(prop, property):
-        accessor = lambda self: prop.fget(self)
+        accessor = None
+    elif isinstance(prop, (property, TypedProperty)):
+        accessor = prop.fget
     else:
         raise ValueError("prop must be 'self' or property accessor")
     
-    @property
-    def _alias_property(self):
-        value = accessor(self)
-
-        for each in path.split("."):
-            if not each:
-                continue
-            value = getattr(value, each.split("(")[0])
-            if "()" in each:
-                value = value()
-        if index is not None:
-            return value[index]
-        return value
+    get_steps = _compile_path(path)
+    if index is not None:
+        get_steps.append(_ext.operator.itemgetter(index))
+    if accessor is None:
+        # First step is applied directly to self
+        getter = _chain(get_steps[0], get_steps[1:])
+    else:
+        getter = _chain(accessor, get_steps)
     
-    if not readonly:
-        @_alias_property.setter
-        def _alias_property(self, value):
-            obj = accessor(self)
-            for each in set_path.split("."):
-                if not each:
-                    continue
-                obj = getattr(obj, each.split("(")[0])
-                if "()" in each:
-                    obj = obj()
-            if setter_arg:
-                obj = getattr(obj, setter_prop)
-                if index is not None:
-                    obj = obj[index]
-                obj(value)
-            elif setter_prop:
-                if index:
-                    obj = getattr(obj, setter_prop)
-                    obj[index] = value
-                else:
-                    setattr(obj, setter_prop, value)
-            elif index is not None:
-                obj[index] = value
+    if readonly:
+        return property(getter)
+    
+    set_steps = _compile_path(set_path)
+    if accessor is None:
+        obj_getter = _chain(set_steps[0], set_steps[1:]) if set_steps else (lambda self: self)
+    else:
+        obj_getter = _chain(accessor, set_steps)
+    
+    if setter_arg:
+        set_method = _ext.operator.attrgetter(setter_prop)
+        if index is not None:
+            def setter(self, value):
+                set_method(obj_getter(self))[index](value)
+        else:
+            def setter(self, value):
+                set_method(obj_getter(self))(value)
+    elif setter_prop:
+        if index is not None:
+            get_attr = _ext.operator.attrgetter(setter_prop)
+            def setter(self, value):
+                get_attr(obj_getter(self))[index] = value
+        else:
+            def setter(self, value):
+                setattr(obj_getter(self), setter_prop, value)
+    elif index is not None:
+        def setter(self, value):
+            obj_getter(self)[index] = value
+    else:
+        setter = None
     
-    return _alias_property
+    return property(getter, setter)
+
+
+class LazyImport(object):
+    """ Class attribute that imports a module on first access
+
+    The module replaces this descriptor on the owner once imported,
+    so later lookups are a plain attribute access.
+    This is intended for the _ext namespace of heavy optional dependencies, eg:
+        class _ext:
+            font_manager = LazyImport("matplotlib.font_manager")
+
+    Args:
+        module_name(str): module to import
+    """
+    def __init__(self, module_name):
+        self.module_name = module_name
+        self.name = None
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, instance, owner=None):
+        module = _ext.importlib.import_module(self.module_name)
+        if owner is None:
+            owner = type(instance)
+        if self.name:
+            setattr(owner, self.name, module)
+        return module
@@ -0,0 +1,437 @@
+# copyright (c) 2024 Alex Telford, http://minimaleffort.tech
+"""2D spatial indices for fast point and rect queries
+
+Keys are stored with their bounds as (left, bottom, right, top), bounds are inclusive
+like Rect.contains. Keys can be any hashable value, eg: items.
+
+Example:
+    index = GridIndex(cell_size=64)
+    index.insert(item, item.screen_rect(viewport))
+    index.update(item, item.screen_rect(viewport))  # after the item moved
+    hits = index.query_point(mouse_position)
+"""
+from __future__ import annotations
+class _ext:
+    """ External Dependencies """
+    import abc
+    import math
+    from typing import Hashable, List, Tuple, Union
+    from met_viewport_utils.shape.rect import Rect
+    from met_viewport_utils.algorithm import types
+
+
+# left, bottom, right, top
+Bounds = _ext.Tuple[float, float, float, float]
+BoundsCompat = _ext.Union[_ext.Rect, Bounds]
+
+
+def as_bounds(value:BoundsCompat)->Bounds:
+    """ Convert a Rect or sequence to a (left, bottom, right, top) tuple of floats """
+    if isinstance(value, _ext.Rect):
+        x, y = value.position.tolist()
+        width, height = value.size.tolist()
+        return (x, y, x + width, y + height)
+    left, bottom, right, top = value
+    return (float(left), float(bottom), float(right), float(top))
+
+
+def _as_finite_bounds(value:BoundsCompat)->Bounds:
+    bounds = as_bounds(value)
+    if not all(_ext.math.isfinite(each) for each in bounds):
+        raise ValueError(f"Stored bounds must be finite, got {bounds}")
+    return bounds
+
+
+class SpatialIndex(_ext.abc.ABC):
+    """ Interface for 2D spatial indices, see GridIndex and QuadTreeIndex
+
+    Query results are unordered.
+    """
+    def __init__(self):
+        self._bounds = {}  # key: Bounds
+
+    def __len__(self)->int:
+        return len(self._bounds)
+
+    def __contains__(self, key:_ext.Hashable)->bool:
+        return key in self._bounds
+
+    def __iter__(self):
+        return iter(list(self._bounds))
+
+    def bounds(self, key:_ext.Hashable)->Bounds:
+        """Stored bounds of a key
+
+        Raises:
+            KeyError: if the key is not in the index
+        """
+        return self._bounds[key]
+
+    def insert(self, key:_ext.Hashable, bounds:BoundsCompat):
+        """Add a key, use update to move an existing key
+
+        Raises:
+            KeyError: if the key is already in the index
+        """
+        if key in self._bounds:
+            raise KeyError(f"{key!r} is already in the index")
+        bounds = _as_finite_bounds(bounds)
+        self._bounds[key] = bounds
+        self._insert(key, bounds)
+
+    def update(self, key:_ext.Hashable, bounds:BoundsCompat):
+        """Move a key, adding it if it is not in the index"""
+        bounds = _as_finite_bounds(bounds)
+        current = self._bounds.get(key)
+        if current is None:
+            self._bounds[key] = bounds
+            self._insert(key, bounds)
+        elif current != bounds:
+            self._bounds[key] = bounds
+            self._move(key, current, bounds)
+
+    def remove(self, key:_ext.Hashable):
+        """Remove a key
+
+        Raises:
+            KeyError: if the key is not in the index
+        """
+        bounds = self._bounds.pop(key)
+        self._remove(key, bounds)
+
+    def discard(self, key:_ext.Hashable):
+        """Remove a key if it is in the index"""
+        bounds = self._bounds.pop(key, None)
+        if bounds is not None:
+            self._remove(key, bounds)
+
+    def query_point(self, point:_ext.types.Vector2fCompat)->_ext.List[_ext.Hashable]:
+        """Keys whose bounds contain a point
+
+        Args:
+            point(Vector2f)
+
+        Returns:
+            List[Hashable]
+        """
+        x = float(point[0])
+        y = float(point[1])
+        bounds = self._bounds
+        result = []
+        for key in self._point_candidates(x, y):
+            left, bottom, right, top = bounds[key]
+            if left <= x <= right and bottom <= y <= top:
+                result.append(key)
+        return result
+
+    def query_rect(self, bounds:BoundsCompat)->_ext.List[_ext.Hashable]:
+        """Keys whose bounds intersect a rect, touching edges count as intersecting
+
+        Args:
+            bounds(Rect|Bounds)
+
+        Returns:
+            List[Hashable]
+        """
+        query_left, query_bottom, query_right, query_top = query = as_bounds(bounds)
+        stored = self._bounds
+        result = []
+        for key in self._rect_candidates(query):
+            left, bottom, right, top = stored[key]
+            if left <= query_right and query_left <= right and bottom <= query_top and query_bottom <= top:
+                result.append(key)
+        return result
+
+    def clear(self):
+        """Remove all keys"""
+        self._bounds.clear()
+        self._clear()
+
+    def _move(self, key:_ext.Hashable, old:Bounds, new:Bounds):
+        """Move a stored key, reimplement if it can be done faster than remove and insert"""
+        self._remove(key, old)
+        self._insert(key, new)
+
+    @_ext.abc.abstractmethod
+    def _insert(self, key:_ext.Hashable, bounds:Bounds):
+        pass
+
+    @_ext.abc.abstractmethod
+    def _remove(self, key:_ext.Hashable, bounds:Bounds):
+        pass
+
+    @_ext.abc.abstractmethod
+    def _point_candidates(self, x:float, y:float):
+        """Iterable of unique keys that may contain the point"""
+        pass
+
+    @_ext.abc.abstractmethod
+    def _rect_candidates(self, bounds:Bounds):
+        """Iterable of unique keys that may intersect the bounds"""
+        pass
+
+    @_ext.abc.abstractmethod
+    def _clear(self):
+        pass
+
+
+class GridIndex(SpatialIndex):
+    """ Uniform grid, best when keys are of a similar size, eg: handles
+
+    Keys covering more than max_cells cells are kept in a separate list that is always tested.
+
+    Args:
+        cell_size(float): width and height of a cell, ideally a little larger than most keys
+        max_cells(int): maximum cells a key is stored in
+    """
+    def __init__(self, cell_size:float=64.0, max_cells:int=64):
+        super().__init__()
+        if cell_size <= 0:
+            raise ValueError(f"cell_size must be positive, got {cell_size}")
+        self.cell_size = float(cell_size)
+        self.max_cells = max_cells
+        self._cells = {}  # (column, row): {key: None}
+        self._large = {}  # key: None
+
+    def _cell_range(self, bounds:Bounds):
+        floor = _ext.math.floor
+        size = self.cell_size
+        return (floor(bounds[0] / size), floor(bounds[1] / size),
+                floor(bounds[2] / size), floor(bounds[3] / size))
+
+    def _insert(self, key, bounds):
+        min_column, min_row, max_column, max_row = self._cell_range(bounds)
+        if (max_column - min_column + 1) * (max_row - min_row + 1) > self.max_cells:
+            self._large[key] = None
+            return
+        cells = self._cells
+        for column in range(min_column, max_column + 1):
+            for row in range(min_row, max_row + 1):
+                cell = cells.get((column, row))
+                if cell is None:
+                    cells[(column, row)] = {key: None}
+                else:
+                    cell[key] = None
+
+    def _remove(self, key, bounds):
+        if key in self._large:
+            del self._large[key]
+            return
+        min_column, min_row, max_column, max_row = self._cell_range(bounds)
+        cells = self._cells
+        for column in range(min_column, max_column + 1):
+            for row in range(min_row, max_row + 1):
+                cell = cells[(column, row)]
+                del cell[key]
+                if not cell:
+                    del cells[(column, row)]
+
+    def _move(self, key, old, new):
+        if key not in self._large and self._cell_range(old) == self._cell_range(new):
+            return  # Same cells, only the stored bounds changed
+        super()._move(key, old, new)
+
+    def _point_candidates(self, x, y):
+        size = self.cell_size
+        cell = self._cells.get((_ext.math.floor(x / size), _ext.math.floor(y / size)))
+        if cell is None:
+            return self._large
+        if not self._large:
+            return cell
+        return list(cell) + list(self._large)
+
+    def _rect_candidates(self, bounds):
+        min_column, min_row, max_column, max_row = self._cell_range(bounds)
+        candidates = dict(self._large)
+        cells = self._cells
+        if (max_column - min_column + 1) * (max_row - min_row + 1) > len(cells):
+            # Large query, check the occupied cells instead
+            for (column, row), cell in cells.items():
+                if min_column <= column <= max_column and min_row <= row <= max_row:
+                    candidates.update(cell)
+            return candidates
+        for column in range(min_column, max_column + 1):
+            for row in range(min_row, max_row + 1):
+                cell = cells.get((column, row))
+                if cell is not None:
+                    candidates.update(cell)
+        return candidates
+
+    def _clear(self):
+        self._cells.clear()
+        self._large.clear()
+
+
+class _QuadNode(object):
+    """ Quadtree node, keys are stored in the smallest node that fully contains them """
+    __slots__ = ("bounds", "keys", "children", "depth")
+
+    def __init__(self, bounds:Bounds, depth:int):
+        self.bounds = bounds
+        self.keys = {}  # key: None
+        self.children = None
+        self.depth = depth
+
+    def contains(self, bounds:Bounds)->bool:
+        left, bottom, right, top = self.bounds
+        return left <= bounds[0] and bottom <= bounds[1] and bounds[2] <= right and bounds[3] <= top
+
+    def child_for(self, bounds:Bounds)->_QuadNode:
+        """Child that fully contains the bounds, None if it spans several"""
+        left, bottom, right, top = self.bounds
+        center_x = (left + right) * 0.5
+        center_y = (bottom + top) * 0.5
+        if bounds[2] < center_x:
+            column = 0
+        elif bounds[0] >= center_x:
+            column = 1
+        else:
+            return None
+        if bounds[3] < center_y:
+            row = 0
+        elif bounds[1] >= center_y:
+            row = 1
+        else:
+            return None
+        return self.children[row * 2 + column]
+
+    def split(self):
+        left, bottom, right, top = self.bounds
+        center_x = (left + right) * 0.5
+        center_y = (bottom + top) * 0.5
+        depth = self.depth + 1
+        self.children = [
+            _QuadNode((left, bottom, center_x, center_y), depth),
+            _QuadNode((center_x, bottom, right, center_y), depth),
+            _QuadNode((left, center_y, center_x, top), depth),
+            _QuadNode((center_x, center_y, right, top), depth),
+        ]
+
+
+class QuadTreeIndex(SpatialIndex):
+    """ Quadtree, best when keys vary in size or are clustered
+
+    Nodes split once they hold more than max_keys, the root grows to fit keys outside of it.
+
+    Args:
+        bounds(Rect|Bounds): initial area, defaults to the first key
+        max_keys(int): keys per node before it is split
+        max_depth(int): depth below the root that nodes stop splitting
+    """
+    def __init__(self, bounds:BoundsCompat=None, max_keys:int=8, max_depth:int=12):
+        super().__init__()
+        self.max_keys = max_keys
+        self.max_depth = max_depth
+        self._initial_bounds = None if bounds is None else as_bounds(bounds)
+        if self._initial_bounds is not None:
+            left, bottom, right, top = self._initial_bounds
+            if not (right > left and top > bottom):
+                raise ValueError(f"bounds must have a positive size, got {self._initial_bounds}")
+        self._root:_QuadNode = None
+        self._nodes = {}  # key: _QuadNode
+
+    def _grow(self, bounds:Bounds):
+        """Create or grow the root until it contains the bounds"""
+        if self._root is None:
+            if self._initial_bounds is not None:
+                root_bounds = self._initial_bounds
+            else:
+                left, bottom, right, top = bounds
+                size = max(right - left, top - bottom, 1.0)
+                root_bounds = (left, bottom, left + size, bottom + size)
+            self._root = _QuadNode(root_bounds, 0)
+
+        root = self._root
+        while not root.contains(bounds):
+            # Double the root towards the bounds, the old root becomes a quadrant
+            left, bottom, right, top = root.bounds
+            width = right - left
+            height = top - bottom
+            grow_left = bounds[0] < left
+            grow_down = bounds[1] < bottom
+            new_left = left - width if grow_left else left
+            new_bottom = bottom - height if grow_down else bottom
+            parent = _QuadNode((new_left, new_bottom, new_left + width * 2, new_bottom + height * 2), 0)
+            parent.split()
+            parent.children[(2 if grow_down else 0) + (1 if grow_left else 0)] = root
+            # Depths are relative to the root
+            for node in self._iter_nodes([root]):
+                node.depth += 1
+            root = parent
+        self._root = root
+
+    @staticmethod
+    def _iter_nodes(nodes):
+        stack = list(nodes)
+        while stack:
+            node = stack.pop()
+            yield node
+            if node.children:
+                stack.extend(node.children)
+
+    def _insert(self, key, bounds):
+        self._grow(bounds)
+        node = self._root
+        while node.children is not None:
+            child = node.child_for(bounds)
+            if child is None:
+                break
+            node = child
+        node.keys[key] = None
+        self._nodes[key] = node
+        if node.children is None and len(node.keys) > self.max_keys and node.depth < self.max_depth:
+            self._split(node)
+
+    def _split(self, node:_QuadNode):
+        node.split()
+        stored = self._bounds
+        nodes = self._nodes
+        for key in list(node.keys):
+            child = node.child_for(stored[key])
+            if child is not None:
+                del node.keys[key]
+                child.keys[key] = None
+                nodes[key] = child
+
+    def _remove(self, key, bounds):
+        del self._nodes.pop(key).keys[key]
+
+    def _move(self, key, old, new):
+        node = self._nodes[key]
+        if node.contains(new) and (node.children is None or node.child_for(new) is None):
+            return  # Still belongs in the same node
+        super()._move(key, old, new)
+
+    def _point_candidates(self, x, y):
+        node = self._root
+        result = []
+        while node is not None:
+            result.extend(node.keys)
+            if node.children is None:
+                break
+            # Points on a center line are in the upper or right quadrant, see child_for
+            left, bottom, right, top = node.bounds
+            column = 1 if x >= (left + right) * 0.5 else 0
+            row = 1 if y >= (bottom + top) * 0.5 else 0
+            node = node.children[row * 2 + column]
+        return result
+
+    def _rect_candidates(self, bounds):
+        if self._root is None:
+            return []
+        query_left, query_bottom, query_right, query_top = bounds
+        result = []
+        stack = [self._root]
+        while stack:
+            node = stack.pop()
+            left, bottom, right, top = node.bounds
+            if left > query_right or query_left > right or bottom > query_top or query_bottom > top:
+                continue
+            result.extend(node.keys)
+            if node.children is not None:
+                stack.extend(node.children)
+        return result
+
+    def _clear(self):
+        self._root = None
+        self._nodes.clear()
@@ -1,3 +1,219 @@
 # copyright (c) 2024 Alex Telford, http://minimaleffort.tech
 """Utilities related to transform operations
-"""
\ No newline at end of file
+
+Transforms are immutable, composing or inverting returns a new transform.
+Matrices are float32 and use column vectors, eg: (a @ b).apply(p) == a.apply(b.apply(p))
+"""
+from __future__ import annotations
+class _ext:
+    """ External Dependencies """
+    from typing import Union
+    import math
+    import numpy as np
+    from numpy import typing as npt
+    from met_viewport_utils.algorithm import types
+
+
+class _AffineTransform(object):
+    """ Affine transform backed by a read-only float32 matrix
+
+    Args:
+        matrix(Array): optional (size+1, size+1) matrix, defaults to identity
+    """
+    size:int = 0
+
+    def __init__(self, matrix:_ext.npt.ArrayLike=None):
+        dimension = self.size + 1
+        if matrix is None:
+            matrix = _ext.np.identity(dimension, dtype=_ext.np.float32)
+        else:
+            matrix = _ext.np.array(matrix, dtype=_ext.np.float32)
+            if matrix.shape != (dimension, dimension):
+                raise ValueError(f"{self.__class__.__name__} requires a {dimension}x{dimension} matrix, got {matrix.shape}")
+        matrix.flags.writeable = False
+        self._matrix = matrix
+        # Cached parts used by apply
+        self._linear_t = matrix[:self.size, :self.size].T
+        self._translation = matrix[:self.size, self.size]
+        self._inverse = None
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self._matrix.tolist()}) at {hex(id(self))}"
+
+    def __matmul__(self, other:_AffineTransform) ->_AffineTransform:
+        if not isinstance(other, self.__class__):
+            return NotImplemented
+        return self.__class__(self._matrix @ other._matrix)
+
+    @property
+    def matrix(self) ->_ext.npt.NDArray:
+        """Read-only matrix"""
+        return self._matrix
+
+    @property
+    def translation(self) ->_ext.npt.NDArray:
+        """Read-only translation component"""
+        return self._translation
+
+    def compose(self, other:_AffineTransform) ->_AffineTransform:
+        """Combine with another transform, other is applied first, same as self @ other
+
+        Args:
+            other(Transform)
+
+        Returns:
+            Transform
+        """
+        return self @ other
+
+    def inverse(self) ->_AffineTransform:
+        """Inverse of this transform, this is cached
+
+        Raises:
+            numpy.linalg.LinAlgError: If the transform is not invertible
+
+        Returns:
+            Transform
+        """
+        if self._inverse is None:
+            inverse = self.__class__(_ext.np.linalg.inv(self._matrix.astype(_ext.np.float64)))
+            inverse._inverse = self
+            self._inverse = inverse
+        return self._inverse
+
+    def is_approx(self, other:_AffineTransform, tol:float=1e-6) ->bool:
+        """Compare matrices within a tolerance"""
+        return bool(_ext.np.allclose(self._matrix, other._matrix, atol=tol))
+
+    def apply(self, points:_ext.npt.ArrayLike, out:_ext.npt.NDArray=None) ->_ext.npt.NDArray:
+        """Transform points in a single matrix multiply
+
+        Args:
+            points(Array): (N, size) points or a single point
+            out(Array, optional): array to write the result to
+
+        Returns:
+            Array matching the shape of points
+        """
+        points = _ext.np.asarray(points, dtype=_ext.np.float32)
+        result = _ext.np.matmul(points, self._linear_t, out=out)
+        result += self._translation
+        return result
+
+    def apply_vectors(self, vectors:_ext.npt.ArrayLike, out:_ext.npt.NDArray=None) ->_ext.npt.NDArray:
+        """Transform directions, this ignores translation
+
+        Args:
+            vectors(Array): (N, size) vectors or a single vector
+            out(Array, optional): array to write the result to
+
+        Returns:
+            Array matching the shape of vectors
+        """
+        vectors = _ext.np.asarray(vectors, dtype=_ext.np.float32)
+        return _ext.np.matmul(vectors, self._linear_t, out=out)
+
+    @classmethod
+    def from_translation(cls, translation:_ext.npt.ArrayLike) ->_AffineTransform:
+        """Create a translation transform
+
+        Args:
+            translation(Vector)
+
+        Returns:
+            Transform
+        """
+        matrix = _ext.np.identity(cls.size + 1, dtype=_ext.np.float32)
+        matrix[:cls.size, cls.size] = _ext.types.as_vectorf_array([translation], cls.size)[0]
+        return cls(matrix)
+
+    @classmethod
+    def from_scale(cls, scale:_ext.Union[float, _ext.npt.ArrayLike], pivot:_ext.npt.ArrayLike=None) ->_AffineTransform:
+        """Create a scale transform
+
+        Args:
+            scale(float|Vector): uniform or per axis scale
+            pivot(Vector, optional): point to scale around, defaults to origin
+
+        Returns:
+            Transform
+        """
+        matrix = _ext.np.identity(cls.size + 1, dtype=_ext.np.float32)
+        _ext.np.fill_diagonal(matrix[:cls.size, :cls.size], scale)
+        return cls._around(cls(matrix), pivot)
+
+    @classmethod
+    def _around(cls, transform:_AffineTransform, pivot:_ext.npt.ArrayLike) ->_AffineTransform:
+        """Move the origin of a transform to a pivot"""
+        if pivot is None:
+            return transform
+        pivot = _ext.types.as_vectorf_array([pivot], cls.size)[0]
+        return cls.from_translation(pivot) @ transform @ cls.from_translation(-pivot)
+
+
+class Transform2D(_AffineTransform):
+    """ 2D affine transform backed by a 3x3 float32 matrix
+
+    Args:
+        matrix(Array): optional 3x3 matrix, defaults to identity
+    """
+    size = 2
+
+    @classmethod
+    def from_rotation(cls, angle:float, pivot:_ext.types.Vector2fCompat=None) ->Transform2D:
+        """Create a counter-clockwise rotation
+
+        Args:
+            angle(float): radians
+            pivot(Vector, optional): point to rotate around, defaults to origin
+
+        Returns:
+            Transform2D
+        """
+        cos_angle = _ext.math.cos(angle)
+        sin_angle = _ext.math.sin(angle)
+        matrix = (
+            (cos_angle, -sin_angle, 0.0),
+            (sin_angle, cos_angle, 0.0),
+            (0.0, 0.0, 1.0),
+        )
+        return cls._around(cls(matrix), pivot)
+
+
+class Transform3D(_AffineTransform):
+    """ 3D affine transform backed by a 4x4 float32 matrix
+
+    Args:
+        matrix(Array): optional 4x4 matrix, defaults to identity
+    """
+    size = 3
+
+    @classmethod
+    def from_rotation(cls, axis:_ext.types.Vector3fCompat, angle:float, pivot:_ext.types.Vector3fCompat=None) ->Transform3D:
+        """Create a right handed rotation around an axis
+
+        Args:
+            axis(Vector): axis to rotate around, does not need to be normalized
+            angle(float): radians
+            pivot(Vector, optional): point to rotate around, defaults to origin
+
+        Raises:
+            ValueError: If axis has no length
+
+        Returns:
+            Transform3D
+        """
+        axis = _ext.np.asarray(_ext.types.as_vector3f(axis), dtype=_ext.np.float64)
+        length = _ext.np.linalg.norm(axis)
+        if not length:
+            raise ValueError("Rotation axis must have a length")
+        x, y, z = axis / length
+        # Rodrigues rotation formula
+        cross = _ext.np.array((
+            (0.0, -z, y),
+            (z, 0.0, -x),
+            (-y, x, 0.0),
+        ))
+        matrix = _ext.np.identity(4)
+        matrix[:3, :3] += _ext.math.sin(angle) * cross + (1.0 - _ext.math.cos(angle)) * (cross @ cross)
+        return cls._around(cls(matrix), pivot)
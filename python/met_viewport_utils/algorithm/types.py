@@ -23,22 +23,97 @@ Vector2fCompat = _ext.Union[Vector2f, _ext.List[float]]
 Vector3fCompat = _ext.Union[Vector3f, _ext.List[float]]
 Vector4fCompat = _ext.Union[Vector3f, _ext.List[float]]
 
-# TODO: Use numpy properly...
+_FLOAT32 = _ext.np.dtype(_ext.np.float32)
 
-def as_vector2f(v:Vector2fCompat)->Vector2f:
-    """ Ensures this value is a vec2f, missing values are filled with zero """
+
+def as_vector2f(v:Vector2fCompat, copy:bool=True)->Vector2f:
+    """ Ensures this value is a new vec2f, missing values are filled with zero
+
+    Args:
+        v(Vector2fCompat): value to convert
+        copy(bool): If False float32 arrays of the correct shape are returned as is,
+            for callers that only read the result
+    """
+    if type(v) is _ext.np.ndarray and v.dtype is _FLOAT32 and v.shape == (2,):
+        return v.copy() if copy else v
     array = _ext.np.array(v, dtype=_ext.np.float32)
     array.resize(2, refcheck=False)
     return array
 
-def as_vector3f(v:Vector3fCompat)->Vector3f:
-    """ Ensures this value is a vec3f, missing values are filled with zero """
+def as_vector3f(v:Vector3fCompat, copy:bool=True)->Vector3f:
+    """ Ensures this value is a new vec3f, missing values are filled with zero
+
+    Args:
+        v(Vector3fCompat): value to convert
+        copy(bool): If False float32 arrays of the correct shape are returned as is,
+            for callers that only read the result
+    """
+    if type(v) is _ext.np.ndarray and v.dtype is _FLOAT32 and v.shape == (3,):
+        return v.copy() if copy else v
     array = _ext.np.array(v, dtype=_ext.np.float32)
     array.resize(3, refcheck=False)
     return array
 
-def as_vector4f(v:Vector4fCompat)->Vector4f:
-    """ Ensures this value is a vec4f, missing values are filled with zero """
+def as_vector4f(v:Vector4fCompat, copy:bool=True)->Vector4f:
+    """ Ensures this value is a new vec4f, missing values are filled with zero
+
+    Args:
+        v(Vector4fCompat): value to convert
+        copy(bool): If False float32 arrays of the correct shape are returned as is,
+            for callers that only read the result
+    """
+    if type(v) is _ext.np.ndarray and v.dtype is _FLOAT32 and v.shape == (4,):
+        return v.copy() if copy else v
     array = _ext.np.array(v, dtype=_ext.np.float32)
     array.resize(4, refcheck=False)
     return array
+
+
+def as_vectorf_array(values:_ext.Union[_ext.npt.ArrayLike, _ext.List[_ext.npt.ArrayLike]], size:int)->_ext.npt.NDArray[_ext.np.float32]:
+    """ Converts a list of vectors or an (N, k) array to a contiguous (N, size) float32 array
+    Missing values are filled with zero and extra values are dropped,
+    a 1D input is treated as N scalars.
+    Contiguous float32 arrays of the correct shape are returned as is
+
+    Args:
+        values (List[Vector]|Array): vectors to convert, these may have different lengths
+        size (int): vector size
+
+    Returns:
+        Array (N, size)
+    """
+    if type(values) is _ext.np.ndarray and values.dtype is _FLOAT32 \
+            and values.shape[1:] == (size,) and values.flags.c_contiguous:
+        return values
+    try:
+        array = _ext.np.asarray(values, dtype=_ext.np.float32)
+    except ValueError:
+        # Vectors of different lengths
+        array = None
+    if array is not None and array.ndim <= 2:
+        if array.ndim < 2:
+            array = array.reshape(-1, 1)
+        if array.shape[1] == size:
+            return _ext.np.ascontiguousarray(array)
+        result = _ext.np.zeros((array.shape[0], size), dtype=_ext.np.float32)
+        columns = min(size, array.shape[1])
+        result[:, :columns] = array[:, :columns]
+        return result
+    
+    result = _ext.np.zeros((len(values), size), dtype=_ext.np.float32)
+    for row, value in zip(result, values):
+        value = _ext.np.ravel(_ext.np.asarray(value, dtype=_ext.np.float32))[:size]
+        row[:len(value)] = value
+    return result
+
+def as_vector2f_array(values:_ext.Union[_ext.npt.ArrayLike, _ext.List[Vector2fCompat]])->_ext.npt.NDArray[_ext.np.float32]:
+    """ Converts a list of vectors to a contiguous (N, 2) float32 array, see as_vectorf_array """
+    return as_vectorf_array(values, 2)
+
+def as_vector3f_array(values:_ext.Union[_ext.npt.ArrayLike, _ext.List[Vector3fCompat]])->_ext.npt.NDArray[_ext.np.float32]:
+    """ Converts a list of vectors to a contiguous (N, 3) float32 array, see as_vectorf_array """
+    return as_vectorf_array(values, 3)
+
+def as_vector4f_array(values:_ext.Union[_ext.npt.ArrayLike, _ext.List[Vector4fCompat]])->_ext.npt.NDArray[_ext.np.float32]:
+    """ Converts a list of vectors to a contiguous (N, 4) float32 array, see as_vectorf_array """
+    return as_vectorf_array(values, 4)
@@ -112,6 +112,7 @@ class InteractionFlags(_enum.IntFlag):
     NoInteraction = 0
     Selectable = _enum.auto()
     Draggable = _enum.auto()
+    TracksMouse = _enum.auto()  # Hover and local mouse position without other interactions, the PointItem default
     # TODO: Drop events, inputs
 
 
@@ -123,3 +124,30 @@ class ItemState(_enum.IntFlag):
     Selected = _enum.auto()
     Dragging = _enum.auto()
     Hovered = _enum.auto()
+
+
+class PropertyOwnership(_enum.Enum):
+    """How a typed property stores assigned values"""
+    Copy = _enum.auto()
+    Share = _enum.auto()
+    InPlace = _enum.auto()
+
+
+class TraversalOrder(_enum.Enum):
+    """Hierarchy traversal order"""
+    DepthFirst = _enum.auto()  # Parents before children
+    BreadthFirst = _enum.auto()  # Level by level
+    PostOrder = _enum.auto()  # Children before parents
+
+
+class MouseEventType(_enum.Enum):
+    """Mouse event types"""
+    Press = _enum.auto()
+    Release = _enum.auto()
+    Move = _enum.auto()
+
+
+class EventPhase(_enum.Enum):
+    """Event dispatch phase"""
+    Capture = _enum.auto()  # Parents before children
+    Bubble = _enum.auto()  # Children before parents
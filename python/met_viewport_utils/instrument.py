@@ -0,0 +1,330 @@
+# copyright (c) 2024 Alex Telford, http://minimaleffort.tech
+"""Opt-in frame statistics for items, viewports, shaders and fonts
+
+Instrumentation is disabled by default and has no cost while disabled,
+enabling it wraps the instrumented methods on every implementing class
+and disabling it restores the originals.
+
+Example:
+    from met_viewport_utils import instrument
+    instrument.enable(trace=True)
+    with instrument.frame():
+        root.mouse_moved(viewport, position, position, modifier)
+    stats = instrument.last_frame()
+    print(stats.counts["viewport.world_to_screen"], stats.item_visits)
+    instrument.export_chrome_trace("frame.json")
+    instrument.disable()
+
+Calls are only recorded between begin_frame and end_frame, or within frame().
+Times are inclusive, eg: mouse_moved on a parent includes its children.
+This is intended for the main thread only.
+"""
+from __future__ import annotations
+class _ext:
+    """ External Dependencies """
+    import collections
+    import contextlib
+    import functools
+    import json
+    import os
+    import threading
+    import time
+    from dataclasses import dataclass, field
+    from typing import Dict, List, Tuple
+
+
+# Stat name, module, class name, method name
+_TARGETS = (
+    ("item.mouse_pressed", "met_viewport_utils.items.point_item", "PointItem", "mouse_pressed"),
+    ("item.mouse_released", "met_viewport_utils.items.point_item", "PointItem", "mouse_released"),
+    ("item.mouse_moved", "met_viewport_utils.items.point_item", "PointItem", "mouse_moved"),
+    ("item.draw", "met_viewport_utils.items.point_item", "PointItem", "draw"),
+    ("item.screen_position", "met_viewport_utils.items.point_item", "PointItem", "screen_position"),
+    ("viewport.world_to_screen", "met_viewport_utils.interfaces.viewport", "IViewport", "world_to_screen"),
+    ("viewport.world_to_screen_many", "met_viewport_utils.interfaces.viewport", "IViewport", "world_to_screen_many"),
+    ("shader.draw", "met_viewport_utils.interfaces.gpu_shader", "IGPUShader", "draw"),
+    ("shader.set_uniform", "met_viewport_utils.interfaces.gpu_shader", "IGPUShader", "set_uniform"),
+    ("font.draw", "met_viewport_utils.interfaces.gpu_font", "IGPUFont", "draw"),
+    ("font.bounds", "met_viewport_utils.interfaces.gpu_font", "IGPUFont", "bounds"),
+)
+
+# Stats counted as an item visit, item.visit is reported by the EventDispatcher
+ITEM_VISIT_STATS = ("item.visit", "item.draw")
+
+# Trace events kept per frame, further events are counted in FrameStats.dropped_events
+MAX_TRACE_EVENTS = 100000
+
+
+@_ext.dataclass
+class FrameStats:
+    """ Statistics for a single frame
+
+    Args:
+        index(int): frame number since instrumentation was enabled
+        start(int): perf_counter_ns at the start of the frame
+        end(int): perf_counter_ns at the end of the frame, 0 while in progress
+        counts(Dict[str, int]): number of calls per stat
+        times(Dict[str, int]): inclusive nanoseconds per stat
+        events(List[Tuple[str, int, int]]): trace events as name, start, duration, only when tracing
+        dropped_events(int): trace events over MAX_TRACE_EVENTS that were not kept
+    """
+    index:int = 0
+    start:int = 0
+    end:int = 0
+    counts:_ext.Dict[str, int] = _ext.field(default_factory=lambda: _ext.collections.defaultdict(int))
+    times:_ext.Dict[str, int] = _ext.field(default_factory=lambda: _ext.collections.defaultdict(int))
+    events:_ext.List[_ext.Tuple[str, int, int]] = _ext.field(default_factory=list)
+    dropped_events:int = 0
+
+    @property
+    def item_visits(self)->int:
+        """Number of items visited by event dispatch and draw calls"""
+        return sum(self.counts.get(stat, 0) for stat in ITEM_VISIT_STATS)
+
+    @property
+    def duration_ms(self)->float:
+        end = self.end or _ext.time.perf_counter_ns()
+        return (end - self.start) / 1e6
+
+    def time_ms(self, stat:str)->float:
+        """Inclusive time spent in a stat in milliseconds"""
+        return self.times.get(stat, 0) / 1e6
+
+    def as_dict(self)->dict:
+        return {
+            "index": self.index,
+            "duration_ms": self.duration_ms,
+            "item_visits": self.item_visits,
+            "counts": dict(self.counts),
+            "times_ms": {stat: self.time_ms(stat) for stat in self.times},
+            "dropped_events": self.dropped_events,
+        }
+
+
+class _State:
+    """ Module state, only used while enabled """
+    enabled = False
+    trace = False
+    patched = []  # (class, name, original)
+    active = set()  # (id(instance), stat) currently being timed
+    frame:FrameStats = None
+    history = _ext.collections.deque(maxlen=120)
+    frame_index = 0
+
+
+def is_enabled()->bool:
+    return _State.enabled
+
+
+def enable(trace:bool=False, history:int=120):
+    """Start collecting frame statistics
+
+    Args:
+        trace(bool): also record individual calls for export_chrome_trace
+        history(int): number of finished frames to keep
+    """
+    _State.trace = trace
+    if _State.history.maxlen != history:
+        _State.history = _ext.collections.deque(_State.history, maxlen=history)
+    if _State.enabled:
+        return
+    _State.enabled = True
+    _patch()
+
+
+def disable():
+    """Stop collecting statistics and restore the original methods
+
+    The current frame is ended and kept in the history.
+    """
+    if not _State.enabled:
+        return
+    end_frame()
+    for cls, name, original in reversed(_State.patched):
+        setattr(cls, name, original)
+    _State.patched = []
+    _State.active.clear()
+    _State.enabled = False
+
+
+def reset():
+    """Clear the frame history"""
+    _State.history.clear()
+    _State.frame_index = 0
+
+
+def begin_frame()->FrameStats:
+    """Start a new frame, ending the current one
+
+    Classes defined since the last frame are instrumented here.
+
+    Returns:
+        FrameStats: the new frame, None if not enabled
+    """
+    if not _State.enabled:
+        return None
+    if _State.frame is not None:
+        end_frame()
+    _patch()
+    _State.frame_index += 1
+    _State.frame = FrameStats(index=_State.frame_index, start=_ext.time.perf_counter_ns())
+    return _State.frame
+
+
+def end_frame()->FrameStats:
+    """End the current frame and add it to the history
+
+    Returns:
+        FrameStats: the finished frame, None if there was none
+    """
+    frame = _State.frame
+    if frame is None:
+        return None
+    frame.end = _ext.time.perf_counter_ns()
+    _State.history.append(frame)
+    _State.frame = None
+    return frame
+
+
+@_ext.contextlib.contextmanager
+def frame():
+    """Context manager to collect a single frame, does nothing if not enabled"""
+    stats = begin_frame()
+    try:
+        yield stats
+    finally:
+        if stats is not None and _State.frame is stats:
+            end_frame()
+
+
+def current_frame()->FrameStats:
+    """Frame currently collecting statistics"""
+    return _State.frame
+
+
+def last_frame()->FrameStats:
+    """Most recently finished frame"""
+    return _State.history[-1] if _State.history else None
+
+
+def frames()->_ext.List[FrameStats]:
+    """Finished frames, oldest first"""
+    return list(_State.history)
+
+
+def chrome_trace(frames:_ext.List[FrameStats]=None)->dict:
+    """Build a Chrome trace (chrome://tracing, Perfetto) from finished frames
+
+    Call events are only included if enabled with trace=True.
+
+    Args:
+        frames(List[FrameStats]): frames to export, defaults to the history
+
+    Returns:
+        dict
+    """
+    if frames is None:
+        frames = list(_State.history)
+    pid = _ext.os.getpid()
+    tid = _ext.threading.get_ident()
+    events = []
+    for stats in frames:
+        end = stats.end or _ext.time.perf_counter_ns()
+        events.append({
+            "name": f"frame {stats.index}", "cat": "frame", "ph": "X",
+            "ts": stats.start / 1e3, "dur": (end - stats.start) / 1e3,
+            "pid": pid, "tid": tid, "args": stats.as_dict()})
+        for name, start, duration in stats.events:
+            events.append({
+                "name": name, "cat": name.split(".")[0], "ph": "X",
+                "ts": start / 1e3, "dur": duration / 1e3,
+                "pid": pid, "tid": tid})
+        for name, count in stats.counts.items():
+            events.append({
+                "name": name, "ph": "C", "ts": stats.start / 1e3,
+                "pid": pid, "args": {"count": count}})
+    return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+
+def export_chrome_trace(path:str, frames:_ext.List[FrameStats]=None):
+    """Write chrome_trace to a JSON file
+
+    Args:
+        path(str): file to write
+        frames(List[FrameStats]): frames to export, defaults to the history
+    """
+    with open(path, "w") as handle:
+        _ext.json.dump(chrome_trace(frames), handle)
+
+
+def count(stat:str, value:int=1):
+    """Add to a stat count in the current frame, does nothing if no frame is active
+
+    Args:
+        stat(str): name of the stat, eg: item.visit
+        value(int): amount to add
+    """
+    frame = _State.frame
+    if frame is not None:
+        frame.counts[stat] += value
+
+
+def _record(stat:str, start:int, end:int):
+    frame = _State.frame
+    if frame is None:
+        return
+    frame.counts[stat] += 1
+    frame.times[stat] += end - start
+    if _State.trace:
+        if len(frame.events) < MAX_TRACE_EVENTS:
+            frame.events.append((stat, start, end - start))
+        else:
+            frame.dropped_events += 1
+
+
+def _wrap(stat:str, func):
+    """Wrap a method to record its calls
+
+    Nested calls on the same instance, eg: super(), are only recorded once.
+    """
+    active = _State.active
+    perf_counter_ns = _ext.time.perf_counter_ns
+
+    @_ext.functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        key = (id(self), stat)
+        if key in active:
+            return func(self, *args, **kwargs)
+        active.add(key)
+        start = perf_counter_ns()
+        try:
+            return func(self, *args, **kwargs)
+        finally:
+            end = perf_counter_ns()
+            active.discard(key)
+            _record(stat, start, end)
+    wrapper._instrument_stat = stat
+    return wrapper
+
+
+def _iter_subclasses(cls):
+    yield cls
+    for subclass in cls.__subclasses__():
+        yield from _iter_subclasses(subclass)
+
+
+def _patch():
+    """Wrap every class that implements an instrumented method"""
+    import importlib
+    for stat, module_name, class_name, method_name in _TARGETS:
+        base = getattr(importlib.import_module(module_name), class_name)
+        for cls in set(_iter_subclasses(base)):
+            if not getattr(cls, "_instrumented", True):
+                continue  # Forwards to an instrumented class, eg: FrameContext
+            func = cls.__dict__.get(method_name)
+            if not callable(func) or getattr(func, "__isabstractmethod__", False):
+                continue
+            if getattr(func, "_instrument_stat", None):
+                continue  # Already wrapped
+            _State.patched.append((cls, method_name, func))
+            setattr(cls, method_name, _wrap(stat, func))
@@ -1,6 +1,36 @@
-from .name import INameItem
-from .hierachy import IHierarchyItem
-from .gpu_state import IGPURestoreState
-from .gpu_font import IGPUFont
-from .gpu_shader import IGPUShader
-from .viewport import IViewport
\ No newline at end of file
+import typing as _typing
+if _typing.TYPE_CHECKING:
+    from .name import INameItem
+    from .hierachy import IHierarchyItem
+    from .gpu_state import IGPURestoreState
+    from .gpu_font import IGPUFont
+    from .gpu_shader import IGPUShader
+    from .viewport import IViewport
+    from .matrix_viewport import MatrixViewport
+
+# Interfaces are imported on first access so importing one does not load the rest
+_LAZY_MODULES = {
+    "INameItem": ".name",
+    "IHierarchyItem": ".hierachy",
+    "IGPURestoreState": ".gpu_state",
+    "IGPUFont": ".gpu_font",
+    "IGPUShader": ".gpu_shader",
+    "IViewport": ".viewport",
+    "MatrixViewport": ".matrix_viewport",
+}
+
+__all__ = list(_LAZY_MODULES)
+
+
+def __getattr__(name):
+    module_name = _LAZY_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    import importlib
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -6,13 +6,11 @@ class _ext:
     LOGGER = logging.getLogger("met_viewport_utils.gpu.font")
     import abc
     from typing import Union
-    try:
-        # TODO: Replace matplotlib, not using anything else from it
-        from matplotlib import font_manager
-    except ImportError:
-        LOGGER.warning("Failed to import matplotlib, cannot set fonts")
     from pathlib import Path
-    from met_viewport_utils.algorithm.meta import typed_property
+    from met_viewport_utils.algorithm.meta import typed_property, LazyImport
+    # TODO: Replace matplotlib, not using anything else from it
+    # Imported when a font is first resolved, matplotlib is slow to import
+    font_manager = LazyImport("matplotlib.font_manager")
     from met_viewport_utils.constants import FontStyle, FontWeight, Align
     from met_viewport_utils.algorithm.color import parse_color
     from met_viewport_utils.shape.rect import Rect
@@ -51,7 +49,8 @@ class IGPUFont(_ext.abc.ABC):
             copy.weight = self.weight
             copy.style = self.style
             copy.align = self.align
-            copy.path = self.path
+            if self.path is not None:
+                copy.path = self.path
             
             copy.color = self.color
             copy.shadow_color = self.shadow_color
@@ -115,11 +114,16 @@ class IGPUFont(_ext.abc.ABC):
         """ family, weight or style has changed"""
         if self._updating:
             return  # prevent recursion
+        try:
+            font_manager = _ext.font_manager
+        except ImportError:
+            LOGGER.warning("Failed to import matplotlib, cannot set fonts")
+            return
         self._updating = True
         try:
-            props = _ext.font_manager.FontProperties(family=self.family, style=self.style.value, weight=self.weight.value)
+            props = font_manager.FontProperties(family=self.family, style=self.style.value, weight=self.weight.value)
             # Throws ValueError if not found
-            self.path = _ext.font_manager.findfont(props, fallback_to_default=False)
+            self.path = font_manager.findfont(props, fallback_to_default=False)
         finally:
             self._updating = False
         self._load_path()
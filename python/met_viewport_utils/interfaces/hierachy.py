@@ -5,18 +5,225 @@ class _ext:
     import weakref
     from typing import List, Union
     from collections import deque
+    from collections.abc import MutableSequence
     from met_viewport_utils.algorithm.meta import typed_property
+    from met_viewport_utils.constants import TraversalOrder
     from .name import INameItem
 
 
+class ChildList(_ext.MutableSequence):
+    """ Insertion ordered collection of unique children
+
+    Behaves like a list, membership, append and removal are O(1) by item identity,
+    other edits, eg: slice assignment, sort and insert are O(n).
+    Adding an item that is already a member does nothing, an assignment that
+    repeats an item keeps it at its first position.
+
+    Args:
+        items(Iterable[IHierarchyItem]): initial children
+    """
+    __slots__ = ("_items", "_list")
+
+    def __init__(self, items=()):
+        self._items = {}
+        self._list = None  # Cached ordered list, rebuilt after changes
+        self.extend(items)
+
+    def _ordered(self)->list:
+        if self._list is None:
+            self._list = list(self._items.values())
+        return self._list
+
+    def __iter__(self):
+        # Iterates a snapshot so children can be reparented while iterating
+        return iter(self._ordered())
+
+    def __reversed__(self):
+        return reversed(self._ordered())
+
+    def __len__(self):
+        return len(self._items)
+
+    def __contains__(self, item):
+        return id(item) in self._items
+
+    def __getitem__(self, index):
+        return self._ordered()[index]
+
+    def __setitem__(self, index, value):
+        ordered = list(self._ordered())
+        ordered[index] = value
+        self._rebuild(ordered)
+
+    def __delitem__(self, index):
+        ordered = list(self._ordered())
+        del ordered[index]
+        self._rebuild(ordered)
+
+    def __add__(self, items)->list:
+        return self.copy() + list(items)
+
+    def __radd__(self, items)->list:
+        return list(items) + self.copy()
+
+    def __eq__(self, other):
+        if isinstance(other, ChildList):
+            return self._ordered() == other._ordered()
+        if isinstance(other, (list, tuple)):
+            return self._ordered() == list(other)
+        return NotImplemented
+
+    __hash__ = None
+
+    def __iadd__(self, items):
+        self.extend(items)
+        return self
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self._ordered()!r})"
+
+    def append(self, item:IHierarchyItem):
+        key = id(item)
+        if key not in self._items:
+            self._items[key] = item
+            self._list = None
+
+    def extend(self, items):
+        for item in items:
+            self.append(item)
+
+    def insert(self, index:int, item:IHierarchyItem):
+        """Insert an item before index, this is O(n)"""
+        self.insert_many(index, [item])
+
+    def insert_many(self, index:int, items):
+        """Insert items before index in a single O(n) rebuild, same as list[index:index] = items"""
+        items = [item for item in items if id(item) not in self._items]
+        if not items:
+            return
+        # Copied, the cached list may be the snapshot of a running iterator
+        ordered = list(self._ordered())
+        ordered[index:index] = items
+        self._rebuild(ordered)
+
+    def _rebuild(self, ordered:list):
+        self._items = {}
+        for each in ordered:
+            self._items.setdefault(id(each), each)
+        self._list = None
+
+    def pop(self, index:int=-1)->IHierarchyItem:
+        """Remove and return the item at index, the last item by default
+
+        Raises:
+            IndexError: If the list is empty or index is out of range
+        """
+        item = self._ordered()[index]
+        del self._items[id(item)]
+        self._list = None
+        return item
+
+    def sort(self, key=None, reverse:bool=False):
+        self._rebuild(sorted(self._ordered(), key=key, reverse=reverse))
+
+    def reverse(self):
+        self._rebuild(self._ordered()[::-1])
+
+    def remove(self, item:IHierarchyItem):
+        """Remove an item
+
+        Raises:
+            ValueError: If item is not a member
+        """
+        try:
+            del self._items[id(item)]
+        except KeyError:
+            raise ValueError(f"{item!r} is not a child") from None
+        self._list = None
+
+    def discard(self, item:IHierarchyItem):
+        """Remove an item if it is a member"""
+        if self._items.pop(id(item), None) is not None:
+            self._list = None
+
+    def clear(self):
+        self._items.clear()
+        self._list = None
+
+    def index(self, item:IHierarchyItem)->int:
+        """Index of an item by identity
+
+        Raises:
+            ValueError: If item is not a member
+        """
+        if id(item) in self._items:
+            for i, each in enumerate(self._ordered()):
+                if each is item:
+                    return i
+        raise ValueError(f"{item!r} is not a child")
+
+    def count(self, item:IHierarchyItem)->int:
+        return int(id(item) in self._items)
+
+    def copy(self)->list:
+        return list(self._ordered())
+
+
 class IHierarchyItem(_ext.INameItem):
-    """Indicates item has parent and children properties"""
+    """Indicates item has parent and children properties
+    
+    path, root and depth are cached and invalidated for the subtree when the parent or name changes
+    """
+    # Cached hierarchy data, see _update_hierarchy_cache
+    _hierarchy_cache_valid:bool = False
+    _cached_path:str = None  # Only computed on request to avoid storing every path in deep chains
+    _cached_root:_ext.weakref.ref = None  # None if this is the root
+    _cached_depth:int = 0
+    
     def __init__(self):
-        self.name:str = None
         self._parent:IHierarchyItem = None
-        self.children:_ext.List[IHierarchyItem] = []
+        self.children:ChildList = ChildList()
+        self.name:str = None
+    
+    def _invalidate_hierarchy_cache(self):
+        """ Invalidate the cached path, root and depth of this item and its descendants
+        An invalid item never has valid descendants, so the walk stops at invalid items
+        """
+        stack = [self]
+        while stack:
+            item = stack.pop()
+            if not item._hierarchy_cache_valid:
+                continue
+            item._hierarchy_cache_valid = False
+            item._cached_path = None
+            stack.extend(item.children)
     
-    name:str = _ext.typed_property(str, "")
+    def _hierarchy_cache_ok(self)->bool:
+        if not self._hierarchy_cache_valid:
+            return False
+        # The root may have been deleted without detaching its children
+        return self._cached_root is None or self._cached_root() is not None
+    
+    def _update_hierarchy_cache(self):
+        """ Compute the root and depth from the nearest valid parent """
+        chain = []
+        item = self
+        while item is not None and not item._hierarchy_cache_ok():
+            chain.append(item)
+            item = item.parent
+        
+        for item in reversed(chain):
+            parent = item.parent
+            item._cached_path = None
+            if parent is None:
+                item._cached_root = None
+                item._cached_depth = 0
+            else:
+                item._cached_root = parent._cached_root or _ext.weakref.ref(parent)
+                item._cached_depth = parent._cached_depth + 1
+            item._hierarchy_cache_valid = True
+    
+    name:str = _ext.typed_property(str, "", notify=_invalidate_hierarchy_cache)
     
     @property
     def parent(self):
@@ -27,32 +234,62 @@ class IHierarchyItem(_ext.INameItem):
     @parent.setter
     def parent(self, item:_ext.Union[IHierarchyItem, None]):
         current_parent = self.parent
+        if current_parent is item and (item is None or self in item.children):
+            return
         if current_parent:
-            if self in current_parent.children:
-                current_parent.children.remove(self)
+            current_parent.children.discard(self)
         if item:
             self._parent = _ext.weakref.ref(item)
-            if self not in item.children:
-                item.children.append(self)
+            item.children.append(self)
         else:
             self._parent = None
+        self._parent_changed()
+    
+    # Called on this item or its nearest descendants that define it when a parent changes,
+    # set to a method to invalidate data derived from the parents, eg: global positions
+    # The method is responsible for its own descendants
+    _ancestor_changed = None
+    
+    def _parent_changed(self):
+        """ Called after the parent changes """
+        self._invalidate_hierarchy_cache()
+        stack = [self]
+        while stack:
+            item = stack.pop()
+            if item._ancestor_changed is not None:
+                item._ancestor_changed()
+            else:
+                stack.extend(item.children)
     
     @property
-    def path(self):
-        names = _ext.deque([self.name])
-        parent = self.parent
-        while parent:
-            names.appendleft(parent.name)
-            parent = parent.parent
-        
-        return "/" + "/".join(names)
+    def path(self)->str:
+        """Path from the root, eg: /root/parent/item"""
+        if not self._hierarchy_cache_ok():
+            self._update_hierarchy_cache()
+        if self._cached_path is None:
+            # Join names up to the nearest parent with a cached path
+            names = _ext.deque([self.name])
+            parent = self.parent
+            while parent is not None and parent._cached_path is None:
+                names.appendleft(parent.name)
+                parent = parent.parent
+            prefix = parent._cached_path if parent is not None else ""
+            self._cached_path = prefix + "/" + "/".join(names)
+        return self._cached_path
+    
+    @property
+    def depth(self)->int:
+        """Number of parents above this item, the root has a depth of 0"""
+        if not self._hierarchy_cache_ok():
+            self._update_hierarchy_cache()
+        return self._cached_depth
     
     def append(self, children:_ext.Union[IHierarchyItem, _ext.List[IHierarchyItem]]):
         if isinstance(children, IHierarchyItem):
             children = [children]
             
         children = [child for child in children if child not in self.children]
-        self.children += children
+        self.children.extend(children)
         for child in children:
             child.parent = self
 
@@ -61,40 +298,109 @@ class IHierarchyItem(_ext.INameItem):
             children = [children]
             
         children = [child for child in children if child not in self.children]
-        self.children[index:index] = children
+        self.children.insert_many(index, children)
         for child in children:
             child.parent = self
     
     def clear(self):
         """Remove all children"""
-        for child in self.children:
+        children = self.children.copy()
+        self.children.clear()
+        for child in children:
             child.parent = None
-        
-        self.children = []
 
     def get_root(self)->IHierarchyItem:
-        parent = self.parent
-        if not parent:
+        if not self._hierarchy_cache_ok():
+            self._update_hierarchy_cache()
+        if self._cached_root is None:
             return self
-        while parent.parent:
-            parent = parent.parent
-        return parent
+        return self._cached_root()
 
-    def iter_descendants(self, type=None):
-        """ Recurse children based on an instance check
+    def iter_descendants(self, type=None, order:_ext.TraversalOrder=_ext.TraversalOrder.DepthFirst, max_depth:int=None):
+        """ Iterate descendants based on an instance check
         This allows to check for class instances that may have non class type parents
+        
+        Send a truthy value after an item is yielded to skip its descendants,
+        send returns the next item or raises StopIteration.
+        prune_descendants wraps this with a callback. Pruning has no effect in PostOrder.
+        
+        Args:
+            type(type): only yield instances of this type, other items are still traversed
+            order(TraversalOrder): DepthFirst, BreadthFirst or PostOrder
+            max_depth(int): only iterate this many levels below this item, eg: 1 for children
+        
+        Yields:
+            IHierarchyItem
+        """
+        if max_depth is not None and max_depth < 1:
+            return
+        if order is _ext.TraversalOrder.BreadthFirst:
+            yield from self._iter_breadth_first(type, max_depth)
+        elif order is _ext.TraversalOrder.PostOrder:
+            yield from self._iter_post_order(type, max_depth)
+        else:
+            yield from self._iter_depth_first(type, max_depth)
+    
+    def prune_descendants(self, type=None, max_depth:int=None, prune=None):
+        """ Depth first iteration that skips the descendants of items where prune(item) is True
+        Pruned items are still yielded
+        
+        Args:
+            type(type): only yield instances of this type, other items are still traversed
+            max_depth(int): only iterate this many levels below this item
+            prune(Callable[[IHierarchyItem], bool]): return True to skip the descendants of an item
+        
+        Yields:
+            IHierarchyItem
         """
-        for child in self.children:
+        generator = self.iter_descendants(type, max_depth=max_depth)
+        try:
+            item = next(generator)
+            while True:
+                yield item
+                item = generator.send(prune is not None and prune(item))
+        except StopIteration:
+            return
+    
+    def _iter_depth_first(self, type, max_depth):
+        # Stack of child iterators, the stack length is the depth of the next child
+        stack = [iter(self.children)]
+        while stack:
+            child = next(stack[-1], None)
+            if child is None:
+                stack.pop()
+                continue
             if type is None or isinstance(child, type):
-                prune = yield child
-                if prune:
+                if (yield child):
                     continue
-            
-            generator = child.iter_descendants(type)
-            for each in generator:
-                prune = yield each
-                if prune:
-                    generator.send(prune)
+            if child.children and (max_depth is None or len(stack) < max_depth):
+                stack.append(iter(child.children))
+    
+    def _iter_breadth_first(self, type, max_depth):
+        queue = _ext.deque((child, 1) for child in self.children)
+        while queue:
+            child, depth = queue.popleft()
+            if type is None or isinstance(child, type):
+                if (yield child):
+                    continue
+            if max_depth is None or depth < max_depth:
+                depth += 1
+                queue.extend((each, depth) for each in child.children)
+    
+    def _iter_post_order(self, type, max_depth):
+        # Stack of (item, child iterator), items are yielded once their children are exhausted
+        stack = [(None, iter(self.children))]
+        while stack:
+            child = next(stack[-1][1], None)
+            if child is None:
+                item = stack.pop()[0]
+                if item is not None and (type is None or isinstance(item, type)):
+                    yield item
+                continue
+            if child.children and (max_depth is None or len(stack) < max_depth):
+                stack.append((child, iter(child.children)))
+            elif type is None or isinstance(child, type):
+                yield child
 
     def iter_parents(self, type=None):
         """ Recurse parents based on an instance check
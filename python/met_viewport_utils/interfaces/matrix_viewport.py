@@ -0,0 +1,242 @@
+# copyright (c) 2024 Alex Telford, http://minimaleffort.tech
+"""Viewport implemented from view, projection and viewport matrices
+
+DCC adapters only need to set the matrices each frame and every projection
+is computed in numpy without calling the host application.
+It also works without a GPU or DCC, eg: for tests and benchmarks.
+
+Matrices use column vectors and OpenGL clip space,
+screen positions start at the bottom left of the viewport rect.
+
+Example:
+    viewport = MatrixViewport(
+        view=look_at_matrix([0, -10, 5], [0, 0, 0]),
+        projection=perspective_matrix(math.radians(45), 16 / 9, 0.1, 1000),
+        rect=Rect([0, 0], [1920, 1080]))
+    screen_positions = viewport.world_to_screen_many(points)
+"""
+from __future__ import annotations
+class _ext:
+    """ External Dependencies """
+    import math
+    import typing
+    import numpy
+    import numpy.typing as npt
+    from met_viewport_utils.shape.rect import Rect
+    from met_viewport_utils.algorithm import types
+    from met_viewport_utils.algorithm.transform import Transform3D
+    from .viewport import IViewport
+
+
+def _as_matrix(matrix, name:str)->_ext.npt.NDArray[_ext.numpy.float64]:
+    if isinstance(matrix, _ext.Transform3D):
+        matrix = matrix.matrix
+    matrix = _ext.numpy.array(matrix, dtype=_ext.numpy.float64)
+    if matrix.shape != (4, 4):
+        raise ValueError(f"{name} must be a 4x4 matrix, got {matrix.shape}")
+    return matrix
+
+
+def perspective_matrix(fov_y:float, aspect:float, near:float, far:float)->_ext.npt.NDArray[_ext.numpy.float32]:
+    """OpenGL style perspective projection
+
+    Args:
+        fov_y(float): vertical field of view in radians
+        aspect(float): width / height
+        near(float): near clip distance
+        far(float): far clip distance
+
+    Returns:
+        (4, 4) float32 matrix
+    """
+    focal = 1.0 / _ext.math.tan(fov_y / 2.0)
+    return _ext.numpy.array((
+        (focal / aspect, 0.0, 0.0, 0.0),
+        (0.0, focal, 0.0, 0.0),
+        (0.0, 0.0, (far + near) / (near - far), 2.0 * far * near / (near - far)),
+        (0.0, 0.0, -1.0, 0.0),
+    ), dtype=_ext.numpy.float32)
+
+
+def orthographic_matrix(left:float, right:float, bottom:float, top:float, near:float, far:float)->_ext.npt.NDArray[_ext.numpy.float32]:
+    """OpenGL style orthographic projection
+
+    Returns:
+        (4, 4) float32 matrix
+    """
+    return _ext.numpy.array((
+        (2.0 / (right - left), 0.0, 0.0, -(right + left) / (right - left)),
+        (0.0, 2.0 / (top - bottom), 0.0, -(top + bottom) / (top - bottom)),
+        (0.0, 0.0, -2.0 / (far - near), -(far + near) / (far - near)),
+        (0.0, 0.0, 0.0, 1.0),
+    ), dtype=_ext.numpy.float32)
+
+
+def look_at_matrix(eye:_ext.types.Vector3fCompat,
+                   target:_ext.types.Vector3fCompat,
+                   up:_ext.types.Vector3fCompat=(0, 0, 1))->_ext.npt.NDArray[_ext.numpy.float32]:
+    """View matrix for a camera at eye looking at target, the camera looks down its -Z axis
+
+    Raises:
+        ValueError: If eye and target are the same or up is parallel to the view direction
+
+    Returns:
+        (4, 4) float32 matrix
+    """
+    eye = _ext.numpy.asarray(_ext.types.as_vector3f(eye), dtype=_ext.numpy.float64)
+    forward = _ext.numpy.asarray(_ext.types.as_vector3f(target), dtype=_ext.numpy.float64) - eye
+    side = _ext.numpy.cross(forward, _ext.numpy.asarray(_ext.types.as_vector3f(up), dtype=_ext.numpy.float64))
+    forward_length = _ext.numpy.linalg.norm(forward)
+    side_length = _ext.numpy.linalg.norm(side)
+    if not forward_length or not side_length:
+        raise ValueError("look_at_matrix requires distinct eye and target and an up vector that is not parallel to the view")
+    forward /= forward_length
+    side /= side_length
+    camera_up = _ext.numpy.cross(side, forward)
+    matrix = _ext.numpy.identity(4)
+    matrix[0, :3] = side
+    matrix[1, :3] = camera_up
+    matrix[2, :3] = -forward
+    matrix[:3, 3] = -matrix[:3, :3] @ eye
+    return matrix.astype(_ext.numpy.float32)
+
+
+class MatrixViewport(_ext.IViewport):
+    """ Viewport computed from view and projection matrices and a screen rect
+
+    Combined matrices and their inverses are cached until set_matrices is called.
+    Points behind the camera project to nan so they never hit-test.
+
+    Args:
+        view(Array|Transform3D): world to camera matrix, defaults to identity
+        projection(Array): camera to clip matrix, defaults to identity
+        rect(Rect): screen rect of the viewport, defaults to [-1, -1] to [1, 1]
+    """
+    def __init__(self, view:_ext.npt.ArrayLike=None, projection:_ext.npt.ArrayLike=None, rect:_ext.Rect=None):
+        self._view = _ext.numpy.identity(4)
+        self._projection = _ext.numpy.identity(4)
+        self._rect = _ext.Rect([-1, -1], [2, 2])
+        self.set_matrices(view, projection, rect)
+
+    def set_matrices(self, view:_ext.npt.ArrayLike=None, projection:_ext.npt.ArrayLike=None, rect:_ext.Rect=None):
+        """Update the matrices, values that are None are unchanged
+
+        Args:
+            view(Array|Transform3D): world to camera matrix
+            projection(Array): camera to clip matrix
+            rect(Rect): screen rect of the viewport
+
+        Raises:
+            ValueError: If a matrix is not 4x4
+        """
+        if view is not None:
+            self._view = _as_matrix(view, "view")
+        if projection is not None:
+            self._projection = _as_matrix(projection, "projection")
+        if rect is not None:
+            self._rect = rect.copy()
+        x, y = self._rect.position.tolist()
+        width, height = self._rect.size.tolist()
+        viewport = _ext.numpy.identity(4)
+        viewport[0, 0] = width / 2.0
+        viewport[1, 1] = height / 2.0
+        viewport[0, 3] = x + width / 2.0
+        viewport[1, 3] = y + height / 2.0
+        self._viewport = viewport
+        self._world_to_clip = self._projection @ self._view
+        # Cached on first use
+        self._clip_to_world = None
+
+    def rect(self)->_ext.Rect:
+        return self._rect.copy()
+
+    def view_matrix(self)->_ext.npt.NDArray[_ext.numpy.float32]:
+        return self._view.astype(_ext.numpy.float32)
+
+    def projection_matrix(self)->_ext.npt.NDArray[_ext.numpy.float32]:
+        return self._projection.astype(_ext.numpy.float32)
+
+    def viewport_matrix(self)->_ext.npt.NDArray[_ext.numpy.float32]:
+        return self._viewport.astype(_ext.numpy.float32)
+
+    def _inverse(self)->_ext.npt.NDArray[_ext.numpy.float64]:
+        """Clip to world matrix, this is cached
+
+        Raises:
+            numpy.linalg.LinAlgError: If the view or projection is not invertible
+        """
+        if self._clip_to_world is None:
+            self._clip_to_world = _ext.numpy.linalg.inv(self._world_to_clip)
+        return self._clip_to_world
+
+    def _screen_to_ndc(self, screen_positions:_ext.npt.NDArray)->_ext.npt.NDArray[_ext.numpy.float64]:
+        viewport = self._viewport
+        ndc = _ext.numpy.empty((len(screen_positions), 2))
+        ndc[:, 0] = (screen_positions[:, 0] - viewport[0, 3]) / viewport[0, 0]
+        ndc[:, 1] = (screen_positions[:, 1] - viewport[1, 3]) / viewport[1, 1]
+        return ndc
+
+    def _unproject(self, ndc_xy:_ext.npt.NDArray, ndc_z)->_ext.npt.NDArray[_ext.numpy.float64]:
+        points = _ext.numpy.empty((len(ndc_xy), 4))
+        points[:, :2] = ndc_xy
+        points[:, 2] = ndc_z
+        points[:, 3] = 1.0
+        world = points @ self._inverse().T
+        return world[:, :3] / world[:, 3:]
+
+    def world_to_screen_many(self, world_positions:_ext.npt.ArrayLike)->_ext.npt.NDArray[_ext.numpy.float32]:
+        points = _ext.types.as_vector3f_array(world_positions)
+        matrix = self._world_to_clip
+        clip = points @ matrix[:2, :3].T + matrix[:2, 3]
+        w = points @ matrix[3, :3] + matrix[3, 3]
+        with _ext.numpy.errstate(divide="ignore", invalid="ignore"):
+            ndc = clip[:, :2] / w[:, None]
+        ndc[w <= 0.0] = _ext.numpy.nan
+        viewport = self._viewport
+        result = _ext.numpy.empty((len(points), 2), dtype=_ext.numpy.float32)
+        result[:, 0] = ndc[:, 0] * viewport[0, 0] + viewport[0, 3]
+        result[:, 1] = ndc[:, 1] * viewport[1, 1] + viewport[1, 3]
+        return result
+
+    def world_to_screen(self, world_position:_ext.types.Vector3fCompat)->_ext.types.Vector2f:
+        x, y, z = _ext.types.as_vector3f(world_position, copy=False).tolist()
+        matrix = self._world_to_clip
+        w = matrix[3, 0] * x + matrix[3, 1] * y + matrix[3, 2] * z + matrix[3, 3]
+        if w <= 0.0:
+            return _ext.types.as_vector2f([_ext.numpy.nan, _ext.numpy.nan])
+        viewport = self._viewport
+        ndc_x = (matrix[0, 0] * x + matrix[0, 1] * y + matrix[0, 2] * z + matrix[0, 3]) / w
+        ndc_y = (matrix[1, 0] * x + matrix[1, 1] * y + matrix[1, 2] * z + matrix[1, 3]) / w
+        return _ext.types.as_vector2f([ndc_x * viewport[0, 0] + viewport[0, 3], ndc_y * viewport[1, 1] + viewport[1, 3]])
+
+    def screen_to_ray_many(self, screen_positions:_ext.npt.ArrayLike)->_ext.typing.Tuple[_ext.npt.NDArray[_ext.numpy.float32]]:
+        ndc = self._screen_to_ndc(_ext.types.as_vector2f_array(screen_positions))
+        near = self._unproject(ndc, -1.0)
+        far = self._unproject(ndc, 1.0)
+        directions = far - near
+        directions /= _ext.numpy.linalg.norm(directions, axis=1, keepdims=True)
+        return near.astype(_ext.numpy.float32), directions.astype(_ext.numpy.float32)
+
+    def screen_to_ray(self, screen_position:_ext.types.Vector2fCompat)->_ext.typing.Tuple[_ext.types.Vector3f]:
+        origins, directions = self.screen_to_ray_many([_ext.types.as_vector2f(screen_position)])
+        return origins[0], directions[0]
+
+    def screen_to_world_many(self,
+                             screen_positions:_ext.npt.ArrayLike,
+                             depth_point:_ext.types.Vector3fCompat)->_ext.npt.NDArray[_ext.numpy.float32]:
+        """World positions under many screen positions at the depth of a point
+
+        Args:
+            screen_positions: (N, 2) screen positions
+            depth_point(Vector3f): position in space to match the depth of
+
+        Returns:
+            (N, 3) float32 world positions
+        """
+        point = _ext.numpy.append(_ext.numpy.asarray(_ext.types.as_vector3f(depth_point), dtype=_ext.numpy.float64), 1.0)
+        clip = self._world_to_clip @ point
+        ndc = self._screen_to_ndc(_ext.types.as_vector2f_array(screen_positions))
+        return self._unproject(ndc, clip[2] / clip[3]).astype(_ext.numpy.float32)
+
+    def screen_to_world(self, screen_position:_ext.types.Vector2fCompat, depth_point:_ext.types.Vector3f)->_ext.types.Vector3f:
+        return self.screen_to_world_many([_ext.types.as_vector2f(screen_position)], depth_point)[0]
@@ -3,6 +3,8 @@ class _ext:
     """ External Dependencies """
     import abc
     import typing
+    import numpy
+    import numpy.typing as npt
     from met_viewport_utils.shape.rect import Rect
     from met_viewport_utils.algorithm import types
 
@@ -13,6 +15,31 @@ class IViewport(_ext.abc.ABC):
     def rect(self)->_ext.Rect:
         pass
     
+    def view_matrix(self)->_ext.typing.Optional[_ext.npt.NDArray[_ext.numpy.float32]]:
+        """World to camera 4x4 matrix, optional
+        
+        Returns:
+            (4, 4) matrix using column vectors, None if not available
+        """
+        return None
+    
+    def projection_matrix(self)->_ext.typing.Optional[_ext.npt.NDArray[_ext.numpy.float32]]:
+        """Camera to clip space 4x4 matrix, optional
+        Clip space is OpenGL style, normalized device coordinates are -1 to 1 on every axis
+        
+        Returns:
+            (4, 4) matrix using column vectors, None if not available
+        """
+        return None
+    
+    def viewport_matrix(self)->_ext.typing.Optional[_ext.npt.NDArray[_ext.numpy.float32]]:
+        """Normalized device coordinates to screen 4x4 matrix, optional
+        
+        Returns:
+            (4, 4) matrix using column vectors, None if not available
+        """
+        return None
+    
     @_ext.abc.abstractmethod
     def screen_to_world(self, screen_position:_ext.types.Vector2fCompat, depth_point:_ext.types.Vector3f)->_ext.types.Vector3f:
         """From a position in the screen, return a tuple representing the ray origin and direction
@@ -48,3 +75,38 @@ class IViewport(_ext.abc.ABC):
             Vector2d screen_position
         """
         pass
+    
+    def world_to_screen_many(self, world_positions:_ext.npt.ArrayLike)->_ext.npt.NDArray[_ext.numpy.float32]:
+        """Project many world positions to the screen
+        This calls world_to_screen for each point, re-implement it with a single matrix multiply where possible
+
+        Args:
+            world_positions: (N, 3) world positions
+
+        Returns:
+            (N, 2) float32 screen positions
+        """
+        points = _ext.types.as_vector3f_array(world_positions)
+        result = _ext.numpy.empty((len(points), 2), dtype=_ext.numpy.float32)
+        for index, point in enumerate(points):
+            result[index] = _ext.types.as_vector2f(self.world_to_screen(point), copy=False)
+        return result
+    
+    def screen_to_ray_many(self, screen_positions:_ext.npt.ArrayLike)->_ext.typing.Tuple[_ext.npt.NDArray[_ext.numpy.float32]]:
+        """Rays for many screen positions
+        This calls screen_to_ray for each point, re-implement it with a single matrix multiply where possible
+
+        Args:
+            screen_positions: (N, 2) screen positions
+
+        Returns:
+            (N, 3) float32 origins, (N, 3) float32 directions
+        """
+        points = _ext.types.as_vector2f_array(screen_positions)
+        origins = _ext.numpy.empty((len(points), 3), dtype=_ext.numpy.float32)
+        directions = _ext.numpy.empty((len(points), 3), dtype=_ext.numpy.float32)
+        for index, point in enumerate(points):
+            origin, direction = self.screen_to_ray(point)
+            origins[index] = _ext.types.as_vector3f(origin, copy=False)
+            directions[index] = _ext.types.as_vector3f(direction, copy=False)
+        return origins, directions
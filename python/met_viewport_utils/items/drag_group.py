@@ -0,0 +1,97 @@
+# copyright (c) 2024 Alex Telford, http://minimaleffort.tech
+"""Moving every selected item with one drag
+
+Pressing a selected Draggable item starts a DragGroup of the selected Draggable items.
+Items using the default PointItem._get_drag_data and _drag_move have their start
+positions captured in one (N, 3) array, each mouse move adds the delta with a single
+numpy operation and writes the rows back without going through the position converter.
+Items overriding either method are moved by their own _drag_move.
+"""
+from __future__ import annotations
+class _ext:
+    """ External Dependencies """
+    import numpy
+    from typing import Iterable
+    from met_viewport_utils.constants import KeyboardModifier, ItemState
+    from met_viewport_utils.algorithm import types
+
+
+class DragGroup(object):
+    """ Items moved together by one drag
+
+    Items with a parent in the group are skipped, they already move with the parent.
+
+    Args:
+        items(Iterable[PointItem]): items to move, in drag order
+    """
+    def __init__(self, items:_ext.Iterable):
+        from met_viewport_utils.items.point_item import PointItem
+        items = dict.fromkeys(items)
+        self.items = []  # Moved together
+        self.custom = []  # (item, drag data), moved by their own _drag_move
+        for item in items:
+            if any(parent in items for parent in item.iter_parents(PointItem)):
+                continue
+            if (type(item)._drag_move is PointItem._drag_move
+                    and type(item)._get_drag_data is PointItem._get_drag_data):
+                self.items.append(item)
+            else:
+                self.custom.append((item, item._get_drag_data()))
+        if self.items:
+            self.start_positions = _ext.types.as_vector3f_array([item.position for item in self.items])
+        else:
+            self.start_positions = _ext.numpy.empty((0, 3), dtype=_ext.numpy.float32)
+        self._positions = _ext.numpy.empty_like(self.start_positions)
+        # Classes redefining position are set through their own descriptor, so its notify runs
+        self._bulk_items = []
+        self._set_items = []  # (item, row)
+        bulk_rows = []
+        for row, item in enumerate(self.items):
+            if type(item).position is PointItem.position:
+                self._bulk_items.append(item)
+                bulk_rows.append(row)
+            else:
+                self._set_items.append((item, row))
+        self._bulk_rows = None if len(bulk_rows) == len(self.items) else _ext.numpy.array(bulk_rows, dtype=_ext.numpy.intp)
+
+    def __len__(self)->int:
+        return len(self.items) + len(self.custom)
+
+    def __iter__(self):
+        yield from self.items
+        for item, _ in self.custom:
+            yield item
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({len(self)} items) at {hex(id(self))}"
+
+    def start(self):
+        """Set ItemState.Dragging on every item"""
+        for item in self:
+            item.state |= _ext.ItemState.Dragging
+
+    def end(self):
+        """Clear ItemState.Dragging on every item"""
+        for item in self:
+            item.state &= ~_ext.ItemState.Dragging
+
+    def move(self, viewport, delta:_ext.types.Vector2f, modifier:_ext.KeyboardModifier):
+        """Move every item by delta from its start position
+
+        Args:
+            viewport(IViewport): passed to custom _drag_move
+            delta(Vector2f): offset from the start of the drag
+            modifier(KeyboardModifier)
+        """
+        from met_viewport_utils.items.point_item import PointItem
+        positions = self._positions
+        _ext.numpy.add(self.start_positions, _ext.types.as_vector3f(delta, copy=False), out=positions)
+        if self._bulk_items:
+            # Rows are copied into each item's position in place, notify is replaced by one invalidation
+            bulk_positions = positions if self._bulk_rows is None else positions[self._bulk_rows]
+            PointItem.position.set_many_silent(self._bulk_items, bulk_positions)
+            PointItem._invalidate_global_caches(self._bulk_items)
+        for item, row in self._set_items:
+            item.position = positions[row]
+        for item, data in self.custom:
+            item._drag_move(viewport, data, delta, modifier)
@@ -0,0 +1,127 @@
+# copyright (c) 2024 Alex Telford, http://minimaleffort.tech
+"""Single pass mouse event dispatch over an item hierarchy
+
+Each item is visited once per event, parents before children in the Capture phase
+and children before parents in the Bubble phase.
+Items receive events through a hook per event type, eg: _mouse_move_event(event),
+items without the hook are traversed but not notified.
+"""
+from __future__ import annotations
+class _ext:
+    """ External Dependencies """
+    from dataclasses import dataclass
+    from typing import Any
+    from met_viewport_utils import instrument
+    from met_viewport_utils.constants import (
+        EventPhase,
+        KeyboardModifier,
+        MouseButton,
+        MouseEventType)
+    from met_viewport_utils.algorithm import types
+
+
+# Item hook called for each event type
+EVENT_HOOKS = {
+    _ext.MouseEventType.Press: "_mouse_press_event",
+    _ext.MouseEventType.Release: "_mouse_release_event",
+    _ext.MouseEventType.Move: "_mouse_move_event",
+}
+
+
+@_ext.dataclass
+class MouseEvent:
+    """ Mouse event passed to item hooks
+
+    Args:
+        type(MouseEventType)
+        viewport(IViewport): viewport the event occurred in
+        screen_position(Vector2f): mouse position on screen
+        local_position(Vector2f): mouse position relative to the parent of the current item
+        button(MouseButton): button pressed or released
+        modifier(KeyboardModifier)
+        phase(EventPhase): set by the dispatcher
+        root(IHierarchyItem): item the event was dispatched from, set by the dispatcher
+        accepted(bool): True once any item accepted the event
+        hit_test(HitTest): items under the cursor for Move events, tested before dispatch
+        screen_positions(Dict[IHierarchyItem, Vector2f]): screen positions computed before dispatch
+        tracked(List[IHierarchyItem]): items that stored the local mouse position, recorded if not None
+        reusable(bool): False once an item's result depends on more than the scene and the cursor position
+    """
+    type:_ext.MouseEventType
+    viewport:_ext.Any
+    screen_position:_ext.types.Vector2f
+    local_position:_ext.types.Vector2f
+    button:_ext.MouseButton = _ext.MouseButton.NoButton
+    modifier:_ext.KeyboardModifier = _ext.KeyboardModifier.NoKeyboardModifier
+    phase:_ext.EventPhase = _ext.EventPhase.Capture
+    root:_ext.Any = None
+    accepted:bool = False
+    hit_test:_ext.Any = None
+    screen_positions:_ext.Any = None
+    tracked:_ext.Any = None
+    reusable:bool = True
+
+    def __post_init__(self):
+        self.screen_position = _ext.types.as_vector2f(self.screen_position)
+        self.local_position = _ext.types.as_vector2f(self.local_position)
+
+
+class EventDispatcher(object):
+    """ Dispatches mouse events to a hierarchy, visiting each item once
+
+    For every item with the event hook:
+        Capture: hook(event) is called parents first, return False to skip
+            the item's descendants and its Bubble phase
+        Bubble: hook(event) is called children first, return True to accept the event
+
+    The local position of a child is the local position of its parent
+    minus the parent's screen position, items without the hook pass it through unchanged.
+    Screen positions are read from event.screen_positions when available.
+    """
+    def dispatch(self, root, event:MouseEvent)->bool:
+        """Dispatch an event to root and its descendants
+
+        Args:
+            root(IHierarchyItem): first item to receive the event
+            event(MouseEvent): event, local_position is relative to the parent of root
+
+        Returns:
+            bool: True if any item accepted the event
+        """
+        hook_name = EVENT_HOOKS[event.type]
+        capture = _ext.EventPhase.Capture
+        bubble = _ext.EventPhase.Bubble
+        viewport = event.viewport
+        screen_positions = event.screen_positions or {}
+        event.root = root
+        visited = 0
+        # (item, local position, hook) entries, a hook marks the Bubble phase of an item
+        stack = [(root, event.local_position, None)]
+        while stack:
+            item, local_position, bubble_hook = stack.pop()
+            if bubble_hook is not None:
+                event.phase = bubble
+                event.local_position = local_position
+                if bubble_hook(event):
+                    event.accepted = True
+                continue
+
+            visited += 1
+            children = item.children
+            hook = getattr(item, hook_name, None)
+            if hook is not None:
+                event.phase = capture
+                event.local_position = local_position
+                if not hook(event):
+                    continue
+                stack.append((item, local_position, hook))
+                if children:
+                    screen_position = screen_positions.get(item)
+                    if screen_position is None:
+                        screen_position = _ext.types.as_vector2f(item.screen_position(viewport), copy=False)
+                    local_position = local_position - screen_position
+            for child in reversed(children):
+                stack.append((child, local_position, None))
+
+        _ext.instrument.count("item.visit", visited)
+        return event.accepted
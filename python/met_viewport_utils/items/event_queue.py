@@ -0,0 +1,122 @@
+# copyright (c) 2024 Alex Telford, http://minimaleffort.tech
+"""Queue of mouse events in front of an item tree
+
+Hosts can deliver several mouse moves per displayed frame, only the latest
+position matters for hover and drag so consecutive moves are collapsed.
+Presses and releases are kept in order, a move before a press is dispatched
+before it and a move after it is queued separately.
+
+Example:
+    queue = EventQueue(root)
+    # Host callbacks
+    queue.mouse_moved(viewport, position, position, modifier)
+    queue.mouse_pressed(viewport, position, position, button, modifier)
+    # Once per frame, eg: before drawing
+    dropped = queue.flush()
+
+Handler return values are not available from the queue, call flush()
+after queueing an event if the host needs to know if it was accepted.
+"""
+from __future__ import annotations
+class _ext:
+    """ External Dependencies """
+    from met_viewport_utils import instrument
+    from met_viewport_utils.constants import KeyboardModifier, MouseButton, MouseEventType
+    from met_viewport_utils.algorithm import types
+    from .event_dispatcher import MouseEvent
+    from .frame_context import FrameContext
+
+
+class EventQueue(object):
+    """ Mouse events for a root item, dispatched by flush()
+
+    Args:
+        root(PointItem): item receiving the events
+
+    Attributes:
+        dropped(int): moves collapsed since the queue was created
+    """
+    def __init__(self, root):
+        self.root = root
+        self.dropped = 0
+        self._events = []  # MouseEvent
+        self._flush_dropped = 0
+
+    def __len__(self)->int:
+        return len(self._events)
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({len(self)} events) at {hex(id(self))}"
+
+    def mouse_pressed(self,
+                      viewport,
+                      local_position:_ext.types.Vector2f,
+                      screen_position:_ext.types.Vector2f,
+                      button:_ext.MouseButton,
+                      modifier:_ext.KeyboardModifier):
+        """Queue a press, see PointItem.mouse_pressed"""
+        self._events.append(_ext.MouseEvent(
+            _ext.MouseEventType.Press, viewport, screen_position, local_position, button, modifier))
+
+    def mouse_released(self,
+                       viewport,
+                       local_position:_ext.types.Vector2f,
+                       screen_position:_ext.types.Vector2f,
+                       button:_ext.MouseButton,
+                       modifier:_ext.KeyboardModifier):
+        """Queue a release, see PointItem.mouse_released"""
+        self._events.append(_ext.MouseEvent(
+            _ext.MouseEventType.Release, viewport, screen_position, local_position, button, modifier))
+
+    def mouse_moved(self,
+                    viewport,
+                    local_position:_ext.types.Vector2f,
+                    screen_position:_ext.types.Vector2f,
+                    modifier:_ext.KeyboardModifier):
+        """Queue a move, replaces the last queued event if it is a move in the same viewport"""
+        event = _ext.MouseEvent(_ext.MouseEventType.Move, viewport, screen_position, local_position, modifier=modifier)
+        events = self._events
+        if events and events[-1].type is _ext.MouseEventType.Move and events[-1].viewport is viewport:
+            events[-1] = event
+            self.dropped += 1
+            self._flush_dropped += 1
+            _ext.instrument.count("event_queue.dropped")
+            return
+        events.append(event)
+
+    def clear(self)->int:
+        """Discard the queued events without dispatching them
+
+        Returns:
+            int: number of events discarded
+        """
+        count = len(self._events)
+        self._events = []
+        self._flush_dropped = 0
+        return count
+
+    def flush(self)->int:
+        """Dispatch the queued events in order, call this once per frame
+        Events queued by the handlers are dispatched on the next flush.
+        Events in the same viewport share a FrameContext.
+
+        Returns:
+            int: moves dropped since the last flush
+        """
+        events = self._events
+        dropped = self._flush_dropped
+        self._events = []
+        self._flush_dropped = 0
+        root = self.root
+        contexts = {}  # id(viewport): FrameContext
+        for event in events:
+            viewport = contexts.get(id(event.viewport))
+            if viewport is None:
+                viewport = contexts[id(event.viewport)] = _ext.FrameContext.wrap(event.viewport)
+            if event.type is _ext.MouseEventType.Move:
+                root.mouse_moved(viewport, event.local_position, event.screen_position, event.modifier)
+            elif event.type is _ext.MouseEventType.Press:
+                root.mouse_pressed(viewport, event.local_position, event.screen_position, event.button, event.modifier)
+            else:
+                root.mouse_released(viewport, event.local_position, event.screen_position, event.button, event.modifier)
+        return dropped
@@ -1,6 +1,7 @@
 # copyright (c) 2024 Alex Telford, http://minimaleffort.tech
 class _ext:
     """ External Dependencies """
+    import numpy
     from .hud_item import HudItem
     from met_viewport_utils.interfaces import IGPUFont, IViewport
     from met_viewport_utils.shape.rect import Rect
@@ -28,7 +29,7 @@ class FontItem(_ext.HudItem):
     
     text = _ext.typed_property(str, "")
     
-    def global_rect(self)->_ext.Rect:
+    def _compute_global_rect(self)->_ext.Rect:
         return _ext.Rect(
             _ext.types.as_vector2f(self.global_position()),
             self.size,
@@ -39,4 +40,6 @@ class FontItem(_ext.HudItem):
         screen_position = self.screen_position(viewport)
         
         rect = self.font.draw(text, screen_position)
-        self.size = rect.size
+        # Only invalidate the global rect when the text size changes
+        if not _ext.numpy.array_equal(self.size, rect.size):
+            self.size = rect.size
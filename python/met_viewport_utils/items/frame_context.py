@@ -0,0 +1,197 @@
+# copyright (c) 2024 Alex Telford, http://minimaleffort.tech
+"""Per-frame cache of values derived from a viewport
+
+A FrameContext wraps a viewport for one frame, or one event, and is passed anywhere
+a viewport is expected so items, the EventDispatcher and draw code share one cache.
+Item screen positions and rects are memoized by item identity, the viewport rect
+and matrices on first use, everything is cleared by clear() at the end of the frame.
+
+Item entries are also dropped when the item's global position is invalidated,
+eg: while dragging, so moving an item within a frame never reads a stale position.
+Other viewport calls are forwarded to the wrapped viewport unchanged.
+
+Example:
+    with FrameContext(viewport) as context:
+        root.mouse_moved(context, position, position, modifier)
+        root.draw(context)
+
+Mouse handlers wrap a plain viewport in a FrameContext for the duration of the event.
+"""
+from __future__ import annotations
+class _ext:
+    """ External Dependencies """
+    import numpy
+    import typing
+    import numpy.typing as npt
+    from met_viewport_utils.shape.rect import Rect
+    from met_viewport_utils.interfaces import IViewport
+    from met_viewport_utils.algorithm import types
+    from .hit_test import project_items
+
+
+# Marks values that are not cached yet, None is a valid matrix
+_MISSING = object()
+
+
+class FrameContext(_ext.IViewport):
+    """ Viewport wrapper memoizing viewport-derived values for one frame
+
+    Args:
+        viewport(IViewport): viewport to wrap, a FrameContext is unwrapped first
+    """
+    # Calls are forwarded to the wrapped viewport, which records them itself
+    _instrumented = False
+
+    def __init__(self, viewport:_ext.IViewport):
+        if isinstance(viewport, FrameContext):
+            viewport = viewport.viewport
+        self._viewport = viewport
+        self._screen_positions = {}  # item: (global position, Vector2f)
+        self._screen_rects = {}  # item: (global position, Rect)
+        self._viewport_values = {}  # method name: value
+
+    @classmethod
+    def wrap(cls, viewport:_ext.IViewport)->FrameContext:
+        """The viewport if it is already a FrameContext, otherwise a new FrameContext for it"""
+        if isinstance(viewport, FrameContext):
+            return viewport
+        return cls(viewport)
+
+    @property
+    def viewport(self)->_ext.IViewport:
+        """Wrapped viewport"""
+        return self._viewport
+
+    def __enter__(self)->FrameContext:
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.clear()
+
+    def __getattr__(self, name:str):
+        # Host specific viewport methods are forwarded
+        if name.startswith("__") or name == "_viewport":
+            raise AttributeError(name)
+        return getattr(self._viewport, name)
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self._viewport!r}) at {hex(id(self))}"
+
+    def clear(self):
+        """Clear every cached value, call this at the end of the frame or when the camera changes"""
+        self._screen_positions.clear()
+        self._screen_rects.clear()
+        self._viewport_values.clear()
+
+    def _cached(self, cache:dict, item):
+        entry = cache.get(item)
+        if entry is not None and entry[0] is item.global_position():
+            return entry[1]
+        return None
+
+    def screen_position(self, item)->_ext.types.Vector2f:
+        """Memoized item.screen_position
+
+        Args:
+            item(PointItem)
+
+        Returns:
+            Vector2f: read-only array
+        """
+        position = self._cached(self._screen_positions, item)
+        if position is None:
+            position = _ext.types.as_vector2f(item.screen_position(self._viewport))
+            position.flags.writeable = False
+            self._screen_positions[item] = (item.global_position(), position)
+        return position
+
+    def screen_positions(self, items:_ext.typing.Sequence)->_ext.npt.NDArray[_ext.numpy.float32]:
+        """Memoized screen positions of many items, items that are not cached are projected together
+
+        Args:
+            items(Sequence[PointItem])
+
+        Returns:
+            (N, 2) read-only float32 array
+        """
+        result = _ext.numpy.empty((len(items), 2), dtype=_ext.numpy.float32)
+        missing = []
+        missing_indices = []
+        for index, item in enumerate(items):
+            position = self._cached(self._screen_positions, item)
+            if position is None:
+                missing.append(item)
+                missing_indices.append(index)
+            else:
+                result[index] = position
+        if missing:
+            positions = _ext.project_items(missing, self._viewport)
+            result[missing_indices] = positions
+            for item, position in zip(missing, positions):
+                self._screen_positions[item] = (item.global_position(), position)
+        result.flags.writeable = False
+        return result
+
+    def screen_rect(self, item)->_ext.Rect:
+        """Memoized item.screen_rect
+
+        Args:
+            item(PointItem)
+
+        Returns:
+            Rect: position and size are read-only
+        """
+        rect = self._cached(self._screen_rects, item)
+        if rect is None:
+            rect = item.screen_rect(self)
+            rect.position.flags.writeable = False
+            rect.size.flags.writeable = False
+            self._screen_rects[item] = (item.global_position(), rect)
+        return rect
+
+    def _viewport_value(self, name:str):
+        value = self._viewport_values.get(name, _MISSING)
+        if value is _MISSING:
+            value = getattr(self._viewport, name)()
+            if isinstance(value, _ext.numpy.ndarray):
+                # A view so the viewport's own array stays writeable
+                value = value.view()
+                value.flags.writeable = False
+            self._viewport_values[name] = value
+        return value
+
+    def rect(self)->_ext.Rect:
+        """Memoized viewport rect, do not modify it"""
+        return self._viewport_value("rect")
+
+    def view_matrix(self)->_ext.typing.Optional[_ext.npt.NDArray[_ext.numpy.float32]]:
+        """Memoized view matrix, read-only"""
+        return self._viewport_value("view_matrix")
+
+    def projection_matrix(self)->_ext.typing.Optional[_ext.npt.NDArray[_ext.numpy.float32]]:
+        """Memoized projection matrix, read-only"""
+        return self._viewport_value("projection_matrix")
+
+    def viewport_matrix(self)->_ext.typing.Optional[_ext.npt.NDArray[_ext.numpy.float32]]:
+        """Memoized viewport matrix, read-only"""
+        return self._viewport_value("viewport_matrix")
+
+    def world_to_screen(self, world_position:_ext.types.Vector3fCompat)->_ext.types.Vector2f:
+        return self._viewport.world_to_screen(world_position)
+
+    def world_to_screen_many(self, world_positions:_ext.npt.ArrayLike)->_ext.npt.NDArray[_ext.numpy.float32]:
+        if isinstance(self._viewport, _ext.IViewport):
+            return self._viewport.world_to_screen_many(world_positions)
+        # Viewports that only implement world_to_screen
+        return _ext.IViewport.world_to_screen_many(self._viewport, world_positions)
+
+    def screen_to_world(self, screen_position:_ext.types.Vector2fCompat, depth_point:_ext.types.Vector3f)->_ext.types.Vector3f:
+        return self._viewport.screen_to_world(screen_position, depth_point)
+
+    def screen_to_ray(self, screen_position:_ext.types.Vector2fCompat)->_ext.typing.Tuple[_ext.types.Vector3f]:
+        return self._viewport.screen_to_ray(screen_position)
+
+    def screen_to_ray_many(self, screen_positions:_ext.npt.ArrayLike)->_ext.typing.Tuple[_ext.npt.NDArray[_ext.numpy.float32]]:
+        if isinstance(self._viewport, _ext.IViewport):
+            return self._viewport.screen_to_ray_many(screen_positions)
+        return _ext.IViewport.screen_to_ray_many(self._viewport, screen_positions)
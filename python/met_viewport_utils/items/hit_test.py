@@ -0,0 +1,125 @@
+# copyright (c) 2024 Alex Telford, http://minimaleffort.tech
+"""Hit-testing many items against the cursor at once
+
+The result is passed to items on MouseEvent.hit_test so each item
+does not build and test its own screen rect.
+Only items using the default PointItem._is_under_mouse are tested,
+other items return None from HitTest.is_under_mouse and test themselves.
+"""
+from __future__ import annotations
+class _ext:
+    """ External Dependencies """
+    import numpy
+    from typing import Container, Dict, Iterable, Optional, Sequence
+    import numpy.typing as npt
+    from met_viewport_utils.shape.rect_array import RectArray
+    from met_viewport_utils.interfaces import IViewport
+    from met_viewport_utils.algorithm import types
+
+
+class HitTest(object):
+    """ Items under the cursor
+
+    Args:
+        tested(Container): items that were tested
+        hits(Iterable): tested items under the cursor
+        screen_positions(Dict[PointItem, Vector2f]): screen positions computed for the test
+    """
+    def __init__(self, tested:_ext.Container, hits:_ext.Iterable, screen_positions:_ext.Dict=None):
+        self.tested = tested
+        self.hits = set(hits)
+        self.screen_positions = {} if screen_positions is None else screen_positions
+
+    def is_under_mouse(self, item)->_ext.Optional[bool]:
+        """Was the item under the cursor
+
+        Returns:
+            bool: None if the item was not tested
+        """
+        if item not in self.tested:
+            return None
+        return item in self.hits
+
+
+def project_items(items:_ext.Sequence, viewport)->_ext.npt.NDArray[_ext.numpy.float32]:
+    """Screen positions of many items
+    3D items are projected with a single IViewport.world_to_screen_many call,
+    items overriding screen_position are called individually.
+    A FrameContext only projects the items it has not cached.
+
+    Args:
+        items(Sequence[PointItem])
+        viewport(IViewport)
+
+    Returns:
+        (N, 2) read-only float32 array
+    """
+    from met_viewport_utils.items.frame_context import FrameContext
+    if isinstance(viewport, FrameContext):
+        return viewport.screen_positions(items)
+    from met_viewport_utils.items.point_item import PointItem
+    default_screen_position = PointItem.screen_position
+    result = _ext.numpy.empty((len(items), 2), dtype=_ext.numpy.float32)
+    world_indices = []
+    world_positions = []
+    for index, item in enumerate(items):
+        if type(item).screen_position is not default_screen_position:
+            result[index] = _ext.types.as_vector2f(item.screen_position(viewport), copy=False)
+        elif item.is2d:
+            result[index] = item.global_position()[:2]
+        else:
+            world_indices.append(index)
+            world_positions.append(item.global_position())
+    if world_indices:
+        if isinstance(viewport, _ext.IViewport):
+            result[world_indices] = viewport.world_to_screen_many(world_positions)
+        else:
+            # Viewports that only implement world_to_screen
+            result[world_indices] = _ext.IViewport.world_to_screen_many(viewport, world_positions)
+    result.flags.writeable = False
+    return result
+
+
+def batch_hit_test(items:_ext.Iterable, viewport, screen_position:_ext.types.Vector2fCompat)->HitTest:
+    """Test the screen rects of many items with one vectorized comparison
+
+    Every item is projected with project_items, the positions are kept on the result.
+    Rects of plain point handles are built from their screen positions,
+    items overriding screen_rect, eg: HudItem, are collected from screen_rect.
+
+    Args:
+        items(Iterable[PointItem]): items to test, items with a custom _is_under_mouse are only projected
+        viewport(IViewport)
+        screen_position(Vector2f)
+
+    Returns:
+        HitTest
+    """
+    from met_viewport_utils.items.point_item import PointItem
+    default_screen_rect = PointItem.screen_rect
+    items = list(items)
+    positions = project_items(items, viewport)
+    handles = []
+    handle_indices = []
+    rect_items = []
+    rects = []
+    for index, item in enumerate(items):
+        if not item._has_default_hit_test():
+            continue
+        if type(item).screen_rect is default_screen_rect:
+            handles.append(item)
+            handle_indices.append(index)
+        else:
+            rect_items.append(item)
+            rects.append(item.screen_rect(viewport))
+
+    tested = dict.fromkeys(handles)
+    hits = []
+    if handles:
+        mask = _ext.RectArray.from_centers(positions[handle_indices], PointItem._screen_rect_size).contains(screen_position)
+        hits.extend(handles[index] for index in _ext.numpy.flatnonzero(mask))
+    if rect_items:
+        tested.update(dict.fromkeys(rect_items))
+        mask = _ext.RectArray.from_rects(rects).contains(screen_position)
+        hits.extend(rect_items[index] for index in _ext.numpy.flatnonzero(mask))
+    return HitTest(tested, hits, dict(zip(items, positions)))
@@ -1,9 +1,8 @@
 # copyright (c) 2024 Alex Telford, http://minimaleffort.tech
 class _ext:
     """ External Dependencies """
-    import copy
     from typing import overload
-    from met_viewport_utils.constants import Align
+    from met_viewport_utils.constants import Align, PropertyOwnership
     from .point_item import PointItem
     from met_viewport_utils.shape.rect import Rect
     from met_viewport_utils.shape.margins import Margins
@@ -17,11 +16,22 @@ class HudItem(_ext.PointItem):
     def __init__(self):
         super().__init__()
         self.is2d = True
+        self.margins = _ext.Margins()
+    
+    def _margins_changed(self):
+        # In place edits of the margins invalidate the cache too
+        self.margins.set_callback(self._invalidate_global_cache)
+        self._invalidate_global_cache()
             
-    # Properties to be set
-    align:_ext.Align = _ext.typed_property(_ext.Align, default=_ext.Align.Center)
-    margins:_ext.Margins = _ext.typed_property(_ext.Margins, default=_ext.Margins())
-    size:_ext.types.Vector2f = _ext.typed_property(_ext.types.Vector2f, default=[0, 0], converter=_ext.types.as_vector2f)
+    # Properties to be set, these invalidate the cached global position and rect
+    align:_ext.Align = _ext.typed_property(
+        _ext.Align, default=_ext.Align.Center, notify=_ext.PointItem._invalidate_global_cache)
+    margins:_ext.Margins = _ext.typed_property(
+        _ext.Margins, default=_ext.Margins(), notify=_margins_changed)
+    size:_ext.types.Vector2f = _ext.typed_property(
+        _ext.types.Vector2f, default=[0, 0], converter=_ext.types.as_vector2f,
+        ownership=_ext.PropertyOwnership.InPlace, readonly_view=True,
+        notify=_ext.PointItem._invalidate_global_cache)
     
     def local_rect(self)->_ext.Rect:
         return _ext.Rect(self.position, self.size, self.align)
@@ -30,26 +40,45 @@ class HudItem(_ext.PointItem):
         return self.global_rect()
     
     # TODO: rotation
-    def global_position(self)->_ext.types.Vector3f:
+    def _compute_global_position(self)->_ext.types.Vector3f:
         # Map relative to root
         try:
             parent:_ext.PointItem = next(self.iter_parents(_ext.PointItem))
         except StopIteration:
-            return _ext.copy.copy(self.position)
+            return self.position
+        
+        if not isinstance(parent, HudItem):
+            return super()._compute_global_position()
         
+        # Parents are always cached before children, see _invalidate_global_cache
+        parent_rect = parent._global_rect()
         if self.is2d != parent.is2d:
             # Cannot parent a 2d item to 3d or vice versa, stop here to prevent overflow
-            return _ext.copy.copy(self.position)
-        
-        if isinstance(parent, HudItem):
-            rect = parent.global_rect().adjusted(parent.margins)
-            return _ext.types.as_vector3f(rect.point_at(self.align)) + self.position
-        else:
-            return parent.global_position() + self.position
+            return self.position
+        rect = parent_rect.adjusted(parent.margins) if parent.margins else parent_rect
+        return _ext.types.as_vector3f(rect.point_at(self.align)) + self.position
     
     def global_rect(self)->_ext.Rect:
-        # Map relative to root
+        """ Rect relative to the root, this is cached until the position, size or a parent changes
         
+        Returns:
+            Rect: a copy of the cached rect
+        """
+        return self._global_rect().copy()
+    
+    def _global_rect(self)->_ext.Rect:
+        """ Cached global rect, read-only """
+        rect = self._global_rect_cache
+        if rect is None:
+            # Copy so the cache does not share buffers with the item, eg: size
+            rect = self._compute_global_rect().copy()
+            rect.position.flags.writeable = False
+            rect.size.flags.writeable = False
+            self._global_rect_cache = rect
+        return rect
+    
+    def _compute_global_rect(self)->_ext.Rect:
+        # Map relative to root
         return _ext.Rect(
             _ext.types.as_vector2f(self.global_position()),
             self.size)
@@ -80,7 +109,7 @@ class HudItem(_ext.PointItem):
         except StopIteration:
             return value
 
-        this_position = self.global_rect().position
+        this_position = self._global_rect().position
         
         if not isinstance(value, _ext.Rect):
             return local_rect.position + (_ext.types.as_vector2f(value)-this_position)
@@ -97,9 +126,9 @@ class HudItem(_ext.PointItem):
         except StopIteration:
             return value
 
-        parent_rect:_ext.Rect = parent.global_rect()
+        parent_rect:_ext.Rect = parent._global_rect()
         if parent.margins:
-            parent_rect.adjust(parent.margins)
+            parent_rect = parent_rect.adjusted(parent.margins)
         pivot = parent_rect.point_at(self.align)
         local_rect = self.local_rect()
         self_rect = _ext.Rect(pivot + local_rect.position, local_rect.size, self.align)
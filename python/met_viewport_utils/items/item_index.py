@@ -0,0 +1,95 @@
+# copyright (c) 2024 Alex Telford, http://minimaleffort.tech
+"""Spatial index of item screen rects for hover and hit-testing
+
+Set PointItem.spatial_index on a root item to index the 2D PointItems below it,
+mouse moves then only hit-test the items under the cursor instead of every item.
+
+Items are marked dirty when their global position or rect is invalidated,
+eg: position, size or a parent changes, and are updated on the next query.
+3D items depend on the viewport and items overriding _is_under_mouse
+are not indexed, they are still tested directly.
+"""
+from __future__ import annotations
+class _ext:
+    """ External Dependencies """
+    from met_viewport_utils.algorithm.spatial import SpatialIndex, GridIndex
+    from .hit_test import HitTest
+    from met_viewport_utils.algorithm import types
+
+
+class ItemIndex(object):
+    """ Screen rects of the items below a root kept in a SpatialIndex
+
+    Args:
+        index(SpatialIndex): index to store rects in, defaults to a GridIndex
+    """
+    def __init__(self, index:_ext.SpatialIndex=None):
+        self.index:_ext.SpatialIndex = _ext.GridIndex() if index is None else index
+        self._items = {}  # item: None, every PointItem below the root
+        self._dirty = {}  # item: None, items to update on the next query
+
+    def __len__(self)->int:
+        return len(self._items)
+
+    def __contains__(self, item)->bool:
+        return item in self._items
+
+    def is_indexed(self, item)->bool:
+        """Is the item's screen rect stored, False for items that must be tested directly"""
+        return item in self.index and item not in self._dirty
+
+    def add(self, item):
+        """Track an item, its rect is stored on the next update"""
+        item._item_index = self
+        self._items[item] = None
+        self._dirty[item] = None
+
+    def remove(self, item):
+        """Stop tracking an item"""
+        if item._item_index is self:
+            item._item_index = None
+        self._items.pop(item, None)
+        self._dirty.pop(item, None)
+        self.index.discard(item)
+
+    def mark_dirty(self, item):
+        """Update the item's rect on the next query"""
+        self._dirty[item] = None
+
+    def clear(self):
+        for item in self._items:
+            if item._item_index is self:
+                item._item_index = None
+        self._items.clear()
+        self._dirty.clear()
+        self.index.clear()
+
+    def update(self, viewport=None):
+        """Store the rects of dirty items
+
+        Args:
+            viewport(IViewport): passed to screen_rect, 2D items do not use it
+        """
+        if not self._dirty:
+            return
+        dirty = self._dirty
+        self._dirty = {}
+        index = self.index
+        for item in dirty:
+            if item.is2d and item._has_default_hit_test():
+                index.update(item, item.screen_rect(viewport))
+            else:
+                index.discard(item)
+
+    def hit_test(self, viewport, screen_position:_ext.types.Vector2f)->_ext.HitTest:
+        """Indexed items under a screen position, dirty items are updated first
+
+        Args:
+            viewport(IViewport)
+            screen_position(Vector2f)
+
+        Returns:
+            HitTest: items that are not indexed are not tested
+        """
+        self.update(viewport)
+        return _ext.HitTest(self.index, self.index.query_point(screen_position))
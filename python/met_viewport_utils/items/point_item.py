@@ -1,18 +1,100 @@
 # copyright (c) 2024 Alex Telford, http://minimaleffort.tech
 class _ext:
     """ External Dependencies """
-    import copy
     import numpy
+    import math
+    import weakref
     from met_viewport_utils.constants import (
         MouseButton,
         KeyboardModifier,
         InteractionFlags,
         ItemState,
-        Align)
+        Align,
+        PropertyOwnership,
+        MouseEventType,
+        EventPhase)
     from met_viewport_utils.shape.rect import Rect
     from met_viewport_utils.interfaces import IHierarchyItem, IViewport
+    from met_viewport_utils import instrument
     from met_viewport_utils.algorithm.meta import typed_property
     from met_viewport_utils.algorithm import types
+    from .event_dispatcher import EventDispatcher, MouseEvent
+    from .item_index import ItemIndex
+    from .hit_test import batch_hit_test
+    from .frame_context import FrameContext
+    from .selection_model import SelectionModel
+    from .drag_group import DragGroup
+
+
+# Arguments after the positions for each mouse handler
+_HANDLER_ARGS = {
+    "mouse_pressed": lambda event: (event.button, event.modifier),
+    "mouse_released": lambda event: (event.button, event.modifier),
+    "mouse_moved": lambda event: (event.modifier,),
+}
+
+# Overriding any of these receives mouse events, see PointItem._class_interaction
+_MOUSE_METHODS = tuple(_HANDLER_ARGS) + ("_mouse_press_event", "_mouse_release_event", "_mouse_move_event")
+
+# Items are hovered by default, set flags to NoInteraction to skip them in mouse dispatch
+_DEFAULT_FLAGS = _ext.InteractionFlags.TracksMouse
+
+# Bits counted in PointItem._child_interaction
+_INTERACTION_BITS = (
+    _ext.InteractionFlags.Selectable,
+    _ext.InteractionFlags.Draggable,
+    _ext.InteractionFlags.TracksMouse,
+)
+
+
+class _State:
+    """ State shared by every item """
+    # Bumped when anything that can change a hover result changes, see scene_version
+    scene_version = 0
+
+
+def scene_version()->int:
+    """Counter bumped when the position, size, flags, state or hierarchy of any item changes
+
+    Results derived from the scene, eg: hover, can be reused while it is unchanged.
+
+    Returns:
+        int
+    """
+    return _State.scene_version
+
+
+def _cursor_cell(position:_ext.types.Vector2fCompat, cell_size:float)->tuple:
+    x, y = _ext.types.as_vector2f(position, copy=False).tolist()
+    if cell_size > 0:
+        return (_ext.math.floor(x / cell_size), _ext.math.floor(y / cell_size))
+    return (x, y)
+
+
+def _viewport_key(context:_ext.FrameContext):
+    """ Identity, version and matrices of a viewport, None if the projection cannot be compared
+    The wrapped viewport is read so a FrameContext reused after a camera change is not stale
+    """
+    viewport = context.viewport
+    if viewport is None:
+        # 2D only
+        return ()
+    if not isinstance(viewport, _ext.IViewport):
+        return None
+    view = viewport.view_matrix()
+    projection = viewport.projection_matrix()
+    if view is None or projection is None:
+        return None
+    viewport_matrix = viewport.viewport_matrix()
+    rect = viewport.rect()
+    return (
+        id(viewport),
+        # Hosts can bump this for changes the matrices don't show
+        getattr(viewport, "viewport_version", None),
+        view.tobytes(),
+        projection.tobytes(),
+        None if viewport_matrix is None else viewport_matrix.tobytes(),
+        None if rect is None else (rect.position.tobytes(), rect.size.tobytes()))
 
 
 class PointItem(_ext.IHierarchyItem):
@@ -20,71 +102,277 @@ class PointItem(_ext.IHierarchyItem):
     def __init__(self):
         super().__init__()
         self.__drag_start:_ext.types.Vector2f = _ext.types.as_vector2f([0, 0])
-        self.__drag_data = None
+        self.__drag_group:_ext.DragGroup = None
+    
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Subclasses handling mouse events are always dispatched to
+        overrides = any(getattr(cls, name) is not getattr(PointItem, name) for name in _MOUSE_METHODS)
+        cls._class_interaction = _ext.InteractionFlags.TracksMouse if overrides else _ext.InteractionFlags.NoInteraction
+        # Matches the default flags until they are set
+        cls._interaction = cls._subtree_interaction = _DEFAULT_FLAGS | cls._class_interaction
         
-    flags:_ext.InteractionFlags = _ext.typed_property(_ext.InteractionFlags, default=_ext.InteractionFlags.NoInteraction)
-    state:_ext.ItemState = _ext.typed_property(_ext.ItemState, default=_ext.ItemState.Enabled|_ext.ItemState.Visible)
-    is2d:bool = _ext.typed_property(bool, default=False)
+    # Cached global data, cleared by _invalidate_global_cache
+    _global_position_cache:_ext.types.Vector3f = None
+    _global_rect_cache:_ext.Rect = None
+    
+    def _invalidate_global_cache(self):
+        """ Clear the cached global position and rect of this item and its descendants
+        Global data is computed from the parent first, so an item without a cache
+        never has cached descendants and the walk stops there
+        """
+        PointItem._invalidate_global_caches([self])
+    
+    @staticmethod
+    def _invalidate_global_caches(items:list):
+        """ _invalidate_global_cache for many items in a single walk, the scene version is bumped once
+        Items should not be descendants of each other, see DragGroup
+        """
+        _State.scene_version += 1
+        stack = list(items)
+        while stack:
+            item = stack.pop()
+            if isinstance(item, PointItem):
+                if item._global_position_cache is None:
+                    continue
+                item._global_position_cache = None
+                item._global_rect_cache = None
+                if item._item_index is not None:
+                    item._item_index.mark_dirty(item)
+            stack.extend(item.children)
+    
+    def _hierarchy_changed(self):
+        """ Called when this item or a parent is reparented """
+        self._invalidate_global_cache()
+        self._update_interaction_parent()
+        root = self.get_root()
+        index = getattr(root, "_spatial_index", None)
+        if index is not self._item_index:
+            # Moved to or from an indexed root, update this item and its descendants
+            items = [self]
+            items.extend(self.iter_descendants(PointItem))
+            for item in items:
+                if item._item_index is not None:
+                    item._item_index.remove(item)
+                if index is not None:
+                    index.add(item)
+        if _ext.SelectionModel._active:
+            self._prune_selection()
+    
+    def _prune_selection(self):
+        """ Deselect this item and its descendants from models owned by another root
+        Only the moved subtree is visited, selections elsewhere are not affected
+        """
+        owner = self._root_item()
+        items = [self]
+        items.extend(self.iter_descendants(PointItem))
+        moved = {}  # SelectionModel: [item]
+        for item in items:
+            model = item._selection_model
+            if model is not None and model._owner is not None and model.owner is not owner:
+                moved.setdefault(model, []).append(item)
+        for model, model_items in moved.items():
+            model.deselect(model_items)
+    
+    _ancestor_changed = _hierarchy_changed
+    
+    # Interaction of this item and its descendants, see _refresh_interaction
+    _class_interaction:_ext.InteractionFlags = _ext.InteractionFlags.NoInteraction
+    _interaction:_ext.InteractionFlags = _DEFAULT_FLAGS  # flags | _class_interaction
+    _subtree_interaction:_ext.InteractionFlags = _DEFAULT_FLAGS
+    _child_interaction:dict = None  # flag: number of nearest PointItem descendants with it in their subtree
+    _interaction_parent:_ext.weakref.ref = None  # Parent counting this item in _child_interaction
+    
+    def _count_interaction(self, flags:_ext.InteractionFlags, delta:int):
+        if self._child_interaction is None:
+            self._child_interaction = dict.fromkeys(_INTERACTION_BITS, 0)
+        counts = self._child_interaction
+        for flag in _INTERACTION_BITS:
+            if flags & flag:
+                counts[flag] += delta
+    
+    def _refresh_interaction(self):
+        """ Recompute _subtree_interaction after the flags or the child counts change
+        Parents are updated until an aggregate does not change, this is O(depth)
+        """
+        item = self
+        while item is not None:
+            old = item._subtree_interaction
+            new = item._interaction
+            if item._child_interaction is not None:
+                for flag, count in item._child_interaction.items():
+                    if count:
+                        new |= flag
+            if new == old:
+                return
+            item._subtree_interaction = new
+            parent = item._interaction_parent() if item._interaction_parent is not None else None
+            if parent is not None:
+                parent._count_interaction(old, -1)
+                parent._count_interaction(new, 1)
+            item = parent
+    
+    def _update_interaction_parent(self):
+        """ Move this item's aggregate to its new parent after a reparent """
+        old_parent = self._interaction_parent() if self._interaction_parent is not None else None
+        parent = next(self.iter_parents(PointItem), None)
+        if parent is old_parent:
+            return
+        self._interaction_parent = None if parent is None else _ext.weakref.ref(parent)
+        flags = self._subtree_interaction
+        if not flags:
+            return
+        if old_parent is not None:
+            old_parent._count_interaction(flags, -1)
+            old_parent._refresh_interaction()
+        if parent is not None:
+            parent._count_interaction(flags, 1)
+            parent._refresh_interaction()
+    
+    def _flags_changed(self):
+        _State.scene_version += 1
+        self._interaction = self.flags | self._class_interaction
+        self._refresh_interaction()
+        if not self._interaction and self.state & _ext.ItemState.Hovered:
+            # No longer receives moves to clear it
+            self.state &= ~_ext.ItemState.Hovered
+    
+    # Index this item belongs to, see spatial_index
+    _item_index:_ext.ItemIndex = None
+    _spatial_index:_ext.ItemIndex = None
+    
+    @property
+    def spatial_index(self)->_ext.ItemIndex:
+        """ Index of the screen rects of this root and its descendants, used for hover tests
+        
+        Returns:
+            ItemIndex: None if not indexed
+        """
+        return self._spatial_index
+    
+    @spatial_index.setter
+    def spatial_index(self, index:_ext.ItemIndex):
+        if self.parent is not None:
+            raise ValueError("spatial_index can only be set on a root item")
+        if index is self._spatial_index:
+            return
+        if self._spatial_index is not None:
+            self._spatial_index.clear()
+        self._spatial_index = index
+        if index is not None:
+            index.add(self)
+            for item in self.iter_descendants(PointItem):
+                if item._item_index is not None:
+                    item._item_index.remove(item)
+                index.add(item)
+        
+    # Model this item is selected in, see selection_model
+    _selection_model:_ext.SelectionModel = None
+    _owned_selection_model:_ext.SelectionModel = None
+    
+    @property
+    def selection_model(self)->_ext.SelectionModel:
+        """ Selection of the root item, shared by every item below it and created on first use
+        
+        Returns:
+            SelectionModel
+        """
+        owner = self._root_item()
+        model = owner._owned_selection_model
+        if model is None:
+            model = owner._owned_selection_model = _ext.SelectionModel(owner)
+        return model
+    
+    def _root_item(self)->"PointItem":
+        """ Root item owning the selection and drag state, the top most PointItem if the root is not one """
+        root = self.get_root()
+        if isinstance(root, PointItem):
+            return root
+        owner = self
+        for owner in self.iter_parents(PointItem):
+            pass
+        return owner
+    
+    def _state_changed(self):
+        """ Keeps the selection model in sync when Selected is set on the item directly """
+        _State.scene_version += 1
+        selected = bool(self.state & _ext.ItemState.Selected)
+        if selected == (self._selection_model is not None):
+            return
+        if selected:
+            self.selection_model.extend([self])
+        else:
+            self._selection_model.deselect([self])
+    
+    flags:_ext.InteractionFlags = _ext.typed_property(_ext.InteractionFlags, default=_DEFAULT_FLAGS, notify=_flags_changed)
+    state:_ext.ItemState = _ext.typed_property(_ext.ItemState, default=_ext.ItemState.Enabled|_ext.ItemState.Visible, notify=_state_changed)
+    is2d:bool = _ext.typed_property(bool, default=False, notify=_invalidate_global_cache)
     
     # TODO: Store as a transform matrix
-    position:_ext.types.Vector3f = _ext.typed_property(_ext.types.Vector3f, default=[0, 0, 0], converter=_ext.types.as_vector3f)
+    # Written in place and returned as a read-only view, set the property to update it
+    position:_ext.types.Vector3f = _ext.typed_property(
+        _ext.types.Vector3f, default=[0, 0, 0], converter=_ext.types.as_vector3f,
+        ownership=_ext.PropertyOwnership.InPlace, readonly_view=True,
+        notify=_invalidate_global_cache)
     
     # Note this position may not be up to date depending on parent enabled state
     _local_mouse_position:_ext.types.Vector2f = _ext.typed_property(_ext.types.Vector2f, default=[0, 0], converter=_ext.types.as_vector2f)
     
 
     def global_position(self)->_ext.types.Vector3f:
+        """ Position relative to the root, this is cached until the position or a parent changes
+        
+        Returns:
+            Vector3f: read-only array
+        """
+        position = self._global_position_cache
+        if position is not None:
+            return position
+        # Compute uncached parents first so deep hierarchies do not recurse
+        chain = []
+        item = self
+        while item is not None and item._global_position_cache is None:
+            chain.append(item)
+            item = next(item.iter_parents(PointItem), None)
+        for item in reversed(chain):
+            position = _ext.numpy.array(item._compute_global_position(), dtype=_ext.numpy.float32)
+            position.flags.writeable = False
+            item._global_position_cache = position
+        return position
+    
+    def _compute_global_position(self)->_ext.types.Vector3f:
         # Map relative to root
         try:
             parent:PointItem = next(self.iter_parents(PointItem))
         except StopIteration:
-            return _ext.copy.copy(self.position)
+            return self.position
         
+        # Parents are always cached before children, see _invalidate_global_cache
+        parent_position = parent.global_position()
         if self.is2d != parent.is2d:
             # Cannot parent a 2d item to 3d or vice versa, stop here to prevent overflow
-            return _ext.copy.copy(self.position)
-        return parent.global_position() + self.position
+            return self.position
+        return parent_position + self.position
     
     def screen_position(self, viewport:_ext.IViewport)->_ext.types.Vector2f:
+        if isinstance(viewport, _ext.FrameContext):
+            return viewport.screen_position(self)
         if self.is2d:
             return _ext.types.as_vector2f(self.global_position())
         return viewport.world_to_screen(self.global_position())
     
+    # Dispatcher used by the mouse handlers, visits each item once per event
+    event_dispatcher:_ext.EventDispatcher = _ext.EventDispatcher()
+    
     def mouse_pressed(self,
                       viewport:_ext.IViewport,
                       local_position:_ext.types.Vector2f,
                       screen_position:_ext.types.Vector2f,
                       button:_ext.MouseButton,
                       modifier:_ext.KeyboardModifier)->bool:
-        if not self.state & _ext.ItemState.Enabled:
-            return False
-        local_position = _ext.types.as_vector2f(local_position)
-        screen_position = _ext.types.as_vector2f(screen_position)
-        accepted = False
-        for child in self.iter_descendants(PointItem):
-            if isinstance(child, PointItem):
-                if child.mouse_pressed(
-                    viewport,
-                    local_position-self.screen_position(viewport),
-                    screen_position,
-                    button,
-                    modifier
-                ):
-                    accepted = True
-        if not (self.state & _ext.ItemState.Hovered):
-            return accepted
-        
-        if self.flags & _ext.InteractionFlags.Selectable:
-            self._update_selection(modifier)
-            accepted = True
-            
-        if self.flags & _ext.InteractionFlags.Draggable:
-            # TODO: Only set this flag once press and move
-            self.state |= _ext.ItemState.Dragging
-            self.__drag_start = _ext.types.as_vector2f(local_position)
-            self.__drag_data = self._get_drag_data()
-            accepted = True
-        return accepted
+        viewport = _ext.FrameContext.wrap(viewport)
+        event = _ext.MouseEvent(_ext.MouseEventType.Press, viewport, screen_position, local_position, button, modifier)
+        return self.event_dispatcher.dispatch(self, event)
     
     def mouse_released(self,
                        viewport:_ext.IViewport,
@@ -92,62 +380,180 @@ class PointItem(_ext.IHierarchyItem):
                        screen_position:_ext.types.Vector2f,
                        button:_ext.MouseButton,
                        modifier:_ext.KeyboardModifier)->bool:
-        self.state &= ~_ext.ItemState.Dragging
-        if not (self.state & _ext.ItemState.Enabled):
-            return False
-        local_position = _ext.types.as_vector2f(local_position)
-        screen_position = _ext.types.as_vector2f(screen_position)
-        accepted = False
-        for child in self.iter_descendants(PointItem):
-            if child.mouse_released(
-                viewport,
-                local_position-self.screen_position(viewport),
-                screen_position,
-                button,
-                modifier
-            ):
-                accepted = True
-        return accepted
+        viewport = _ext.FrameContext.wrap(viewport)
+        event = _ext.MouseEvent(_ext.MouseEventType.Release, viewport, screen_position, local_position, button, modifier)
+        return self.event_dispatcher.dispatch(self, event)
     
     def mouse_moved(self,
                     viewport:_ext.IViewport,
                     local_position:_ext.types.Vector2f,
                     screen_position:_ext.types.Vector2f,
                     modifier:_ext.KeyboardModifier):
-        if not (self.state & _ext.ItemState.Enabled):
+        viewport = _ext.FrameContext.wrap(viewport)
+        key = self._hover_key(viewport, local_position, screen_position, modifier)
+        if key is not None and key == self._hover_memo:
+            _ext.instrument.count("item.hover_cached")
+            # Hover is unchanged but the position still moved
+            local_position = _ext.types.as_vector2f(local_position)
+            for item in self._hover_tracked:
+                item._local_mouse_position = local_position
             return
-        local_position = _ext.types.as_vector2f(local_position)
-        screen_position = _ext.types.as_vector2f(screen_position)
-        # TODO: Optimize this, not every item has mouse interaction
-        # Also some children need to track the mouse, should support this
-        self._local_mouse_position = local_position
-        if self._is_under_mouse(viewport, local_position, screen_position):
-            self.state |= _ext.ItemState.Hovered
+        event = _ext.MouseEvent(_ext.MouseEventType.Move, viewport, screen_position, local_position, modifier=modifier)
+        event.tracked = []
+        if self._item_index is not None:
+            event.hit_test = self._item_index.hit_test(viewport, event.screen_position)
         else:
-            self.state &= ~_ext.ItemState.Hovered
-
-        for child in self.iter_descendants(PointItem):
-            child.mouse_moved(
-                viewport,
-                local_position-self.screen_position(viewport),
-                screen_position,
-                modifier
-            )
+            # 3D items are projected once for the hit test and the dispatch
+            event.hit_test = _ext.batch_hit_test(self._iter_hover_items(), viewport, event.screen_position)
+            event.screen_positions = event.hit_test.screen_positions
+        self.event_dispatcher.dispatch(self, event)
+        if key is not None and event.reusable:
+            # Hover changes made by this move do not invalidate it
+            self._hover_memo = (_State.scene_version,) + key[1:]
+            self._hover_tracked = event.tracked
+        else:
+            self._hover_memo = None
+            self._hover_tracked = ()
+    
+    # Moves within the same cell of this many pixels reuse the last result while the scene is unchanged,
+    # set to 0 to only reuse the exact same position.
+    # Items with a custom _is_under_mouse or mouse_moved handler are called on every move
+    hover_cell_size:float = 1.0
+    _hover_memo:tuple = None  # Key of the last move dispatched from this item
+    _hover_tracked:tuple = ()  # Items whose local mouse position the last move set
+    _drag_active:bool = False  # Set on the root item while an item below it is dragged
+    
+    def _hover_key(self, viewport:_ext.FrameContext, local_position, screen_position, modifier)->tuple:
+        """ Key of a mouse move for the hover memo
         
-        if not self.state & (_ext.ItemState.Hovered|_ext.ItemState.Dragging):
+        Returns:
+            tuple: None while dragging or if the viewport has no matrices to compare
+        """
+        if self._root_item()._drag_active:
+            # Every move changes the drag
+            return None
+        viewport_key = _viewport_key(viewport)
+        if viewport_key is None:
+            return None
+        cell_size = self.hover_cell_size
+        return (
+            _State.scene_version,
+            _cursor_cell(screen_position, cell_size),
+            _cursor_cell(local_position, cell_size),
+            modifier,
+            viewport_key)
+    
+    def _iter_hover_items(self):
+        """ Items that test hover in this item's dispatch
+        Disabled items and items overriding mouse_moved handle their own descendants,
+        subtrees without interactions are skipped
+        """
+        def skip_descendants(item):
+            return (not (item.state & _ext.ItemState.Enabled)
+                    or not item._subtree_interaction
+                    or type(item).mouse_moved is not PointItem.mouse_moved)
+        if not (self.state & _ext.ItemState.Enabled) or not self._subtree_interaction:
             return
+        if self._interaction:
+            yield self
+        for item in self.prune_descendants(PointItem, prune=skip_descendants):
+            if (item.state & _ext.ItemState.Enabled) and item._interaction:
+                yield item
+    
+    def _forward_to_handler(self, event:_ext.MouseEvent, name:str)->bool:
+        """ Subclasses that override a mouse handler, eg: mouse_pressed, receive it instead of the event hooks
+        The handler is responsible for its own descendants
+        
+        Returns:
+            bool: True if the event was forwarded
+        """
+        if event.root is self or getattr(type(self), name) is getattr(PointItem, name):
+            return False
+        result = getattr(self, name)(
+            event.viewport, event.local_position, event.screen_position, *_HANDLER_ARGS[name](event))
+        if result:
+            event.accepted = True
+        return True
     
-        if (self.flags & _ext.InteractionFlags.Draggable) and (self.state & _ext.ItemState.Dragging):
+    def _mouse_press_event(self, event:_ext.MouseEvent)->bool:
+        """Mouse press hook, see EventDispatcher"""
+        if event.phase is _ext.EventPhase.Capture:
+            if self._forward_to_handler(event, "mouse_pressed"):
+                return False
+            # Subtrees without interactions are skipped
+            return bool(self.state & _ext.ItemState.Enabled) and bool(self._subtree_interaction)
+        
+        if not (self.state & _ext.ItemState.Hovered):
+            return False
+        accepted = False
+        if self.flags & _ext.InteractionFlags.Selectable:
+            self._update_selection(event.modifier)
+            accepted = True
+            
+        if self.flags & _ext.InteractionFlags.Draggable:
+            # TODO: Only set this flag once press and move
+            self.state |= _ext.ItemState.Dragging
+            self.__drag_start = event.local_position.copy()
+            self.__drag_group = self._get_drag_group()
+            self.__drag_group.start()
+            self._root_item()._drag_active = True
+            accepted = True
+        return accepted
+    
+    def _mouse_release_event(self, event:_ext.MouseEvent)->bool:
+        """Mouse release hook, see EventDispatcher"""
+        if event.phase is _ext.EventPhase.Capture:
+            if self._forward_to_handler(event, "mouse_released"):
+                return False
+            self.state &= ~_ext.ItemState.Dragging
+            if self.__drag_group is not None:
+                self.__drag_group.end()
+                self.__drag_group = None
+                self._root_item()._drag_active = False
+            return bool(self.state & _ext.ItemState.Enabled) and bool(self._subtree_interaction)
+        return False
+    
+    def _mouse_move_event(self, event:_ext.MouseEvent)->bool:
+        """Mouse move hook, see EventDispatcher"""
+        if event.phase is _ext.EventPhase.Capture:
+            if self._forward_to_handler(event, "mouse_moved"):
+                # The handler may depend on the exact position
+                event.reusable = False
+                return False
+            if not (self.state & _ext.ItemState.Enabled) or not self._subtree_interaction:
+                return False
+            if not self._interaction:
+                # Only passes the event to interactive descendants
+                return True
+            self._local_mouse_position = event.local_position
+            if event.tracked is not None:
+                event.tracked.append(self)
+            if event.reusable and not self._has_default_hit_test():
+                # Custom hit tests may depend on state outside the scene
+                event.reusable = False
+            hovered = None
+            if event.hit_test is not None:
+                hovered = event.hit_test.is_under_mouse(self)
+            if hovered is None:
+                hovered = self._is_under_mouse(event.viewport, event.local_position, event.screen_position)
+            # Only set the state when it changes
+            if hovered != bool(self.state & _ext.ItemState.Hovered):
+                self.state ^= _ext.ItemState.Hovered
+            return True
+        
+        # Other items in the group are moved by the pressed item
+        if self.__drag_group is not None and (self.state & _ext.ItemState.Dragging):
             delta = self._local_mouse_position - self.__drag_start
-            self._drag_move(viewport, self.__drag_data, delta, modifier)
-        return
+            self.__drag_group.move(event.viewport, delta, event.modifier)
+        return False
     
     def draw(self, viewport:_ext.IViewport):
         return
 
     def _get_drag_data(self):
         """Override this to choose the stored origin data when dragging, defaults to self.position"""
-        return self.position
+        # position is updated in place, keep a copy of the start
+        return self.position.copy()
 
     def _drag_move(self,
                    viewport:_ext.IViewport,
@@ -155,29 +561,46 @@ class PointItem(_ext.IHierarchyItem):
                    delta:_ext.types.Vector2f,
                    modifier:_ext.KeyboardModifier):
         """Override this to change how the drag behaviour behaves"""
-        self.position = _ext.types.as_vector3f(start_data) + _ext.types.as_vector3f(delta)
-        # TODO: move other selected items
-        
+        self.position = _ext.numpy.add(_ext.types.as_vector3f(start_data, copy=False), _ext.types.as_vector3f(delta, copy=False))
+    
+    def _get_drag_group(self)->_ext.DragGroup:
+        """Items moved when this item is dragged, the selected Draggable items if this item is selected
+        Override this to choose the dragged items
+        """
+        model = self._selection_model
+        if model is None:
+            return _ext.DragGroup([self])
+        items = [self]
+        items.extend(item for item in model if item.flags & _ext.InteractionFlags.Draggable)
+        return _ext.DragGroup(items)
 
     def _update_selection(self, modifier:_ext.KeyboardModifier):
-        """ Triggers selection update """
-        root = self.get_root()
+        """ Triggers selection update, only the previously selected items are visited
+        Shift extends the selection, Shift and Ctrl toggles this item, otherwise this item replaces the selection
+        """
+        model = self.selection_model
         if not modifier & _ext.KeyboardModifier.Shift:
-            if isinstance(root, PointItem) and (root.state & _ext.InteractionFlags.Selectable):
-                root.state &= ~_ext.ItemState.Selected
-            
-            for item in root.iter_descendants(PointItem):
-                item.state &= ~_ext.ItemState.Selected
-        
-        if modifier & _ext.KeyboardModifier.Ctrl:
-            item.state ^= _ext.ItemState.Selected
+            model.select([self])
+        elif modifier & _ext.KeyboardModifier.Ctrl:
+            model.toggle([self])
         else:
-            item.state |= _ext.ItemState.Selected
+            model.extend([self])
+    
+    # TODO: Expose point size for mouse interaction
+    _screen_rect_size:_ext.types.Vector2f = _ext.types.as_vector2f((20, 20))
     
     def screen_rect(self, viewport:_ext.IViewport)->_ext.Rect:
-        # TODO: Expose point size for mouse interaction
-        return _ext.Rect(self.screen_position(viewport), _ext.types.as_vector2f((20, 20)), _ext.Align.Center)
+        # Rect copies the arrays before aligning the position in place
+        return _ext.Rect(self.screen_position(viewport), self._screen_rect_size, _ext.Align.Center)
         
     def _is_under_mouse(self, viewport:_ext.IViewport, local_position:_ext.types.Vector2f, screen_position:_ext.types.Vector2f)->bool:
-        """Is this position on top of this item? Overload for custom shapes"""
+        """Is this position on top of this item? Overload for custom shapes
+        Items overloading this are not stored in the spatial index
+        """
+        if isinstance(viewport, _ext.FrameContext):
+            return viewport.screen_rect(self).contains(screen_position)
         return self.screen_rect(viewport).contains(screen_position)
+    
+    def _has_default_hit_test(self)->bool:
+        """Is the hit test the screen_rect, used by the spatial index"""
+        return type(self)._is_under_mouse is PointItem._is_under_mouse and "_is_under_mouse" not in self.__dict__
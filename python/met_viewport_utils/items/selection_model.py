@@ -0,0 +1,181 @@
+# copyright (c) 2024 Alex Telford, http://minimaleffort.tech
+"""Selection of the items below a root
+
+The root PointItem owns a SelectionModel, see PointItem.selection_model.
+Selected items are kept in selection order, so clearing, toggling and extending
+only visit the items involved rather than the whole hierarchy.
+
+ItemState.Selected always matches membership, the model sets the state and
+setting the state on an item updates the model.
+Items reparented below another root are deselected.
+
+Example:
+    model = root.selection_model
+    model.add_callback(lambda added, removed: print(added, removed))
+    with model.batch():
+        model.clear()
+        model.extend(items)  # Notified once
+"""
+from __future__ import annotations
+class _ext:
+    """ External Dependencies """
+    import contextlib
+    import weakref
+    from typing import Callable, Iterable, Iterator, Tuple
+    from met_viewport_utils.constants import ItemState
+
+
+class SelectionModel(object):
+    """ Ordered set of selected items
+
+    Callbacks are called with (added, removed) tuples once per change,
+    or once at the end of the outermost batch().
+
+    Args:
+        owner(PointItem): root item whose descendants can be selected, None to accept any item
+    """
+    # Models with selected items, reparented items are only checked while there are any
+    _active:_ext.weakref.WeakSet = _ext.weakref.WeakSet()
+
+    def __init__(self, owner=None):
+        self._owner = None if owner is None else _ext.weakref.ref(owner)
+        self._items = {}  # item: None, in selection order
+        self._callbacks = []
+        self._batch_depth = 0
+        self._added = {}  # item: None, pending notification
+        self._removed = {}
+
+    @property
+    def owner(self):
+        """Root item the model belongs to"""
+        return None if self._owner is None else self._owner()
+
+    @property
+    def items(self)->_ext.Tuple:
+        """Selected items, in selection order"""
+        return tuple(self._items)
+
+    @property
+    def current(self):
+        """Most recently selected item, None if nothing is selected"""
+        return next(reversed(self._items), None)
+
+    def __len__(self)->int:
+        return len(self._items)
+
+    def __contains__(self, item)->bool:
+        return item in self._items
+
+    def __iter__(self)->_ext.Iterator:
+        return iter(tuple(self._items))
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({len(self)} items) at {hex(id(self))}"
+
+    def add_callback(self, callback:_ext.Callable):
+        """Call callback(added, removed) when the selection changes"""
+        self._callbacks.append(callback)
+
+    def remove_callback(self, callback:_ext.Callable):
+        """Stop calling a callback
+
+        Raises:
+            ValueError: If the callback was not added
+        """
+        self._callbacks.remove(callback)
+
+    @_ext.contextlib.contextmanager
+    def batch(self):
+        """Combine the changes made within the block into one notification"""
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth:
+                self._notify()
+
+    def extend(self, items:_ext.Iterable):
+        """Add items to the selection
+
+        Raises:
+            ValueError: If an item is not below the owner
+        """
+        with self.batch():
+            for item in items:
+                self._add(item)
+
+    def deselect(self, items:_ext.Iterable):
+        """Remove items from the selection, unselected items are ignored"""
+        with self.batch():
+            for item in items:
+                self._remove(item)
+
+    def toggle(self, items:_ext.Iterable):
+        """Select unselected items and deselect selected items
+
+        Raises:
+            ValueError: If an item is not below the owner
+        """
+        with self.batch():
+            for item in items:
+                if item in self._items:
+                    self._remove(item)
+                else:
+                    self._add(item)
+
+    def select(self, items:_ext.Iterable):
+        """Replace the selection
+
+        Raises:
+            ValueError: If an item is not below the owner
+        """
+        items = dict.fromkeys(items)
+        with self.batch():
+            self.deselect([item for item in self._items if item not in items])
+            self.extend(items)
+
+    def clear(self):
+        """Deselect every item"""
+        self.deselect(list(self._items))
+
+    def _add(self, item):
+        if item in self._items:
+            return
+        owner = self.owner
+        if owner is not None and item._root_item() is not owner:
+            raise ValueError(f"{item!r} is not below {owner!r}")
+        if item._selection_model is not None:
+            item._selection_model.deselect([item])
+        self._items[item] = None
+        item._selection_model = self
+        type(item).state.set_silent(item, item.state | _ext.ItemState.Selected)
+        SelectionModel._active.add(self)
+        if item in self._removed:
+            del self._removed[item]
+        else:
+            self._added[item] = None
+
+    def _remove(self, item):
+        if item not in self._items:
+            return
+        del self._items[item]
+        if item._selection_model is self:
+            item._selection_model = None
+        type(item).state.set_silent(item, item.state & ~_ext.ItemState.Selected)
+        if not self._items:
+            SelectionModel._active.discard(self)
+        if item in self._added:
+            del self._added[item]
+        else:
+            self._removed[item] = None
+
+    def _notify(self):
+        if not (self._added or self._removed):
+            return
+        added = tuple(self._added)
+        removed = tuple(self._removed)
+        self._added.clear()
+        self._removed.clear()
+        for callback in list(self._callbacks):
+            callback(added, removed)
@@ -6,6 +6,7 @@ class _ext:
     """ External Dependencies """
     from typing import Union
     import math
+    import numpy as np
     from met_viewport_utils.shape.mesh import Mesh2D
     from met_viewport_utils.shape.rect import Rect
     from met_viewport_utils.shape.margins import Margins
@@ -33,8 +34,8 @@ class PointTracer2d(object):
         # todo: keep track of points as a path
         
     position = _ext.typed_property(_ext.types.Vector2f, default=[0, 0], converter=_ext.types.as_vector2f)
-    x = _ext.alias_property(position, "x")
-    y = _ext.alias_property(position, "y")
+    x = _ext.alias_property(position, index=0)
+    y = _ext.alias_property(position, index=1)
     
     def move_to(self, position:_ext.types.Vector2fCompat, ref:str=None)->_ext.types.Vector2fCompat:
         """ Move to a position, optionally set a reference point
@@ -46,9 +47,9 @@ class PointTracer2d(object):
         Returns:
             self
         """
-        self.position = _ext.types.as_vector2f(position)
+        self.position = position
         if ref:
-            self._refs[ref] = _ext.types.as_vector2f(self.position)
+            self._refs[ref] = self.position.copy()
         return self.position
     
     def move_by(self, offset:_ext.types.Vector2fCompat, ref:str=None)->_ext.types.Vector2fCompat:
@@ -63,7 +64,7 @@ class PointTracer2d(object):
         """
         self.position = self.position + _ext.types.as_vector2f(offset)
         if ref:
-            self._refs[ref] = _ext.types.as_vector2f(self.position)
+            self._refs[ref] = self.position.copy()
         return self.position
     
     def ref(self, name:str)->_ext.types.Vector2fCompat:
@@ -183,20 +184,14 @@ def circle2d(rect:_ext.Rect, divisions:int=32) ->_ext.Mesh2D:
     center = rect.center()
     radius = rect.width / 2.0
     increment = _ext.math.radians(360.0 / divisions)
-    points = [center]
-    indices = []
+    angles = _ext.np.arange(divisions+1) * increment
+    ring = _ext.types.as_vector2f_array(
+        _ext.np.column_stack((_ext.np.cos(angles), _ext.np.sin(angles))) * radius + center)
+    points = [center] + list(ring)
     point_meta_data = [{"angle": 0.0, "center": True}]
-    
-    for i in range(divisions+1):
-        angle = i * increment
-        x = center[0] + radius * _ext.math.cos(angle)
-        y = center[1] + radius * _ext.math.sin(angle)
-        points.append(_ext.types.as_vector2f((x, y)))
-        point_meta_data.append({"angle": angle, "center": False})
-        if i > 0:
-            indices.append((0, i-1, i))
-            
-    indices.append((0, i, 1))
+    point_meta_data += [{"angle": angle, "center": False} for angle in angles.tolist()]
+    indices = [(0, i-1, i) for i in range(1, divisions+1)]
+    indices.append((0, divisions, 1))
     outline = list(range(divisions+1)[1:]) + [1]
     return _ext.Mesh2D(points, indices=indices, outline_indices=[outline], point_meta_data=point_meta_data)
 
@@ -217,21 +212,17 @@ def arc2d(rect:_ext.Rect, thickness:float, start:float=0, end:float=360, divisio
     radius = rect.width / 2.0
     inner_radius = radius - thickness
     increment = _ext.math.radians((end-start) / divisions)
-    points = []
-    indices = []
+    angles = _ext.math.radians(start) + _ext.np.arange(divisions+1) * increment
+    directions = _ext.np.column_stack((_ext.np.cos(angles), _ext.np.sin(angles)))
+    # Interleave inner and outer points
+    ring = _ext.np.empty((divisions+1, 2, 2))
+    ring[:, 0] = directions * inner_radius + center
+    ring[:, 1] = directions * radius + center
+    points = list(_ext.types.as_vector2f_array(ring.reshape(-1, 2)))
     point_meta_data = []
+    indices = []
     
-    for i in range(divisions+1):
-        angle = _ext.math.radians(start) + i * increment
-        inner_x = center[0] + inner_radius * _ext.math.cos(angle)
-        inner_y = center[1] + inner_radius * _ext.math.sin(angle)
-        outer_x = center[0] + radius * _ext.math.cos(angle)
-        outer_y = center[1] + radius * _ext.math.sin(angle)
-        
-        points += [
-            _ext.types.as_vector2f((inner_x, inner_y)),
-            _ext.types.as_vector2f((outer_x, outer_y))
-        ]
+    for i, angle in enumerate(angles.tolist()):
         point_meta_data += [
             {"angle": angle, "inner": True, "radius": inner_radius},
             {"angle": angle, "inner": False, "radius": radius},
@@ -2,14 +2,39 @@
 from __future__ import annotations
 class _ext:
     """ External Dependencies """
+    import weakref
     from dataclasses import dataclass
 
+_FIELDS = frozenset(("left", "top", "right", "bottom"))
+
 @_ext.dataclass
 class Margins:
     left:int = 0
     top:int = 0
     right:int = 0
     bottom:int = 0
+    
+    # Called when a value is edited in place, see set_callback
+    _callback = None
+    
+    def __setattr__(self, name, value):
+        object.__setattr__(self, name, value)
+        if self._callback is not None and name in _FIELDS:
+            callback = self._callback()
+            if callback is not None:
+                callback()
+    
+    def __copy__(self)->Margins:
+        # Copies are not owned
+        return Margins(self.left, self.top, self.right, self.bottom)
+    
+    def set_callback(self, callback):
+        """Call a method when a value is edited in place, eg: the owning item's cache invalidation
+        
+        Args:
+            callback(Callable): bound method, it is held weakly, None to clear it
+        """
+        object.__setattr__(self, "_callback", None if callback is None else _ext.weakref.WeakMethod(callback))
 
     def __len__(self):
         return 4
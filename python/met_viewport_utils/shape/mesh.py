@@ -14,7 +14,8 @@ class _ext:
     from met_viewport_utils.algorithm import types
     from met_viewport_utils.constants import Align
     from met_viewport_utils.shape.rect import Rect
-    from met_viewport_utils.algorithm.linear import inverse_lerp
+    from met_viewport_utils.algorithm.linear import remap
+    from met_viewport_utils.algorithm.transform import Transform2D
 
 class Mesh2D:
     """ Mesh container utility class
@@ -41,7 +42,6 @@ class Mesh2D:
         self.point_meta_data = point_meta_data or []
         self.bounds = _ext.Rect()
         # Todo: function to resolve points/uvs from indices
-        # Todo: function to rotate/translate/scale mesh
     
     def outlines(self) -> _ext.List[_ext.List[_ext.types.Vector3f]]:
         """ Get the outline points if set
@@ -69,18 +69,9 @@ class Mesh2D:
         if not bounds:
             self.compute_bounds()
             bounds = self.bounds
-        uvs = []
-        left = bounds.left()
-        right = bounds.right()
-        top = bounds.top()
-        bottom = bounds.bottom()
-        for point in self.points:
-            left, point[0], right
-            u = _ext.inverse_lerp(left, right, point[0])
-            v = _ext.inverse_lerp(bottom, top, point[1])
-            uvs.append(_ext.types.as_vector2f((u, v)))
-        
-        self.uvs = uvs
+        points = _ext.types.as_vector2f_array(self.points)
+        uvs = _ext.remap(points, (bounds.bottom_left(), bounds.top_right()))
+        self.uvs = list(uvs)
         return self
     
     def compute_bounds(self)->Mesh2D:
@@ -89,26 +80,13 @@ class Mesh2D:
         Returns:
             self
         """
-        if not self.points:
+        if not len(self.points):
             self.bounds = _ext.Rect()
             return self
 
-        left = self.points[0][0]
-        right = self.points[0][0]
-        top = self.points[0][1]
-        bottom = self.points[0][1]
-        
-        for point in self.points:
-            if point[0] < left:
-                left = point[0]
-            if point[0] > right:
-                right = point[0]
-            if point[1] > top:
-                top = point[1]
-            if point[1] < bottom:
-                bottom = point[1]
-        
-        self.bounds = _ext.Rect((left, bottom), (right-left, top-bottom))
+        points = _ext.types.as_vector2f_array(self.points)
+        minimum = points.min(axis=0)
+        self.bounds = _ext.Rect(minimum, points.max(axis=0) - minimum)
         return self
 
     
@@ -133,7 +111,7 @@ class Mesh2D:
         """ Rotate this mesh by an angle/pivot
         
         Args:
-            angle(float): radians
+            angle(float): degrees
             pivot(Align): pivot on the bounds to rotate around
             
         Returns:
@@ -148,22 +126,32 @@ class Mesh2D:
         """ Rotate this mesh around a specific vector
         
         Args:
-            angle(float): radians
+            angle(float): degrees
             pivot(Vector2f): global point to rotate around
             
         Returns:
             self
         """
-        pivot = _ext.types.as_vector2f(pivot)
-        angle = _ext.math.radians(angle)
+        transform = _ext.Transform2D.from_rotation(_ext.math.radians(angle), pivot)
+        return self.transform_by(transform)
+    
+    def transform_by(self, transform:_ext.Transform2D) ->Mesh2D:
+        """ Transform the xy of every point in a single matrix multiply
         
-        cos_angle = _ext.math.cos(angle)
-        sin_angle = _ext.math.sin(angle)
-        for point in self.points:
-            rel_to_origin = point - pivot
-            point[0] = pivot[0] + (rel_to_origin[0] * cos_angle - rel_to_origin[1] * sin_angle)
-            point[1] = pivot[1] + (rel_to_origin[1] * cos_angle + rel_to_origin[0] * sin_angle)
+        Args:
+            transform(Transform2D)
             
+        Returns:
+            self
+        """
+        if not len(self.points):
+            return self
+        points = _ext.types.as_vector2f_array(self.points)
+        transform.apply(points, out=points)
+        # Points are written back in place so any references to them stay valid
+        for point, value in zip(self.points, points):
+            point[:2] = value
+        
         return self
     
     def scale_by(self, scale:_ext.types.Vector3fCompat, pivot:_ext.Align=_ext.Align.Center) ->Mesh2D:
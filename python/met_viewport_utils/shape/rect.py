@@ -4,7 +4,7 @@ class _ext:
     """ External Dependencies """
     import numpy as np
     from typing import Union, List
-    from met_viewport_utils.constants import Align
+    from met_viewport_utils.constants import Align, PropertyOwnership
     from met_viewport_utils.shape.margins import Margins
     from met_viewport_utils.algorithm.meta import (
         typed_property,
@@ -25,9 +25,9 @@ class Rect(object):
                  size:_ext.types.Vector2fCompat=None,
                  align:_ext.Align=_ext.Align.BottomLeft):
         if position is not None:
-            self.position = _ext.types.as_vector2f(position)
+            self.position = position
         if size is not None:
-            self.size = _ext.types.as_vector2f(size)
+            self.size = size
         # Alignment is not stored, just used for initial computation
         if align & _ext.Align.Right:
             self.position[0] -= self.size[0]
@@ -53,8 +53,13 @@ class Rect(object):
     def __repr__(self):
         return f"{self.__class__.__name__}([{self.x}, {self.y}], [{self.width, self.height}]) at {hex(id(self))}"
     
-    position = _ext.typed_property(_ext.types.Vector2f, default=[0, 0], converter=_ext.types.as_vector2f)
-    size = _ext.typed_property(_ext.types.Vector2f, default=[0, 0], converter=_ext.types.as_vector2f)
+    # Rect edits its buffers in place, references to position/size follow the rect
+    position = _ext.typed_property(
+        _ext.types.Vector2f, default=[0, 0], converter=_ext.types.as_vector2f,
+        ownership=_ext.PropertyOwnership.InPlace)
+    size = _ext.typed_property(
+        _ext.types.Vector2f, default=[0, 0], converter=_ext.types.as_vector2f,
+        ownership=_ext.PropertyOwnership.InPlace)
     
     x = _ext.alias_property(position, index=0)
     y = _ext.alias_property(position, index=1)
@@ -249,7 +254,7 @@ class Rect(object):
         Returns:
             Vector
         """
-        point = self.position
+        point = self.position.copy()
         if pivot & _ext.Align.Right:
             point[0] += self.size[0]
         elif pivot & _ext.Align.HCenter:
@@ -312,6 +317,7 @@ class Rect(object):
         Returns:
             Rect
         """
+        # The properties copy the arrays
         return Rect(self.position, self.size)
     
     def adjust(self, margins:_ext.Union[_ext.Margins,_ext.List[float]]):
@@ -322,9 +328,12 @@ class Rect(object):
         """
         if not isinstance(margins, _ext.Margins):
             margins = _ext.Margins(*margins)
-        offset = _ext.types.as_vector2f((margins.left, margins.bottom))
-        self.position = self.position + offset
-        self.size = self.size - (_ext.types.as_vector2f((margins.right, margins.top)) + offset)
+        position = self.position
+        position[0] += margins.left
+        position[1] += margins.bottom
+        size = self.size
+        size[0] -= margins.left + margins.right
+        size[1] -= margins.bottom + margins.top
     
     def adjusted(self, margins:_ext.Union[_ext.Margins,_ext.List[float]]) ->Rect:
         """return a copy of this rect adjusted to these margins
@@ -0,0 +1,104 @@
+# copyright (c) 2024 Alex Telford, http://minimaleffort.tech
+from __future__ import annotations
+class _ext:
+    """ External Dependencies """
+    import numpy as np
+    from typing import Iterable, Union
+    import numpy.typing as npt
+    from met_viewport_utils.shape.rect import Rect
+    from met_viewport_utils.algorithm import types
+
+
+class RectArray(object):
+    """ Many 2D rects stored as one (N, 4) float32 array for vectorized tests
+
+    Columns are left, bottom, right, top, edges are inclusive like Rect.contains.
+
+    Args:
+        bounds: (N, 4) array of left, bottom, right, top
+    """
+    def __init__(self, bounds:_ext.npt.ArrayLike=None):
+        if bounds is None:
+            bounds = _ext.np.empty((0, 4), dtype=_ext.np.float32)
+        bounds = _ext.np.asarray(bounds, dtype=_ext.np.float32)
+        if bounds.ndim != 2 or bounds.shape[1] != 4:
+            raise ValueError(f"Expected an (N, 4) array, got {bounds.shape}")
+        self.bounds = bounds
+
+    @classmethod
+    def from_rects(cls, rects:_ext.Iterable[_ext.Rect])->RectArray:
+        """Create from Rect instances
+
+        Args:
+            rects(Iterable[Rect])
+
+        Returns:
+            RectArray
+        """
+        rects = list(rects)
+        bounds = _ext.np.empty((len(rects), 4), dtype=_ext.np.float32)
+        if rects:
+            bounds[:, :2] = [rect.position for rect in rects]
+            bounds[:, 2:] = [rect.size for rect in rects]
+            bounds[:, 2:] += bounds[:, :2]
+        return cls(bounds)
+
+    @classmethod
+    def from_centers(cls,
+                     centers:_ext.npt.ArrayLike,
+                     sizes:_ext.Union[_ext.types.Vector2fCompat, _ext.npt.ArrayLike])->RectArray:
+        """Create rects centered on points, matches Rect(center, size, Align.Center)
+
+        Args:
+            centers: (N, 2) centers
+            sizes: (2,) size shared by every rect or (N, 2) sizes
+
+        Returns:
+            RectArray
+        """
+        centers = _ext.types.as_vector2f_array(centers)
+        sizes = _ext.np.asarray(sizes, dtype=_ext.np.float32)
+        bounds = _ext.np.empty((len(centers), 4), dtype=_ext.np.float32)
+        _ext.np.subtract(centers, sizes / 2.0, out=bounds[:, :2])
+        _ext.np.add(bounds[:, :2], sizes, out=bounds[:, 2:])
+        return cls(bounds)
+
+    def __len__(self)->int:
+        return len(self.bounds)
+
+    def __getitem__(self, index:int)->_ext.Rect:
+        left, bottom, right, top = self.bounds[index]
+        return _ext.Rect(_ext.types.as_vector2f([left, bottom]), _ext.types.as_vector2f([right - left, top - bottom]))
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({len(self)} rects) at {hex(id(self))}"
+
+    def contains(self, point:_ext.types.Vector2fCompat)->_ext.npt.NDArray[_ext.np.bool_]:
+        """Which rects contain a point
+
+        Args:
+            point(Vector2f)
+
+        Returns:
+            NDArray[bool]: (N,) mask
+        """
+        point = _ext.types.as_vector2f(point)
+        bounds = self.bounds
+        return ((bounds[:, 0] <= point[0]) & (point[0] <= bounds[:, 2])
+                & (bounds[:, 1] <= point[1]) & (point[1] <= bounds[:, 3]))
+
+    def intersects(self, rect:_ext.Rect)->_ext.npt.NDArray[_ext.np.bool_]:
+        """Which rects intersect another rect, touching edges count as intersecting
+
+        Args:
+            rect(Rect)
+
+        Returns:
+            NDArray[bool]: (N,) mask
+        """
+        left, bottom = rect.position
+        right = left + rect.size[0]
+        top = bottom + rect.size[1]
+        bounds = self.bounds
+        return ((bounds[:, 0] <= right) & (left <= bounds[:, 2])
+                & (bounds[:, 1] <= top) & (bottom <= bounds[:, 3]))
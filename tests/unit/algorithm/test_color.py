@@ -70,3 +70,64 @@ def test_parse_color_edge_cases():
     # Alpha variations
     assert np.allclose(color.parse_color("#FF0000", alpha=0.0), [1.0, 0.0, 0.0, 0.0])
     assert np.allclose(color.parse_color([0.5, 0.5, 0.5, 0.8], alpha=0.2), [0.5, 0.5, 0.5, 0.8])
+
+def test_parse_color_hex_cached():
+    """Test hex colors are cached as read-only arrays"""
+    result = color.parse_color("#00FF00", readonly=True)
+    assert result is color.parse_color("#00FF00", readonly=True)
+    assert result.dtype == np.float32
+    with pytest.raises(ValueError):
+        result[0] = 1.0
+    assert color.parse_color("#00FF00", alpha=0.5, readonly=True) is not result
+    # Copied by default
+    copied = color.parse_color("#00FF00")
+    copied[0] = 1.0
+    assert np.allclose(color.parse_color("#00FF00"), [0.0, 1.0, 0.0, 1.0])
+    assert np.allclose(color.parse_color("#00FF0080"), [0.0, 1.0, 0.0, 128 / 255.0])
+
+def test_parse_color_hex_invalid_length():
+    """Test hex colors must have 6 or 8 digits"""
+    with pytest.raises(ValueError):
+        color.parse_color("#FF00000")
+    with pytest.raises(ValueError):
+        color.parse_color("invalid")
+
+def test_parse_color_grayscale_default_alpha():
+    """Test grayscale integer input without alpha"""
+    assert np.array_equal(color.parse_color(128), [128, 128, 128, 1.0])
+
+def test_parse_color_numpy_integers():
+    """Test numpy integer scalars are grayscale colors"""
+    values = np.array([0, 1], dtype=np.uint32)
+    assert np.allclose(color.parse_color(values[1]), [1, 1, 1, 1])
+    assert np.allclose(color.parse_colors(list(values)), [[0, 0, 0, 1], [1, 1, 1, 1]])
+
+def test_parse_colors_mixed():
+    """Test parsing a mixed list of colors"""
+    result = color.parse_colors(["#FF0000", "#00FF0080", 128, [0.0, 0.0, 1.0], (0.1, 0.2, 0.3, 0.4)])
+    assert result.shape == (5, 4)
+    assert result.dtype == np.float32
+    assert np.allclose(result[0], [1.0, 0.0, 0.0, 1.0])
+    assert np.allclose(result[1], [0.0, 1.0, 0.0, 128 / 255.0])
+    assert np.allclose(result[2], [128, 128, 128, 1.0])
+    assert np.allclose(result[3], [0.0, 0.0, 1.0, 1.0])
+    assert np.allclose(result[4], [0.1, 0.2, 0.3, 0.4])
+
+def test_parse_colors_matches_parse_color():
+    """Test batch parsing matches parsing one at a time"""
+    colors = ["#123456", "#ABCDEF12", 0, [0.5, 0.5, 0.5]]
+    for alpha in (None, 0.25):
+        expected = [color.parse_color(each, alpha=alpha) for each in colors]
+        assert np.allclose(color.parse_colors(colors, alpha=alpha), expected)
+
+def test_parse_colors_array():
+    """Test parsing (N, 3) and (N, 4) arrays"""
+    rgb = np.array([[1.0, 0.0, 0.0], [0.0, 1.0, 0.0]])
+    assert np.allclose(color.parse_colors(rgb), [[1, 0, 0, 1], [0, 1, 0, 1]])
+    rgba = np.array([[1.0, 0.0, 0.0, 0.5]])
+    assert np.allclose(color.parse_colors(rgba), rgba)
+    with pytest.raises(ValueError):
+        color.parse_colors(np.zeros((2, 2)))
+    with pytest.raises(ValueError):
+        color.parse_colors([[1.0, 0.0]])
+    assert color.parse_colors([]).shape == (0, 4)
@@ -1,3 +1,4 @@
+import numpy as np
 from met_viewport_utils.algorithm import linear
 
 def test_lerp_basic():
@@ -54,3 +55,51 @@ def test_clamp_edge_cases():
     assert linear.clamp(10, 0, 10) == 10  # At max
     assert linear.clamp(5, 5, 5) == 5  # Same min/max
     assert linear.clamp(-5, -10, 0) == -5  # Negative range
+
+def test_lerp_array():
+    """Test lerp broadcasts over arrays"""
+    result = linear.lerp(np.array([0.0, 10.0]), np.array([10.0, 20.0]), 0.5)
+    assert np.allclose(result, [5.0, 15.0])
+    assert np.allclose(linear.lerp(0, 10, [0.0, 0.25, 1.0]), [0.0, 2.5, 10.0])
+
+def test_inverse_lerp_array():
+    """Test inverse lerp on arrays with degenerate ranges"""
+    result = linear.inverse_lerp(np.array([0.0, 5.0]), np.array([10.0, 5.0]), np.array([5.0, 5.0]))
+    assert np.allclose(result, [0.5, 0.0])
+    assert np.allclose(linear.inverse_lerp(0, 10, np.array([0, 5, 10])), [0.0, 0.5, 1.0])
+
+def test_scale_number_array():
+    """Test scale_number on arrays with degenerate ranges"""
+    result = linear.scale_number(np.array([5.0, 5.0]), np.array([0.0, 5.0]), np.array([10.0, 5.0]), 100, 200)
+    assert np.allclose(result, [150.0, 100.0])
+
+def test_remap():
+    """Test remapping with per column ranges"""
+    points = np.array([[0, 0], [2, 1], [1, 0.5]], dtype=np.float32)
+    result = linear.remap(points, ([0, 0], [2, 1]))
+    assert result.dtype == np.float32
+    assert np.allclose(result, [[0, 0], [1, 1], [0.5, 0.5]])
+    # Degenerate column maps to the destination minimum
+    result = linear.remap(points, ([0, 1], [2, 1]), ([0, -1], [10, 1]))
+    assert np.allclose(result[:, 0], [0, 10, 5])
+    assert np.allclose(result[:, 1], [-1, -1, -1])
+    # Integer input returns floats
+    assert np.allclose(linear.remap([0, 5, 10], (0, 10)), [0.0, 0.5, 1.0])
+
+def test_remap_out():
+    """Test remapping into an existing array"""
+    values = np.array([0.0, 5.0, 10.0], dtype=np.float32)
+    out = np.empty_like(values)
+    result = linear.remap(values, (0, 10), (-1, 1), out=out)
+    assert result is out
+    assert np.allclose(out, [-1, 0, 1])
+    linear.remap(values, (0, 10), out=values)
+    assert np.allclose(values, [0.0, 0.5, 1.0])
+
+def test_clamp_array():
+    """Test clamp on arrays"""
+    values = np.array([-5, 5, 15])
+    assert np.array_equal(linear.clamp(values, 0, 10), [0, 5, 10])
+    assert np.array_equal(linear.clamp(values, [0, 6, 0], 10), [0, 6, 10])
+    out = np.empty(3, dtype=values.dtype)
+    assert linear.clamp(values, 0, 10, out=out) is out
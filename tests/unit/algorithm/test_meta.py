@@ -1,5 +1,8 @@
 import pytest
+import numpy as np
 from met_viewport_utils.algorithm import meta
+from met_viewport_utils.algorithm import types
+from met_viewport_utils.constants import PropertyOwnership
 
 def test_typed_property_basic():
     """Test basic typed property functionality"""
@@ -62,6 +65,203 @@ def test_typed_property_notification():
     obj.value = 42
     assert notifications == [42]
 
+def test_typed_property_storage_name():
+    """Test values are stored under a deterministic attribute name"""
+    class TestClass:
+        value = meta.typed_property(int, 0)
+        other = meta.typed_property(int, 0, property_id="_other")
+
+    obj = TestClass()
+    obj.value = 42
+    obj.other = 7
+    assert isinstance(TestClass.value, meta.TypedProperty)
+    assert TestClass.value.key == "_typed_value"
+    assert obj._typed_value == 42
+    assert obj._other == 7
+
+def test_typed_property_slots():
+    """Test typed properties on a class using __slots__"""
+    class TestClass:
+        __slots__ = ("_typed_value",)
+        value = meta.typed_property(list, [1, 2])
+
+    obj = TestClass()
+    assert obj.value == [1, 2]
+    assert obj.value is not TestClass.value.default  # Mutable defaults are copied
+    obj.value = [3]
+    assert obj.value == [3]
+    with pytest.raises(AttributeError):
+        obj.__dict__
+
+def test_typed_property_copy_on_set():
+    """Test mutable values are copied and immutable values are stored"""
+    class TestClass:
+        items = meta.typed_property(list, [])
+        text = meta.typed_property(str, "")
+
+    obj = TestClass()
+    source = [1, 2, 3]
+    obj.items = source
+    assert obj.items == source
+    assert obj.items is not source
+    text = "value"
+    obj.text = text
+    assert obj.text is text
+
+def test_typed_property_disabled_converter():
+    """Test setting the wrong type with the converter disabled"""
+    class TestClass:
+        value = meta.typed_property(int, 0, converter=False)
+
+    obj = TestClass()
+    with pytest.raises(TypeError):
+        obj.value = "42"
+    obj.value = 42
+    assert obj.value == 42
+
+def test_typed_property_set_silent():
+    """Test setting a value without notification"""
+    notifications = []
+
+    class TestClass:
+        value = meta.typed_property(int, 0, notify=lambda instance: notifications.append(instance.value))
+        fixed = meta.typed_property(int, 0, readonly=True)
+
+    obj = TestClass()
+    TestClass.value.set_silent(obj, "5")
+    assert obj.value == 5
+    assert notifications == []
+    TestClass.fixed.set_silent(obj, 3)
+    assert obj.fixed == 3
+
+def test_typed_property_set_many_silent():
+    """Test bulk setting values without notification"""
+    notifications = []
+
+    class TestClass:
+        value = meta.typed_property(int, 0, notify=lambda instance: notifications.append(instance.value))
+        array = meta.typed_property(np.ndarray, np.zeros(3, dtype=np.float32),
+                                    ownership=PropertyOwnership.InPlace, notify=notifications.append)
+
+    objs = [TestClass(), TestClass()]
+    TestClass.value.set_many_silent(objs, ["1", 2])
+    assert [obj.value for obj in objs] == [1, 2]
+    buffer = objs[0].array
+    rows = np.arange(6, dtype=np.float32).reshape(2, 3)
+    TestClass.array.set_many_silent(objs, rows)
+    assert objs[0].array is buffer
+    assert np.array_equal(objs[1].array, [3, 4, 5])
+    rows[1] = 0
+    assert np.array_equal(objs[1].array, [3, 4, 5])
+    assert notifications == []
+
+def test_typed_property_share_ownership():
+    """Test shared values are stored without copying"""
+    class TestClass:
+        items = meta.typed_property(list, [], ownership=PropertyOwnership.Share)
+
+    obj = TestClass()
+    source = [1, 2]
+    obj.items = source
+    assert obj.items is source
+    assert TestClass().items is not TestClass.items.default
+
+def test_typed_property_copy_read_only_array():
+    """Test read-only arrays are copied unless the property shares values"""
+    class TestClass:
+        copied = meta.typed_property(types.Vector4f, [0, 0, 0, 0], converter=types.as_vector4f)
+        shared = meta.typed_property(
+            types.Vector4f, [0, 0, 0, 0], converter=lambda v: types.as_vector4f(v, copy=False),
+            ownership=PropertyOwnership.Share)
+
+    obj = TestClass()
+    source = np.array([1, 0, 0, 1], dtype=np.float32)
+    source.flags.writeable = False
+    obj.copied = source
+    obj.shared = source
+    assert obj.copied is not source
+    obj.copied[3] = 0.5
+    assert obj.shared is source
+
+def test_typed_property_in_place_ownership():
+    """Test arrays are written into the existing buffer"""
+    class TestClass:
+        position = meta.typed_property(
+            types.Vector2f, [0, 0], converter=types.as_vector2f,
+            ownership=PropertyOwnership.InPlace)
+
+    obj = TestClass()
+    buffer = obj.position
+    assert isinstance(buffer, np.ndarray)
+    source = np.array([1, 2], dtype=np.float32)
+    obj.position = source
+    assert obj.position is buffer
+    assert np.array_equal(buffer, [1, 2])
+    source[0] = 5  # Caller array is not referenced
+    assert np.array_equal(obj.position, [1, 2])
+    obj.position = [3]  # Converted values are copied into the buffer
+    assert obj.position is buffer
+    assert np.array_equal(buffer, [3, 0])
+
+def test_typed_property_readonly_view():
+    """Test arrays are returned as read-only views"""
+    class TestClass:
+        position = meta.typed_property(
+            types.Vector2f, [0, 0], converter=types.as_vector2f,
+            ownership=PropertyOwnership.InPlace, readonly_view=True)
+
+    obj = TestClass()
+    view = obj.position
+    with pytest.raises(ValueError):
+        view[0] = 1
+    obj.position = [1, 2]
+    assert np.array_equal(view, [1, 2])
+    # The view is cached until a new array is stored
+    assert obj.position is view
+
+    class CopyClass:
+        position = meta.typed_property(types.Vector2f, [0, 0], converter=types.as_vector2f, readonly_view=True)
+
+    obj = CopyClass()
+    view = obj.position
+    assert obj.position is view
+    obj.position = [1, 2]
+    assert obj.position is not view
+    assert obj.position is obj.position
+
+def test_typed_property_converter_pass_through():
+    """Test values returned as is by the converter are still copied"""
+    class TestClass:
+        position = meta.typed_property(types.Vector2f, [0, 0], converter=types.as_vector2f)
+
+    obj = TestClass()
+    source = np.array([1, 2], dtype=np.float32)
+    obj.position = source
+    assert obj.position is not source
+    assert np.array_equal(obj.position, source)
+
+def test_typed_property_subscripted_type():
+    """Test values matching the origin of a subscripted type skip the fallback conversion"""
+    class TestClass:
+        position = meta.typed_property(types.Vector2f, [0, 0], converter=types.as_vector2f)
+        raw = meta.typed_property(types.Vector2f, None, converter=False)
+
+    prop = TestClass.__dict__["position"]
+    obj = TestClass()
+    source = np.array([1, 2], dtype=np.float32)
+    obj.position = source
+    assert prop._set_actions[np.ndarray] == meta._SET_VALIDATE
+    assert obj.position is not source
+    # Converted arrays are not copied again
+    converted = np.array([1, 2], dtype=np.float64)
+    obj.position = converted
+    assert obj.position.dtype == np.float32
+    # Disabled converters accept the origin type
+    obj.raw = source
+    assert obj.raw is not source
+    with pytest.raises(TypeError):
+        obj.raw = [1, 2]
+
 def test_alias_property_basic():
     """Test basic property aliasing using self reference"""
     class TestClass:
@@ -111,3 +311,74 @@ def test_alias_property_sequence():
     obj.second_item = "updated"
     assert obj.second_item == "updated"
     assert obj.items[1] == "updated"
+
+def test_alias_property_callable_path():
+    """Test alias property paths with attributes and callables"""
+    class Vector:
+        def __init__(self):
+            self.values = [0, 0]
+
+        def get_x(self):
+            return self.values[0]
+
+        def set_x(self, value):
+            self.values[0] = value
+
+    class Component:
+        def __init__(self):
+            self.vector = Vector()
+
+        def ref(self):
+            return self.vector
+
+    class TestClass:
+        def __init__(self):
+            self._component = Component()
+
+        @property
+        def component(self):
+            return self._component
+
+        x = meta.alias_property(component, "ref().get_x()", set_path="ref().set_x(v)")
+        first = meta.alias_property(component, "vector.values", index=0)
+
+    obj = TestClass()
+    obj.x = 5
+    assert obj.x == 5
+    assert obj.first == 5
+    obj.first = 3
+    assert obj.component.vector.values == [3, 0]
+
+def test_alias_property_typed_index():
+    """Test index alias on a typed property"""
+    class TestClass:
+        values = meta.typed_property(list, [1, 2])
+        first = meta.alias_property(values, index=0)
+
+    obj = TestClass()
+    assert obj.first == 1
+    obj.first = 4
+    assert obj.values == [4, 2]
+
+def test_alias_property_invalid():
+    """Test alias property argument validation"""
+    with pytest.raises(ValueError):
+        meta.alias_property("self")
+    with pytest.raises(ValueError):
+        meta.alias_property(None, "value")
+
+def test_lazy_import():
+    """Test modules are imported on first access and cached on the owner"""
+    class TestClass:
+        json = meta.LazyImport("json")
+
+    assert isinstance(TestClass.__dict__["json"], meta.LazyImport)
+    import json
+    assert TestClass.json is json
+    assert TestClass.__dict__["json"] is json
+
+    class Missing:
+        module = meta.LazyImport("met_viewport_utils.does_not_exist")
+
+    with pytest.raises(ImportError):
+        Missing.module
@@ -0,0 +1,100 @@
+import random
+import pytest
+from met_viewport_utils.algorithm.spatial import GridIndex, QuadTreeIndex, as_bounds
+from met_viewport_utils.shape.rect import Rect
+
+INDEX_TYPES = [
+    lambda: GridIndex(cell_size=16),
+    lambda: GridIndex(cell_size=16, max_cells=4),
+    lambda: QuadTreeIndex(max_keys=4),
+    lambda: QuadTreeIndex(bounds=(0, 0, 10, 10), max_keys=2, max_depth=3),
+]
+
+def _random_bounds(rng):
+    left = rng.uniform(-200, 200)
+    bottom = rng.uniform(-200, 200)
+    return (left, bottom, left + rng.uniform(0, 60), bottom + rng.uniform(0, 60))
+
+def _brute_point(bounds, x, y):
+    return {key for key, (l, b, r, t) in bounds.items() if l <= x <= r and b <= y <= t}
+
+def _brute_rect(bounds, query):
+    ql, qb, qr, qt = query
+    return {key for key, (l, b, r, t) in bounds.items() if l <= qr and ql <= r and b <= qt and qb <= t}
+
+def test_as_bounds():
+    """Test rects and sequences convert to float tuples"""
+    assert as_bounds(Rect([1, 2], [3, 4])) == (1.0, 2.0, 4.0, 6.0)
+    assert as_bounds([1, 2, 3, 4]) == (1.0, 2.0, 3.0, 4.0)
+
+@pytest.mark.parametrize("make_index", INDEX_TYPES)
+def test_spatial_index_matches_brute_force(make_index):
+    """Test queries match a linear scan after inserts, moves and removals"""
+    rng = random.Random(1)
+    index = make_index()
+    expected = {}
+    for key in range(300):
+        bounds = _random_bounds(rng)
+        index.insert(key, bounds)
+        expected[key] = bounds
+    for key in range(0, 300, 3):
+        bounds = _random_bounds(rng)
+        index.update(key, bounds)
+        expected[key] = bounds
+    for key in range(1, 300, 7):
+        index.remove(key)
+        del expected[key]
+    assert len(index) == len(expected)
+
+    for _ in range(200):
+        x, y = rng.uniform(-220, 260), rng.uniform(-220, 260)
+        assert set(index.query_point([x, y])) == _brute_point(expected, x, y)
+        query = _random_bounds(rng)
+        result = index.query_rect(query)
+        assert len(result) == len(set(result))
+        assert set(result) == _brute_rect(expected, query)
+
+@pytest.mark.parametrize("make_index", INDEX_TYPES)
+def test_spatial_index_edges(make_index):
+    """Test bounds are inclusive and small moves keep keys queryable"""
+    index = make_index()
+    index.insert("a", Rect([0, 0], [10, 10]))
+    assert index.query_point([10, 10]) == ["a"]
+    assert index.query_point([10.01, 10]) == []
+    assert index.query_rect((10, 10, 20, 20)) == ["a"]
+    index.update("a", (1, 1, 11, 11))
+    assert index.bounds("a") == (1.0, 1.0, 11.0, 11.0)
+    assert index.query_point([0.5, 0.5]) == []
+    assert index.query_point([11, 11]) == ["a"]
+
+@pytest.mark.parametrize("make_index", INDEX_TYPES)
+def test_spatial_index_errors(make_index):
+    """Test duplicate, missing and non finite keys"""
+    index = make_index()
+    index.insert("a", (0, 0, 1, 1))
+    with pytest.raises(KeyError):
+        index.insert("a", (0, 0, 1, 1))
+    with pytest.raises(KeyError):
+        index.remove("b")
+    index.discard("b")
+    with pytest.raises(ValueError):
+        index.insert("b", (0, 0, float("inf"), 1))
+    assert "b" not in index
+    index.clear()
+    assert len(index) == 0
+    assert index.query_point([0, 0]) == []
+
+def test_quadtree_grows():
+    """Test the quadtree root grows to fit keys in every direction"""
+    index = QuadTreeIndex(max_keys=1)
+    index.insert(0, (0, 0, 1, 1))
+    for key, bounds in enumerate([(-100, -100, -99, -99), (500, 500, 501, 501), (-1000, 700, -990, 710)], 1):
+        index.insert(key, bounds)
+    assert index.query_point([-99.5, -99.5]) == [1]
+    assert index.query_point([-995, 705]) == [3]
+    assert len(index.query_rect((-2000, -2000, 2000, 2000))) == 4
+
+def test_grid_invalid_cell_size():
+    """Test the cell size must be positive"""
+    with pytest.raises(ValueError):
+        GridIndex(cell_size=0)
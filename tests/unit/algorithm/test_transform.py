@@ -0,0 +1,73 @@
+import math
+import numpy as np
+import pytest
+from met_viewport_utils.algorithm.transform import Transform2D, Transform3D
+
+def test_transform_identity():
+    """Test default transforms are identity and read-only"""
+    transform = Transform2D()
+    assert np.array_equal(transform.matrix, np.identity(3))
+    assert transform.matrix.dtype == np.float32
+    assert np.array_equal(transform.apply([3, 4]), [3, 4])
+    with pytest.raises(ValueError):
+        transform.matrix[0, 0] = 2
+    assert np.array_equal(Transform3D().matrix, np.identity(4))
+
+def test_transform_invalid_shape():
+    """Test matrices of the wrong size are rejected"""
+    with pytest.raises(ValueError):
+        Transform2D(np.identity(4))
+    with pytest.raises(ValueError):
+        Transform3D(np.identity(3))
+
+def test_transform_compose():
+    """Test composition applies the right hand side first"""
+    translate = Transform2D.from_translation([1, 0])
+    rotate = Transform2D.from_rotation(math.pi / 2)
+    assert np.allclose((rotate @ translate).apply([1, 0]), [0, 2], atol=1e-6)
+    assert np.allclose(translate.compose(rotate).apply([1, 0]), [1, 1], atol=1e-6)
+    assert np.array_equal((rotate @ translate).translation, rotate.apply([1, 0]))
+
+def test_transform_pivot():
+    """Test rotation and scale around a pivot"""
+    rotate = Transform2D.from_rotation(math.pi, pivot=[1, 1])
+    assert np.allclose(rotate.apply([2, 1]), [0, 1], atol=1e-6)
+    scale = Transform3D.from_scale(2, pivot=[1, 1, 1])
+    assert np.allclose(scale.apply([2, 2, 2]), [3, 3, 3])
+    scale = Transform2D.from_scale([2, 3])
+    assert np.allclose(scale.apply([1, 1]), [2, 3])
+
+def test_transform_rotation_3d():
+    """Test axis rotation is right handed"""
+    rotate = Transform3D.from_rotation([0, 0, 2], math.pi / 2)
+    assert np.allclose(rotate.apply([1, 0, 0]), [0, 1, 0], atol=1e-6)
+    rotate = Transform3D.from_rotation([1, 0, 0], math.pi / 2)
+    assert np.allclose(rotate.apply([0, 1, 0]), [0, 0, 1], atol=1e-6)
+    with pytest.raises(ValueError):
+        Transform3D.from_rotation([0, 0, 0], 1)
+
+def test_transform_inverse():
+    """Test the inverse is cached and round trips"""
+    transform = Transform3D.from_rotation([1, 1, 0], 0.5, pivot=[1, 2, 3]) @ Transform3D.from_scale([1, 2, 4])
+    inverse = transform.inverse()
+    assert transform.inverse() is inverse
+    assert inverse.inverse() is transform
+    assert (transform @ inverse).is_approx(Transform3D(), tol=1e-5)
+    with pytest.raises(np.linalg.LinAlgError):
+        Transform2D.from_scale(0).inverse()
+
+def test_transform_apply_batch():
+    """Test batches of points are transformed in one call"""
+    transform = Transform3D.from_translation([1, 2, 3]) @ Transform3D.from_scale(2)
+    points = np.arange(12, dtype=np.float32).reshape(4, 3)
+    result = transform.apply(points)
+    assert result.shape == (4, 3)
+    assert result.dtype == np.float32
+    for point, expected in zip(points, result):
+        assert np.allclose(transform.apply(point), expected)
+    # Vectors ignore translation
+    assert np.allclose(transform.apply_vectors(points), points * 2)
+    # Results can be written in place
+    out = transform.apply(points, out=points)
+    assert out is points
+    assert np.allclose(points, result)
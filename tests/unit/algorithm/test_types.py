@@ -0,0 +1,50 @@
+import numpy as np
+from met_viewport_utils.algorithm import types
+
+def test_as_vector_padding():
+    """Test missing values are filled with zero"""
+    assert np.array_equal(types.as_vector2f([1]), [1, 0])
+    assert np.array_equal(types.as_vector3f([1, 2]), [1, 2, 0])
+    assert np.array_equal(types.as_vector4f((1, 2, 3)), [1, 2, 3, 0])
+    assert types.as_vector3f([1, 2]).dtype == np.float32
+
+def test_as_vector_fast_path():
+    """Test float32 arrays of the correct shape are returned as is"""
+    vec2 = np.array([1, 2], dtype=np.float32)
+    vec3 = np.array([1, 2, 3], dtype=np.float32)
+    vec4 = np.array([1, 2, 3, 4], dtype=np.float32)
+    # Copied by default so the result can be modified
+    copied = types.as_vector2f(vec2)
+    assert copied is not vec2
+    copied += 1
+    assert not np.array_equal(copied, vec2)
+    assert types.as_vector2f(vec2, copy=False) is vec2
+    assert types.as_vector3f(vec3, copy=False) is vec3
+    assert types.as_vector4f(vec4, copy=False) is vec4
+    # Other dtypes and shapes are converted
+    vec3d = np.array([1, 2, 3], dtype=np.float64)
+    assert types.as_vector3f(vec3d) is not vec3d
+    assert types.as_vector2f(vec3) is not vec3
+    assert np.array_equal(types.as_vector2f(vec3), [1, 2])
+
+def test_as_vector_array():
+    """Test batch conversion to a contiguous block"""
+    result = types.as_vector3f_array([[1, 2], [3, 4, 5, 6], np.array([7.0])])
+    assert result.dtype == np.float32
+    assert result.flags.c_contiguous
+    assert np.array_equal(result, [[1, 2, 0], [3, 4, 5], [7, 0, 0]])
+
+    result = types.as_vector2f_array(np.ones((3, 3)))
+    assert result.shape == (3, 2)
+    assert types.as_vector4f_array([[1, 2], [3, 4]]).shape == (2, 4)
+    assert types.as_vector2f_array([]).shape == (0, 2)
+    assert np.array_equal(types.as_vector2f_array([1, 2]), [[1, 0], [2, 0]])
+
+def test_as_vector_array_fast_path():
+    """Test contiguous float32 blocks are returned as is"""
+    block = np.zeros((5, 2), dtype=np.float32)
+    assert types.as_vector2f_array(block) is block
+    view = np.zeros((5, 4), dtype=np.float32)[:, :2]
+    result = types.as_vector2f_array(view)
+    assert result is not view
+    assert result.flags.c_contiguous
@@ -82,6 +82,16 @@ def test_gpu_font_property_resolution(mock_findfont):
     font.weight = FontWeight.Bold
     assert mock_findfont.call_count == 2
 
+def test_gpu_font_without_matplotlib(monkeypatch, caplog):
+    """Test fonts log a warning instead of raising when matplotlib is missing"""
+    from met_viewport_utils.algorithm.meta import LazyImport
+    from met_viewport_utils.interfaces import gpu_font
+    monkeypatch.setattr(gpu_font._ext, "font_manager", LazyImport("met_viewport_utils_missing_module"))
+    font = MockGPUFont()
+    font.family = "Arial"
+    assert font.path is None
+    assert "Failed to import matplotlib" in caplog.text
+
 def test_gpu_font_draw():
     """Test font drawing functionality"""
     font = MockGPUFont()
@@ -116,3 +126,20 @@ def test_gpu_font_draw_align():
         font.align = align
         rect = font.draw(mock_viewport, "Test", pos)
         assert np.array_equal(rect.position, expected_pos)
+
+def test_gpu_font_color():
+    """Test colors are parsed and copied between fonts"""
+    font = MockGPUFont()
+    assert np.array_equal(font.color, [1.0, 1.0, 1.0, 1.0])
+    font.color = "#FF0000"
+    font.shadow_color = [0.0, 0.0, 0.0]
+    assert np.array_equal(font.color, [1.0, 0.0, 0.0, 1.0])
+    assert np.array_equal(font.shadow_color, [0.0, 0.0, 0.0, 1.0])
+    copy = font.copy()
+    assert copy.color is not font.color
+    assert np.array_equal(copy.color, font.color)
+    # Colors can be edited in place
+    font.color[3] = 0.5
+    assert np.array_equal(font.color, [1.0, 0.0, 0.0, 0.5])
+    assert np.array_equal(copy.color, [1.0, 0.0, 0.0, 1.0])
+    assert np.array_equal(copy.shadow_color, font.shadow_color)
@@ -1,5 +1,7 @@
+import gc
 import pytest
-from met_viewport_utils.interfaces.hierachy import IHierarchyItem
+from met_viewport_utils.interfaces.hierachy import IHierarchyItem, ChildList
+from met_viewport_utils.constants import TraversalOrder
 
 class TestIHierarchyItem:
     def test_parent_setter(self):
@@ -41,6 +43,96 @@ class TestIHierarchyItem:
         parent.clear()
         assert parent.children == []
 
+    def test_reparent(self):
+        parent1 = IHierarchyItem()
+        parent2 = IHierarchyItem()
+        child1 = IHierarchyItem()
+        child2 = IHierarchyItem()
+        parent1.append([child1, child2])
+        child1.parent = parent2
+        assert parent1.children == [child2]
+        assert parent2.children == [child1]
+        # Setting the same parent keeps the order
+        child2.parent = parent1
+        parent1.append(child1)
+        child2.parent = parent1
+        assert parent1.children == [child2, child1]
+        assert parent2.children == []
+
+    def test_insert_many(self):
+        parent = IHierarchyItem()
+        children = [IHierarchyItem() for _ in range(4)]
+        parent.append(children[:2])
+        parent.insert(-1, children[2:] + [children[0]])
+        assert parent.children == [children[0], children[2], children[3], children[1]]
+
+    def test_child_list(self):
+        children = [IHierarchyItem() for _ in range(3)]
+        child_list = ChildList(children + [children[0]])
+        assert len(child_list) == 3
+        assert child_list == children
+        assert child_list == ChildList(children)
+        assert child_list != children[:2]
+        assert child_list[1] is children[1]
+        assert child_list[-1] is children[2]
+        assert child_list[:2] == children[:2]
+        assert list(reversed(child_list)) == children[::-1]
+        assert child_list.index(children[2]) == 2
+        assert children[1] in child_list
+        assert IHierarchyItem() not in child_list
+        child_list.remove(children[1])
+        assert child_list == [children[0], children[2]]
+        with pytest.raises(ValueError):
+            child_list.remove(children[1])
+        with pytest.raises(ValueError):
+            child_list.index(children[1])
+        child_list.discard(children[1])
+        # Iteration is over a snapshot, changes apply to the next iteration
+        for child in child_list:
+            child_list.remove(child)
+        assert child_list == []
+
+    def test_child_list_list_api(self):
+        children = [IHierarchyItem() for _ in range(4)]
+        for index, child in enumerate(children):
+            child.name = str(index)
+        child_list = ChildList(children)
+        assert child_list.pop() is children[3]
+        assert child_list.pop(0) is children[0]
+        assert child_list == children[1:3]
+        assert children[3] not in child_list
+        with pytest.raises(IndexError):
+            ChildList().pop()
+        # Slice assignment and deletion
+        child_list[:] = children
+        assert child_list == children
+        child_list[1:3] = [children[2], children[1]]
+        assert child_list == [children[0], children[2], children[1], children[3]]
+        child_list[0] = children[3]  # Repeated items keep their first position
+        assert child_list == [children[3], children[2], children[1]]
+        assert children[0] not in child_list
+        del child_list[0]
+        assert child_list == [children[2], children[1]]
+        assert children[3] not in child_list
+        # Ordering
+        child_list.sort(key=lambda child: child.name)
+        assert child_list == [children[1], children[2]]
+        child_list.reverse()
+        assert child_list == [children[2], children[1]]
+        # Concatenation returns lists
+        assert child_list + [children[0]] == [children[2], children[1], children[0]]
+        assert [children[0]] + child_list == [children[0], children[2], children[1]]
+
+    def test_child_list_insert_while_iterating(self):
+        children = [IHierarchyItem() for _ in range(3)]
+        child_list = ChildList(children[:2])
+        iterated = []
+        for child in child_list:
+            iterated.append(child)
+            child_list.insert(0, children[2])
+        assert iterated == children[:2]
+        assert child_list == [children[2], children[0], children[1]]
+
     def test_get_root(self):
         item1 = IHierarchyItem()
         item2 = IHierarchyItem()
@@ -63,6 +155,94 @@ class TestIHierarchyItem:
         descendants = list(item1.iter_descendants())
         assert descendants == [item2, item4, item3]
 
+    def _tree(self):
+        """ a -> (b -> (d, e), c -> f) """
+        items = {}
+        for name in "abcdef":
+            items[name] = IHierarchyItem()
+            items[name].name = name
+        items["a"].append([items["b"], items["c"]])
+        items["b"].append([items["d"], items["e"]])
+        items["c"].append(items["f"])
+        return items
+
+    def test_iter_descendants_order(self):
+        items = self._tree()
+        def names(generator):
+            return "".join(item.name for item in generator)
+        root = items["a"]
+        assert names(root.iter_descendants()) == "bdecf"
+        assert names(root.iter_descendants(order=TraversalOrder.BreadthFirst)) == "bcdef"
+        assert names(root.iter_descendants(order=TraversalOrder.PostOrder)) == "debfc"
+        assert names(root.iter_descendants(max_depth=1)) == "bc"
+        assert names(root.iter_descendants(order=TraversalOrder.BreadthFirst, max_depth=1)) == "bc"
+        assert names(root.iter_descendants(order=TraversalOrder.PostOrder, max_depth=1)) == "bc"
+        assert names(root.iter_descendants(max_depth=0)) == ""
+
+    def test_iter_descendants_type(self):
+        class Other(IHierarchyItem):
+            pass
+        root = IHierarchyItem()
+        middle = IHierarchyItem()
+        leaf = Other()
+        root.append(middle)
+        middle.append(leaf)
+        # Items of other types are traversed but not yielded
+        for order in TraversalOrder:
+            assert list(root.iter_descendants(Other, order=order)) == [leaf]
+
+    def test_iter_descendants_prune(self):
+        items = self._tree()
+        root = items["a"]
+        generator = root.iter_descendants()
+        visited = [next(generator)]
+        # send returns the next item after pruning b
+        visited.append(generator.send(True))
+        visited.extend(generator)
+        assert [item.name for item in visited] == ["b", "c", "f"]
+
+        generator = root.iter_descendants(order=TraversalOrder.BreadthFirst)
+        visited = [next(generator), next(generator)]
+        visited.append(generator.send(True))
+        visited.extend(generator)
+        assert [item.name for item in visited] == ["b", "c", "d", "e"]
+
+        pruned = root.prune_descendants(prune=lambda item: item.name == "c")
+        assert [item.name for item in pruned] == ["b", "d", "e", "c"]
+        pruned = root.prune_descendants(prune=lambda item: item.name == "f")
+        assert [item.name for item in pruned] == ["b", "d", "e", "c", "f"]
+
+    def test_iter_descendants_deep_chain(self):
+        root = item = IHierarchyItem()
+        for _ in range(10000):
+            child = IHierarchyItem()
+            child.parent = item
+            item = child
+        for order in TraversalOrder:
+            descendants = list(root.iter_descendants(order=order))
+            assert len(descendants) == 10000
+        assert list(root.iter_descendants(order=TraversalOrder.PostOrder))[0] is item
+        assert list(root.iter_descendants())[-1] is item
+        assert len(list(root.iter_descendants(max_depth=100))) == 100
+        assert item.depth == 10000
+
+    def test_iter_descendants_visit_counts(self):
+        """Every descendant is yielded once in every order, at any depth"""
+        for size in (1000, 10000):
+            root = item = IHierarchyItem()
+            chain = []
+            for _ in range(size):
+                child = IHierarchyItem()
+                child.parent = item
+                chain.append(child)
+                item = child
+            for order in TraversalOrder:
+                descendants = list(root.iter_descendants(order=order))
+                assert len(descendants) == size
+                assert len({id(each) for each in descendants}) == size
+            assert list(root.iter_descendants(order=TraversalOrder.PostOrder)) == chain[::-1]
+            assert list(root.iter_descendants(order=TraversalOrder.BreadthFirst)) == chain
+
     def test_iter_parents(self):
         item1 = IHierarchyItem()
         item2 = IHierarchyItem()
@@ -91,3 +271,46 @@ class TestIHierarchyItem:
         assert item1.path == "/item1"
         assert item2.path == "/item1/item2"
         assert item3.path == "/item1/item2/item3"
+
+    def test_path_cache_invalidation(self):
+        item1 = IHierarchyItem()
+        item2 = IHierarchyItem()
+        item3 = IHierarchyItem()
+        item1.name = "item1"
+        item2.name = "item2"
+        item3.name = "item3"
+        item1.append(item2)
+        item2.append(item3)
+        assert item3.path == "/item1/item2/item3"
+        assert item3.depth == 2
+
+        # Renaming invalidates descendants
+        item1.name = "root"
+        assert item3.path == "/root/item2/item3"
+
+        # Reparenting invalidates the moved subtree
+        other = IHierarchyItem()
+        other.name = "other"
+        item2.parent = other
+        assert item3.path == "/other/item2/item3"
+        assert item3.get_root() is other
+        assert item1.path == "/root"
+        item2.parent = None
+        assert item3.path == "/item2/item3"
+        assert item3.depth == 1
+        assert item3.get_root() is item2
+
+    def test_root_deleted(self):
+        root = IHierarchyItem()
+        root.name = "root"
+        child = IHierarchyItem()
+        child.name = "child"
+        root.append(child)
+        assert child.get_root() is root
+        assert child.path == "/root/child"
+        del root
+        gc.collect()
+        assert child.parent is None
+        assert child.get_root() is child
+        assert child.path == "/child"
+        assert child.depth == 0
@@ -0,0 +1,10 @@
+import pytest
+import met_viewport_utils.interfaces as interfaces
+from met_viewport_utils.interfaces.viewport import IViewport
+
+def test_interfaces_lazy_attributes():
+    """Test interfaces resolve on access and unknown names raise"""
+    assert interfaces.IViewport is IViewport
+    assert "IGPUFont" in dir(interfaces)
+    with pytest.raises(AttributeError):
+        interfaces.IDoesNotExist
@@ -0,0 +1,78 @@
+import math
+import pytest
+import numpy as np
+from met_viewport_utils.algorithm.transform import Transform3D
+from met_viewport_utils.constants import InteractionFlags, ItemState, KeyboardModifier
+from met_viewport_utils.interfaces.matrix_viewport import (
+    MatrixViewport, look_at_matrix, orthographic_matrix, perspective_matrix)
+from met_viewport_utils.items.point_item import PointItem
+from met_viewport_utils.shape.rect import Rect
+
+def _perspective_viewport():
+    return MatrixViewport(
+        view=look_at_matrix([0, -10, 0], [0, 0, 0]),
+        projection=perspective_matrix(math.radians(60), 2.0, 0.1, 100.0),
+        rect=Rect([0, 0], [800, 400]))
+
+def test_matrix_viewport_defaults():
+    """Test identity matrices map clip space to the default rect"""
+    viewport = MatrixViewport()
+    assert np.array_equal(viewport.view_matrix(), np.identity(4))
+    assert np.allclose(viewport.world_to_screen([0.5, -0.5, 0]), [0.5, -0.5])
+    with pytest.raises(ValueError):
+        MatrixViewport(view=np.identity(3))
+
+def test_matrix_viewport_orthographic():
+    """Test an orthographic viewport maps world units to pixels"""
+    viewport = MatrixViewport(
+        view=Transform3D.from_translation([-10, 0, 0]),
+        projection=orthographic_matrix(0, 800, 0, 600, -1, 1),
+        rect=Rect([0, 0], [800, 600]))
+    assert np.allclose(viewport.world_to_screen([110, 20, 0]), [100, 20])
+    origin, direction = viewport.screen_to_ray([100, 20])
+    assert np.allclose(origin[:2], [110, 20])
+    assert np.allclose(direction, [0, 0, -1])
+
+def test_matrix_viewport_perspective():
+    """Test perspective projection, rays and depth matching"""
+    viewport = _perspective_viewport()
+    # Looking down +Y, the target is in the center of the screen
+    assert np.allclose(viewport.world_to_screen([0, 0, 0]), [400, 200])
+    points = np.array([[1, 0, 1], [-3, 5, 2], [0.5, 20, -4]], dtype=np.float32)
+    screen = viewport.world_to_screen_many(points)
+    for point, position in zip(points, screen):
+        assert np.allclose(position, viewport.world_to_screen(point))
+        # The ray through the projected point passes through the point
+        origin, direction = viewport.screen_to_ray(position)
+        to_point = point - origin
+        assert np.allclose(np.cross(direction, to_point / np.linalg.norm(to_point)), 0, atol=1e-4)
+        # Unprojecting at the point's depth returns the point
+        assert np.allclose(viewport.screen_to_world(position, point), point, atol=1e-3)
+
+def test_matrix_viewport_behind_camera():
+    """Test points behind the camera do not project"""
+    viewport = _perspective_viewport()
+    assert np.all(np.isnan(viewport.world_to_screen([0, -20, 0])))
+
+def test_matrix_viewport_set_matrices():
+    """Test updating the matrices clears the cached inverse"""
+    viewport = _perspective_viewport()
+    origin, _ = viewport.screen_to_ray([400, 200])
+    viewport.set_matrices(view=look_at_matrix([0, -20, 0], [0, 0, 0]))
+    moved, _ = viewport.screen_to_ray([400, 200])
+    assert moved[1] < origin[1]
+    assert np.allclose(viewport.world_to_screen([0, 0, 0]), [400, 200])
+
+def test_matrix_viewport_items():
+    """Test 3D items hover through a matrix viewport"""
+    viewport = _perspective_viewport()
+    root = PointItem()
+    root.flags = InteractionFlags.TracksMouse
+    child = PointItem()
+    child.flags = InteractionFlags.TracksMouse
+    child.position = [2, 5, 1]
+    child.parent = root
+    screen = viewport.world_to_screen(child.global_position())
+    root.mouse_moved(viewport, screen, screen, KeyboardModifier.NoKeyboardModifier)
+    assert child.state & ItemState.Hovered
+    assert not root.state & ItemState.Hovered
@@ -105,3 +105,25 @@ def test_coordinate_round_trip():
     # Should get back close to original screen coordinates
     assert abs(final_screen[0] - original_screen[0]) < 0.001
     assert abs(final_screen[1] - original_screen[1]) < 0.001
+
+def test_world_to_screen_many():
+    """Test the default batch projection matches single points"""
+    viewport = MockViewport(size=(800, 600))
+    points = [[0, 0, 10], [1, 2, 5], [3, 4, 0]]
+    result = viewport.world_to_screen_many(points)
+    assert result.shape == (3, 2)
+    assert result.dtype == np.float32
+    for point, screen in zip(points, result):
+        assert np.allclose(screen, viewport.world_to_screen(point))
+    assert viewport.world_to_screen_many([]).shape == (0, 2)
+
+def test_screen_to_ray_many():
+    """Test the default batch rays match single points"""
+    viewport = MockViewport(size=(800, 600))
+    points = [[400, 300], [0, 0]]
+    origins, directions = viewport.screen_to_ray_many(points)
+    assert origins.shape == directions.shape == (2, 3)
+    for point, origin, direction in zip(points, origins, directions):
+        single_origin, single_direction = viewport.screen_to_ray(point)
+        assert np.allclose(origin, single_origin)
+        assert np.allclose(direction, single_direction)
@@ -0,0 +1,123 @@
+import numpy as np
+from unittest.mock import Mock
+from met_viewport_utils.constants import InteractionFlags, ItemState, KeyboardModifier, MouseButton
+from met_viewport_utils.items.drag_group import DragGroup
+from met_viewport_utils.items.point_item import PointItem, scene_version
+
+class CustomDrag(PointItem):
+    """Only moves horizontally"""
+    def _drag_move(self, viewport, start_data, delta, modifier):
+        self.position = [start_data[0] + delta[0], start_data[1], start_data[2]]
+
+def _handles(count, cls=PointItem):
+    root = PointItem()
+    root.is2d = True
+    items = []
+    for index in range(count):
+        item = cls()
+        item.is2d = True
+        item.flags = InteractionFlags.Selectable | InteractionFlags.Draggable
+        item.position = [index * 100, 0, 0]
+        item.parent = root
+        items.append(item)
+    return root, items
+
+def test_drag_group_move():
+    """Test default items move together and custom items use their own _drag_move"""
+    root, items = _handles(3)
+    custom = CustomDrag()
+    custom.parent = root
+    group = DragGroup([*items, custom])
+    assert group.items == items
+    assert [item for item, _ in group.custom] == [custom]
+    group.move(None, [1, 2], KeyboardModifier.NoKeyboardModifier)
+    group.move(None, [2, 3], KeyboardModifier.NoKeyboardModifier)
+    assert np.array_equal(items[2].position, [202, 3, 0])
+    assert np.array_equal(items[2].global_position(), [202, 3, 0])
+    assert np.array_equal(custom.position, [2, 0, 0])
+
+def test_drag_group_skips_children():
+    """Test items with a parent in the group move with the parent"""
+    root, items = _handles(2)
+    items[1].parent = items[0]
+    group = DragGroup(items)
+    assert list(group) == [items[0]]
+    group.move(None, [5, 0], KeyboardModifier.NoKeyboardModifier)
+    assert np.array_equal(items[1].global_position(), [105, 0, 0])
+
+def test_drag_group_state():
+    """Test start and end set Dragging on every item"""
+    _, items = _handles(2)
+    group = DragGroup(items)
+    group.start()
+    assert all(item.state & ItemState.Dragging for item in items)
+    group.end()
+    assert not any(item.state & ItemState.Dragging for item in items)
+
+def test_drag_selected_items():
+    """Test dragging a selected item moves every selected draggable item"""
+    root, items = _handles(4)
+    items[3].flags = InteractionFlags.Selectable
+    root.selection_model.extend(items[1:])
+    items[0]._is_under_mouse = Mock(return_value=True)
+    modifier = KeyboardModifier.Shift
+    root.mouse_moved(None, [0, 0], [0, 0], modifier)
+    root.mouse_pressed(None, [0, 0], [0, 0], MouseButton.Left, modifier)
+    assert items[0] in root.selection_model
+    assert items[2].state & ItemState.Dragging
+    root.mouse_moved(None, [5, 5], [5, 5], modifier)
+    assert np.array_equal(items[0].position, [5, 5, 0])
+    assert np.array_equal(items[2].position, [205, 5, 0])
+    # Not draggable
+    assert np.array_equal(items[3].position, [300, 0, 0])
+    root.mouse_released(None, [5, 5], [5, 5], MouseButton.Left, modifier)
+    assert not any(item.state & ItemState.Dragging for item in items)
+
+def test_drag_unselected_item():
+    """Test dragging an item that is not selected only moves that item"""
+    root, items = _handles(2)
+    items[0].flags = InteractionFlags.Draggable
+    root.selection_model.extend(items[1:])
+    items[0]._is_under_mouse = Mock(return_value=True)
+    root.mouse_moved(None, [0, 0], [0, 0], KeyboardModifier.NoKeyboardModifier)
+    root.mouse_pressed(None, [0, 0], [0, 0], MouseButton.Left, KeyboardModifier.NoKeyboardModifier)
+    root.mouse_moved(None, [5, 5], [5, 5], KeyboardModifier.NoKeyboardModifier)
+    assert np.array_equal(items[0].position, [5, 5, 0])
+    assert np.array_equal(items[1].position, [100, 0, 0])
+
+def test_drag_group_single_invalidation():
+    """Test a move invalidates every item in one walk"""
+    root, items = _handles(50)
+    child = PointItem()
+    child.is2d = True
+    child.parent = items[0]
+    assert np.array_equal(child.global_position(), [0, 0, 0])
+    group = DragGroup(items)
+    version = scene_version()
+    group.move(None, [1, 2], KeyboardModifier.NoKeyboardModifier)
+    assert scene_version() == version + 1
+    assert np.array_equal(items[49].global_position(), [4901, 2, 0])
+    assert np.array_equal(child.global_position(), [1, 2, 0])
+
+class SnappedItem(PointItem):
+    """Redefines position to snap to whole units"""
+    @property
+    def position(self):
+        return PointItem.position.__get__(self)
+
+    @position.setter
+    def position(self, value):
+        PointItem.position.__set__(self, np.round(value))
+
+def test_drag_group_position_override():
+    """Test items redefining position are moved through their own setter"""
+    root, items = _handles(2)
+    snapped = SnappedItem()
+    snapped.is2d = True
+    snapped.parent = root
+    group = DragGroup([items[0], snapped, items[1]])
+    assert len(group.items) == 3
+    group.move(None, [1.4, 2.6], KeyboardModifier.NoKeyboardModifier)
+    assert np.array_equal(snapped.position, [1, 3, 0])
+    assert np.array_equal(snapped.global_position(), [1, 3, 0])
+    assert np.allclose(items[1].position, [101.4, 2.6, 0])
@@ -0,0 +1,142 @@
+import numpy as np
+from met_viewport_utils.constants import (
+    EventPhase, InteractionFlags, ItemState, KeyboardModifier, MouseButton, MouseEventType)
+from met_viewport_utils.interfaces.hierachy import IHierarchyItem
+from met_viewport_utils.items.event_dispatcher import EventDispatcher, MouseEvent
+from met_viewport_utils.items.point_item import PointItem
+
+class RecordingItem(IHierarchyItem):
+    """Records hook calls, set prune to skip descendants"""
+    def __init__(self, name, log, offset=(0, 0)):
+        super().__init__()
+        self.name = name
+        self.log = log
+        self.prune = False
+        self.offset = np.array(offset, dtype=np.float32)
+
+    def screen_position(self, viewport):
+        return self.offset
+
+    def _mouse_move_event(self, event):
+        self.log.append((self.name, event.phase, tuple(event.local_position)))
+        if event.phase is EventPhase.Capture:
+            return not self.prune
+        return self.name == "accept"
+
+def _move_event(local_position=(0, 0)):
+    return MouseEvent(MouseEventType.Move, None, [0, 0], local_position)
+
+def test_mouse_event_positions_are_copied():
+    """Test event positions are float32 copies"""
+    position = np.array([1, 2], dtype=np.float32)
+    event = MouseEvent(MouseEventType.Press, None, position, position, MouseButton.Left)
+    assert event.screen_position is not position
+    assert event.local_position.dtype == np.float32
+    assert event.modifier == KeyboardModifier.NoKeyboardModifier
+
+def test_dispatch_order():
+    """Test capture runs parents first and bubble children first"""
+    log = []
+    root = RecordingItem("root", log)
+    a = RecordingItem("a", log)
+    b = RecordingItem("b", log)
+    c = RecordingItem("c", log)
+    root.append([a, b])
+    a.append(c)
+    EventDispatcher().dispatch(root, _move_event())
+    assert [(name, phase) for name, phase, _ in log] == [
+        ("root", EventPhase.Capture),
+        ("a", EventPhase.Capture),
+        ("c", EventPhase.Capture),
+        ("c", EventPhase.Bubble),
+        ("a", EventPhase.Bubble),
+        ("b", EventPhase.Capture),
+        ("b", EventPhase.Bubble),
+        ("root", EventPhase.Bubble),
+    ]
+
+def test_dispatch_prune_and_accept():
+    """Test capture False skips descendants and bubble True accepts"""
+    log = []
+    root = RecordingItem("root", log)
+    pruned = RecordingItem("pruned", log)
+    hidden = RecordingItem("hidden", log)
+    accept = RecordingItem("accept", log)
+    pruned.prune = True
+    root.append([pruned, accept])
+    pruned.append(hidden)
+    event = _move_event()
+    assert EventDispatcher().dispatch(root, event)
+    assert event.accepted
+    assert event.root is root
+    names = [name for name, _, _ in log]
+    assert "hidden" not in names
+    assert names.count("pruned") == 1  # No bubble for pruned items
+
+def test_dispatch_local_position():
+    """Test child local positions subtract the parent screen position"""
+    log = []
+    root = RecordingItem("root", log, offset=(10, 20))
+    passthrough = IHierarchyItem()  # No hooks, does not change the position
+    child = RecordingItem("child", log, offset=(1, 1))
+    grandchild = RecordingItem("grandchild", log)
+    root.append(passthrough)
+    passthrough.append(child)
+    child.append(grandchild)
+    EventDispatcher().dispatch(root, _move_event((100, 100)))
+    captured = {name: position for name, phase, position in log if phase is EventPhase.Capture}
+    assert captured == {
+        "root": (100, 100),
+        "child": (90, 80),
+        "grandchild": (89, 79),
+    }
+
+def test_dispatch_visits_once():
+    """Test each point item in a deep hierarchy is visited once per event"""
+    calls = []
+    class CountingItem(PointItem):
+        def _mouse_move_event(self, event):
+            if event.phase is EventPhase.Capture:
+                calls.append(self)
+            return super()._mouse_move_event(event)
+
+    root = item = CountingItem()
+    root.is2d = True
+    for _ in range(50):
+        child = CountingItem()
+        child.is2d = True
+        child.parent = item
+        item = child
+    root.mouse_moved(None, [0, 0], [0, 0], KeyboardModifier.NoKeyboardModifier)
+    assert len(calls) == 51
+    assert len(set(map(id, calls))) == 51
+
+def test_dispatch_overridden_handler():
+    """Test items overriding a mouse handler receive it instead of the hooks"""
+    class Button(PointItem):
+        def __init__(self):
+            super().__init__()
+            self.pressed = []
+            self.is2d = True
+
+        def mouse_pressed(self, viewport, local_position, screen_position, button, modifier):
+            self.pressed.append((tuple(local_position), button))
+            super().mouse_pressed(viewport, local_position, screen_position, button, modifier)
+            return True
+
+    root = PointItem()
+    root.is2d = True
+    root.position = [5, 5, 0]
+    button = Button()
+    child = PointItem()
+    child.is2d = True
+    root.append(button)
+    button.append(child)
+    child.flags = InteractionFlags.Draggable
+    child.state |= ItemState.Hovered
+    child._is_under_mouse = lambda *args: True
+
+    assert root.mouse_pressed(None, [10, 10], [10, 10], MouseButton.Left, KeyboardModifier.NoKeyboardModifier)
+    assert button.pressed == [((5, 5), MouseButton.Left)]
+    # The button's own dispatch reached its child
+    assert child.state & ItemState.Dragging
@@ -0,0 +1,105 @@
+import numpy as np
+import pytest
+from unittest.mock import Mock
+from met_viewport_utils import instrument
+from met_viewport_utils.constants import InteractionFlags, ItemState, KeyboardModifier, MouseButton
+from met_viewport_utils.items.event_queue import EventQueue
+from met_viewport_utils.items.frame_context import FrameContext
+from met_viewport_utils.items.point_item import PointItem
+
+@pytest.fixture(autouse=True)
+def disable_instrument():
+    yield
+    instrument.disable()
+    instrument.reset()
+
+class RecordingItem(PointItem):
+    """Records the handlers called by the queue"""
+    def __init__(self):
+        super().__init__()
+        self.calls = []
+
+    def mouse_pressed(self, viewport, local_position, screen_position, button, modifier):
+        self.calls.append(("press", screen_position.tolist()))
+        return True
+
+    def mouse_released(self, viewport, local_position, screen_position, button, modifier):
+        self.calls.append(("release", screen_position.tolist()))
+        return True
+
+    def mouse_moved(self, viewport, local_position, screen_position, modifier):
+        assert isinstance(viewport, FrameContext)
+        self.calls.append(("move", screen_position.tolist()))
+
+def test_event_queue_coalesces_moves():
+    """Test consecutive moves collapse and presses keep their order"""
+    root = RecordingItem()
+    queue = EventQueue(root)
+    modifier = KeyboardModifier.NoKeyboardModifier
+    for x in range(3):
+        queue.mouse_moved(None, [x, 0], [x, 0], modifier)
+    queue.mouse_pressed(None, [2, 0], [2, 0], MouseButton.Left, modifier)
+    queue.mouse_moved(None, [3, 0], [3, 0], modifier)
+    queue.mouse_moved(None, [4, 0], [4, 0], modifier)
+    queue.mouse_released(None, [4, 0], [4, 0], MouseButton.Left, modifier)
+    assert len(queue) == 4
+    assert root.calls == []
+    assert queue.flush() == 3
+    assert root.calls == [("move", [2, 0]), ("press", [2, 0]), ("move", [4, 0]), ("release", [4, 0])]
+    assert len(queue) == 0
+    assert queue.flush() == 0
+    assert queue.dropped == 3
+
+def test_event_queue_viewports():
+    """Test moves in different viewports are not collapsed"""
+    root = RecordingItem()
+    queue = EventQueue(root)
+    first = Mock()
+    second = Mock()
+    queue.mouse_moved(first, [0, 0], [0, 0], KeyboardModifier.NoKeyboardModifier)
+    queue.mouse_moved(second, [1, 0], [1, 0], KeyboardModifier.NoKeyboardModifier)
+    assert len(queue) == 2
+    assert queue.clear() == 2
+    assert queue.flush() == 0
+    assert root.calls == []
+
+def test_event_queue_copies_positions():
+    """Test positions are copied when queued so host buffers can be reused"""
+    root = RecordingItem()
+    queue = EventQueue(root)
+    position = np.array([1, 1], dtype=np.float32)
+    queue.mouse_pressed(None, position, position, MouseButton.Left, KeyboardModifier.NoKeyboardModifier)
+    position[0] = 5
+    queue.flush()
+    assert root.calls == [("press", [1, 1])]
+
+def test_event_queue_drag():
+    """Test a drag through the queue only applies the latest position"""
+    root = PointItem()
+    root.is2d = True
+    item = PointItem()
+    item.is2d = True
+    item.flags = InteractionFlags.Draggable
+    item.parent = root
+    item._is_under_mouse = Mock(return_value=True)
+    queue = EventQueue(root)
+    modifier = KeyboardModifier.NoKeyboardModifier
+    queue.mouse_moved(None, [0, 0], [0, 0], modifier)
+    queue.mouse_pressed(None, [0, 0], [0, 0], MouseButton.Left, modifier)
+    for x in range(1, 11):
+        queue.mouse_moved(None, [x, 0], [x, 0], modifier)
+    instrument.enable()
+    with instrument.frame():
+        assert queue.flush() == 9
+    assert instrument.last_frame().counts["event_queue.dropped"] == 0
+    assert item.state & ItemState.Dragging
+    assert np.array_equal(item.position, [10, 0, 0])
+
+def test_event_queue_instrument():
+    """Test dropped moves are counted in the current frame"""
+    queue = EventQueue(RecordingItem())
+    instrument.enable()
+    with instrument.frame():
+        for x in range(4):
+            queue.mouse_moved(None, [x, 0], [x, 0], KeyboardModifier.NoKeyboardModifier)
+    assert instrument.last_frame().counts["event_queue.dropped"] == 3
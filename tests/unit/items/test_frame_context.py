@@ -0,0 +1,106 @@
+import numpy as np
+import pytest
+from unittest.mock import Mock
+from met_viewport_utils.algorithm import types
+from met_viewport_utils.constants import InteractionFlags, KeyboardModifier, MouseButton
+from met_viewport_utils.interfaces import MatrixViewport
+from met_viewport_utils.items.frame_context import FrameContext
+from met_viewport_utils.items.hud_item import HudItem
+from met_viewport_utils.items.point_item import PointItem
+from met_viewport_utils.shape.rect import Rect
+
+def _viewport():
+    viewport = Mock()
+    viewport.world_to_screen = Mock(side_effect=lambda position: types.as_vector2f(position) * 2.0)
+    return viewport
+
+def test_frame_context_screen_position():
+    """Test screen positions are projected once per frame"""
+    viewport = _viewport()
+    item = PointItem()
+    item.position = [1, 2, 3]
+    with FrameContext(viewport) as context:
+        position = item.screen_position(context)
+        assert np.array_equal(position, [2, 4])
+        assert item.screen_position(context) is position
+        assert not position.flags.writeable
+        assert viewport.world_to_screen.call_count == 1
+        assert context._screen_positions
+    # Cleared at frame end
+    assert not context._screen_positions
+    item.screen_position(context)
+    assert viewport.world_to_screen.call_count == 2
+
+def test_frame_context_invalidated_by_move():
+    """Test moving an item within a frame projects it again"""
+    viewport = _viewport()
+    parent = PointItem()
+    child = PointItem()
+    child.parent = parent
+    context = FrameContext(viewport)
+    assert np.array_equal(context.screen_position(child), [0, 0])
+    parent.position = [1, 1, 0]
+    assert np.array_equal(context.screen_position(child), [2, 2])
+
+def test_frame_context_screen_positions():
+    """Test bulk positions only project uncached items"""
+    viewport = Mock()
+    viewport.world_to_screen = Mock(side_effect=lambda position: types.as_vector2f(position))
+    items = []
+    for index in range(4):
+        item = PointItem()
+        item.position = [index, 0, 0]
+        items.append(item)
+    context = FrameContext(viewport)
+    context.screen_position(items[0])
+    positions = context.screen_positions(items)
+    assert np.array_equal(positions[:, 0], [0, 1, 2, 3])
+    assert viewport.world_to_screen.call_count == 4
+    assert np.array_equal(context.screen_position(items[3]), [3, 0])
+    assert viewport.world_to_screen.call_count == 4
+
+def test_frame_context_screen_rect():
+    """Test screen rects are memoized and read-only"""
+    context = FrameContext(_viewport())
+    item = PointItem()
+    hud = HudItem()
+    hud.size = [10, 10]
+    rect = context.screen_rect(item)
+    assert context.screen_rect(item) is rect
+    assert np.array_equal(rect.position, item.screen_rect(context).position)
+    with pytest.raises(ValueError):
+        rect.position[0] = 1
+    assert np.array_equal(context.screen_rect(hud).size, hud.global_rect().size)
+
+def test_frame_context_viewport_values():
+    """Test the viewport rect and matrices are memoized and other calls are forwarded"""
+    viewport = MatrixViewport(rect=Rect([0, 0], [100, 50]))
+    context = FrameContext(viewport)
+    assert context.rect() is context.rect()
+    assert np.array_equal(context.rect().size, [100, 50])
+    matrix = context.view_matrix()
+    assert matrix is context.view_matrix()
+    assert not matrix.flags.writeable
+    assert np.array_equal(context.projection_matrix(), viewport.projection_matrix())
+    assert np.array_equal(context.world_to_screen_many([[0, 0, 0]]), [[50, 25]])
+    assert context.set_matrices is not None
+    assert FrameContext.wrap(context) is context
+    assert FrameContext(context).viewport is viewport
+
+def test_frame_context_mouse_events():
+    """Test mouse handlers share one context across the hierarchy"""
+    viewport = _viewport()
+    root = PointItem()
+    child = PointItem()
+    child.parent = root
+    grandchild = PointItem()
+    grandchild.parent = child
+    for item in (root, child, grandchild):
+        item.flags = InteractionFlags.TracksMouse
+    context = FrameContext(viewport)
+    root.mouse_moved(context, [0, 0], [0, 0], KeyboardModifier.NoKeyboardModifier)
+    # Projected once for the hit test, the dispatch reuses the positions
+    assert viewport.world_to_screen.call_count == 3
+    root.mouse_pressed(context, [0, 0], [0, 0], MouseButton.Left, KeyboardModifier.NoKeyboardModifier)
+    root.mouse_released(context, [0, 0], [0, 0], MouseButton.Left, KeyboardModifier.NoKeyboardModifier)
+    assert viewport.world_to_screen.call_count == 3
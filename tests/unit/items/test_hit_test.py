@@ -0,0 +1,91 @@
+import numpy as np
+from unittest.mock import Mock
+from met_viewport_utils.algorithm import types
+from met_viewport_utils.algorithm.meta import typed_property
+from met_viewport_utils.constants import InteractionFlags, ItemState, KeyboardModifier
+from met_viewport_utils.items.hit_test import batch_hit_test
+from met_viewport_utils.items.hud_item import HudItem
+from met_viewport_utils.items.point_item import PointItem
+
+def _viewport():
+    viewport = Mock()
+    viewport.world_to_screen = lambda position: types.as_vector2f(position) * 2.0
+    return viewport
+
+def test_batch_hit_test_matches_items():
+    """Test the batch result matches each item's own hit test"""
+    rng = np.random.default_rng(2)
+    viewport = _viewport()
+    items = []
+    for index in range(60):
+        item = HudItem() if index % 3 == 0 else PointItem()
+        item.is2d = index % 2 == 0
+        item.position = [*rng.uniform(0, 100, 2), 0]
+        if isinstance(item, HudItem):
+            item.size = rng.uniform(5, 40, 2)
+        items.append(item)
+
+    for position in rng.uniform(0, 200, (40, 2)):
+        hit_test = batch_hit_test(items, viewport, position)
+        for item in items:
+            assert hit_test.is_under_mouse(item) == item._is_under_mouse(viewport, position, position)
+
+def test_batch_hit_test_custom_items():
+    """Test items with their own hit test are not tested"""
+    class Custom(PointItem):
+        def _is_under_mouse(self, viewport, local_position, screen_position):
+            return True
+    custom = Custom()
+    custom.is2d = True
+    hit_test = batch_hit_test([custom], None, [0, 0])
+    assert hit_test.is_under_mouse(custom) is None
+
+def test_hover_state_only_set_on_change():
+    """Test moving within an item does not set its state"""
+    sets = []
+    class CountingItem(PointItem):
+        state = typed_property(ItemState, default=ItemState.Enabled | ItemState.Visible, notify=sets.append)
+
+    root = CountingItem()
+    root.is2d = True
+    root.flags = InteractionFlags.TracksMouse
+    child = CountingItem()
+    child.is2d = True
+    child.flags = InteractionFlags.TracksMouse
+    child.position = [100, 0, 0]
+    child.parent = root
+    modifier = KeyboardModifier.NoKeyboardModifier
+    root.mouse_moved(None, [0, 0], [0, 0], modifier)
+    assert sets == [root]
+    root.mouse_moved(None, [1, 1], [1, 1], modifier)
+    assert sets == [root]
+    root.mouse_moved(None, [100, 0], [100, 0], modifier)
+    assert sets == [root, root, child]
+    assert child.state & ItemState.Hovered and not root.state & ItemState.Hovered
+
+def test_project_items_batches_3d():
+    """Test 3D items are projected with one world_to_screen_many call"""
+    from met_viewport_utils.interfaces.viewport import IViewport
+    from met_viewport_utils.items.hit_test import project_items
+
+    class MatrixViewport(IViewport):
+        calls = 0
+        def screen_to_world(self, screen_position, depth_point):
+            pass
+        def screen_to_ray(self, screen_position):
+            pass
+        def world_to_screen(self, world_position):
+            raise AssertionError("Should be batched")
+        def world_to_screen_many(self, world_positions):
+            self.calls += 1
+            return types.as_vector3f_array(world_positions)[:, :2] * 2.0
+
+    viewport = MatrixViewport()
+    items = [PointItem() for _ in range(3)]
+    items[1].is2d = True
+    for index, item in enumerate(items):
+        item.position = [index, index, 0]
+    positions = project_items(items, viewport)
+    assert viewport.calls == 1
+    assert np.array_equal(positions, [[0, 0], [1, 1], [4, 4]])
+    assert not positions.flags.writeable
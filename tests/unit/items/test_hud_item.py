@@ -218,3 +218,60 @@ def test_hud_item_with_margins():
     parent_rect = child.parent_rect()
     assert np.array_equal(parent_rect.position, [10, 10])  # Offset by margins
     assert np.array_equal(parent_rect.size, [180, 180])  # Size reduced by margins
+
+def test_global_rect_cache():
+    """Test the global rect is cached, copied on get and invalidated by parent layout changes"""
+    parent = HudItem()
+    parent.size = [200, 200]
+    parent.align = Align.BottomLeft
+    child = HudItem()
+    child.parent = parent
+    child.size = [50, 50]
+    child.align = Align.BottomLeft
+
+    rect = child._global_rect()
+    assert child._global_rect() is rect
+    with pytest.raises(ValueError):
+        rect.position[0] = 1
+    # The public rect is a copy that can be adjusted
+    public = child.global_rect()
+    assert public is not rect
+    public.position[0] = 1
+    assert np.array_equal(child.global_rect().position, [0, 0])
+
+    parent.margins = Margins(left=10, right=10, top=10, bottom=10)
+    assert np.array_equal(child.global_rect().position, [10, 10])
+
+    child.align = Align.TopRight
+    assert np.array_equal(child.global_rect().position, [190, 190])
+
+    parent.size = [100, 100]
+    assert np.array_equal(child.global_rect().position, [90, 90])
+
+    child.size = [20, 20]
+    assert np.array_equal(child.global_rect().size, [20, 20])
+
+    # map_to_global does not modify the cached parent rect
+    parent_rect = parent.global_rect()
+    child.map_to_global(types.as_vector2f([0, 0]))
+    assert np.array_equal(parent_rect.size, [100, 100])
+
+def test_margins_edited_in_place():
+    """Test editing margins in place invalidates the children"""
+    parent = HudItem()
+    parent.size = [200, 200]
+    parent.align = Align.BottomLeft
+    child = HudItem()
+    child.parent = parent
+    child.align = Align.BottomLeft
+    assert np.array_equal(child.global_rect().position, [0, 0])
+    parent.margins.left = 10
+    assert np.array_equal(child.global_rect().position, [10, 0])
+    margins = Margins(bottom=5)
+    parent.margins = margins
+    assert np.array_equal(child.global_rect().position, [0, 5])
+    # Assigned margins are copied, the original is not tracked
+    margins.bottom = 20
+    assert np.array_equal(child.global_rect().position, [0, 5])
+    parent.margins.bottom = 20
+    assert np.array_equal(child.global_rect().position, [0, 20])
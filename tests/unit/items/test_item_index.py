@@ -0,0 +1,106 @@
+import pytest
+from unittest.mock import Mock
+from met_viewport_utils.algorithm import types
+from met_viewport_utils.algorithm.spatial import QuadTreeIndex
+from met_viewport_utils.constants import InteractionFlags, ItemState, KeyboardModifier
+from met_viewport_utils.interfaces.hierachy import IHierarchyItem
+from met_viewport_utils.items.hud_item import HudItem
+from met_viewport_utils.items.item_index import ItemIndex
+from met_viewport_utils.items.point_item import PointItem
+
+def _item(position, parent=None):
+    item = PointItem()
+    item.is2d = True
+    item.flags = InteractionFlags.TracksMouse
+    item.position = position
+    item.parent = parent
+    return item
+
+def _move(root, position):
+    viewport = Mock()
+    viewport.world_to_screen = types.as_vector2f
+    root.mouse_moved(viewport, position, position, KeyboardModifier.NoKeyboardModifier)
+
+def _hovered(root):
+    return {item.name for item in [root] + list(root.iter_descendants(PointItem)) if item.state & ItemState.Hovered}
+
+@pytest.mark.parametrize("index", [None, ItemIndex(), ItemIndex(QuadTreeIndex())])
+def test_item_index_hover(index):
+    """Test hover results match with and without an index"""
+    root = _item([0, 0, 0])
+    root.name = "root"
+    a = _item([100, 0, 0], root)
+    a.name = "a"
+    b = _item([15, 15, 0], a)
+    b.name = "b"
+    root.spatial_index = index
+    if index is not None:
+        assert len(index) == 3
+
+    _move(root, [100, 0])
+    assert _hovered(root) == {"a"}
+    _move(root, [108, 8])
+    assert _hovered(root) == {"a", "b"}
+
+    # Moving a parent moves the indexed rects of its children
+    a.position = [200, 0, 0]
+    _move(root, [208, 8])
+    assert _hovered(root) == {"a", "b"}
+    _move(root, [0, 0])
+    assert _hovered(root) == {"root"}
+
+def test_item_index_membership():
+    """Test items join and leave the index with the hierarchy"""
+    index = ItemIndex()
+    root = _item([0, 0, 0])
+    root.spatial_index = index
+    passthrough = IHierarchyItem()
+    passthrough.parent = root
+    child = _item([50, 50, 0], passthrough)
+    hud = HudItem()
+    hud.size = [10, 10]
+    hud.parent = child
+    assert child in index and hud in index
+
+    child.parent = None
+    assert child not in index and hud not in index
+    assert child._item_index is None
+    passthrough.parent = None
+    child.parent = passthrough
+    passthrough.parent = root
+    assert child in index and hud in index
+
+    root.spatial_index = None
+    assert len(index) == 0
+    assert hud._item_index is None
+
+    with pytest.raises(ValueError):
+        child.spatial_index = ItemIndex()
+
+def test_item_index_direct_tests():
+    """Test 3D items and custom hit tests are tested directly"""
+    index = ItemIndex()
+    root = _item([0, 0, 0])
+    root.spatial_index = index
+    point3d = PointItem()
+    point3d.parent = root
+
+    class Custom(PointItem):
+        def _is_under_mouse(self, viewport, local_position, screen_position):
+            return True
+    custom = Custom()
+    custom.is2d = True
+    custom.flags = InteractionFlags.TracksMouse
+    custom.parent = root
+
+    index.update()
+    assert index.is_indexed(root)
+    assert not index.is_indexed(point3d)
+    assert not index.is_indexed(custom)
+    _move(root, [500, 500])
+    assert custom.state & ItemState.Hovered
+
+    root.is2d = False
+    assert not index.is_indexed(root)
+    index.update()
+    assert root not in index.index
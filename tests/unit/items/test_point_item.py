@@ -2,7 +2,8 @@ import pytest
 import numpy as np
 from unittest.mock import Mock, PropertyMock, ANY
 from numpy.testing import assert_array_almost_equal
-from met_viewport_utils.items.point_item import PointItem
+from met_viewport_utils import instrument
+from met_viewport_utils.items.point_item import PointItem, scene_version
 from met_viewport_utils.constants import MouseButton, KeyboardModifier, InteractionFlags, ItemState
 from met_viewport_utils.algorithm import types
 
@@ -22,7 +23,7 @@ def test_point_item_init():
     """Test point item initialization"""
     item = PointItem()
     assert not item.is2d  # 3D by default
-    assert item.flags == InteractionFlags.NoInteraction
+    assert item.flags == InteractionFlags.TracksMouse
     assert item.state == (ItemState.Enabled | ItemState.Visible)
     assert np.array_equal(item.position, [0, 0, 0])
 
@@ -147,3 +148,314 @@ def test_point_item_2d_3d_mixing():
     
     # Global position should be local position due to dimensional mismatch
     assert np.array_equal(child_2d.global_position(), [5, 5, 0])
+
+def test_position_readonly_view():
+    """Test position is updated in place and returned read-only"""
+    item = PointItem()
+    position = item.position
+    with pytest.raises(ValueError):
+        position[0] = 1
+    item.position = [1, 2, 3]
+    assert np.array_equal(position, [1, 2, 3])
+
+def test_drag_data_is_a_copy():
+    """Test the drag origin is not affected by the drag"""
+    viewport = MockViewport()
+    item = PointItem()
+    item.flags = InteractionFlags.Draggable
+    item._is_under_mouse = Mock(return_value=True)
+    item.mouse_moved(viewport, [0, 0], [100, 100], KeyboardModifier.NoKeyboardModifier)
+    item.mouse_pressed(viewport, [0, 0], [100, 100], MouseButton.Left, KeyboardModifier.NoKeyboardModifier)
+    item.mouse_moved(viewport, [10, 10], [110, 110], KeyboardModifier.NoKeyboardModifier)
+    item.mouse_moved(viewport, [20, 10], [120, 110], KeyboardModifier.NoKeyboardModifier)
+    assert np.array_equal(item.position, [20, 10, 0])
+
+def test_global_position_cache():
+    """Test the global position is cached, read-only and invalidated by parents only"""
+    from met_viewport_utils.interfaces.hierachy import IHierarchyItem
+    root = PointItem()
+    root.position = [10, 0, 0]
+    passthrough = IHierarchyItem()
+    passthrough.parent = root
+    child = PointItem()
+    child.parent = passthrough
+    child.position = [1, 2, 3]
+    sibling = PointItem()
+    sibling.parent = root
+
+    position = child.global_position()
+    assert child.global_position() is position
+    with pytest.raises(ValueError):
+        position[0] = 1
+    sibling_position = sibling.global_position()
+
+    child.position = [2, 2, 3]
+    assert np.array_equal(child.global_position(), [12, 2, 3])
+    assert sibling.global_position() is sibling_position  # Siblings are unaffected
+
+    root.position = [20, 0, 0]
+    assert np.array_equal(child.global_position(), [22, 2, 3])
+
+    # Changes above a non PointItem reach its descendants
+    other = PointItem()
+    other.position = [100, 100, 100]
+    passthrough.parent = other
+    assert np.array_equal(child.global_position(), [102, 102, 103])
+
+    child.is2d = True
+    assert np.array_equal(child.global_position(), [2, 2, 3])
+
+def _quiet():
+    item = PointItem()
+    item.flags = InteractionFlags.NoInteraction
+    return item
+
+def test_plain_item_hovered():
+    """Test items with the default flags are hovered and track the mouse"""
+    root = PointItem()
+    root.is2d = True
+    item = PointItem()
+    item.is2d = True
+    item.parent = root
+    root.mouse_moved(None, [5, 5], [5, 5], KeyboardModifier.NoKeyboardModifier)
+    assert item.state & ItemState.Hovered
+    assert np.array_equal(item._local_mouse_position, [5, 5])
+    root.mouse_moved(None, [50, 50], [50, 50], KeyboardModifier.NoKeyboardModifier)
+    assert not item.state & ItemState.Hovered
+
+def test_subtree_interaction():
+    """Test interaction flags are aggregated over subtrees as flags and parents change"""
+    from met_viewport_utils.interfaces.hierachy import IHierarchyItem
+    root = _quiet()
+    passthrough = IHierarchyItem()
+    passthrough.parent = root
+    child = _quiet()
+    child.parent = passthrough
+    leaf = _quiet()
+    leaf.parent = child
+    assert not root._subtree_interaction
+
+    leaf.flags = InteractionFlags.Draggable
+    assert child._subtree_interaction == InteractionFlags.Draggable
+    assert root._subtree_interaction == InteractionFlags.Draggable
+    child.flags = InteractionFlags.Selectable
+    assert root._subtree_interaction == InteractionFlags.Selectable | InteractionFlags.Draggable
+    leaf.flags = InteractionFlags.NoInteraction
+    assert root._subtree_interaction == InteractionFlags.Selectable
+
+    # Reparenting moves the aggregate
+    other = _quiet()
+    passthrough.parent = other
+    assert not root._subtree_interaction
+    assert other._subtree_interaction == InteractionFlags.Selectable
+    child.parent = None
+    assert not other._subtree_interaction
+
+    class Tracking(PointItem):
+        def _mouse_move_event(self, event):
+            return super()._mouse_move_event(event)
+    tracking = Tracking()
+    tracking.flags = InteractionFlags.NoInteraction
+    tracking.parent = root
+    assert root._subtree_interaction == InteractionFlags.TracksMouse
+    # Plain items track the mouse by default
+    PointItem().parent = root
+    assert root._child_interaction[InteractionFlags.TracksMouse] == 2
+
+def test_non_interactive_subtrees_skipped():
+    """Test items without interactions are not hit-tested or updated"""
+    root = _quiet()
+    root.is2d = True
+    quiet = _quiet()
+    quiet.is2d = True
+    quiet.parent = root
+    _quiet().parent = quiet
+    active = PointItem()
+    active.is2d = True
+    active.flags = InteractionFlags.Selectable
+    active.parent = root
+    assert list(root._iter_hover_items()) == [active]
+
+    root.mouse_moved(None, [0, 0], [0, 0], KeyboardModifier.NoKeyboardModifier)
+    assert active.state & ItemState.Hovered
+    assert not quiet.state & ItemState.Hovered
+    assert np.array_equal(active._local_mouse_position, [0, 0])
+
+    # Hover is cleared when an item stops interacting
+    active.flags = InteractionFlags.NoInteraction
+    assert not active.state & ItemState.Hovered
+    assert list(root._iter_hover_items()) == []
+
+def test_scene_version():
+    """Test the scene version changes with items"""
+    parent = PointItem()
+    item = PointItem()
+    changes = [
+        lambda: setattr(item, "position", [1, 0, 0]),
+        lambda: setattr(item, "flags", InteractionFlags.Selectable),
+        lambda: setattr(item, "state", ItemState.Enabled),
+        lambda: setattr(item, "parent", parent),
+    ]
+    for change in changes:
+        version = scene_version()
+        change()
+        assert scene_version() > version
+    version = scene_version()
+    item.global_position()
+    assert scene_version() == version
+
+def test_hover_memo():
+    """Test repeated moves reuse the hover result until the cursor cell or scene changes"""
+    root = PointItem()
+    root.is2d = True
+    item = PointItem()
+    item.is2d = True
+    item.flags = InteractionFlags.Draggable
+    item.parent = root
+    modifier = KeyboardModifier.NoKeyboardModifier
+
+    def cached(position, viewport=None):
+        with instrument.frame() as stats:
+            root.mouse_moved(viewport, position, position, modifier)
+        return stats.counts["item.hover_cached"] == 1
+
+    instrument.enable()
+    try:
+        assert not cached([0, 0])
+        assert item.state & ItemState.Hovered
+        assert cached([0, 0])
+        assert cached([0.5, 0.25])  # Within the same cell
+        assert not cached([15, 15])
+        assert not item.state & ItemState.Hovered
+        item.position = [10, 10, 0]
+        assert not cached([15, 15])
+        assert item.state & ItemState.Hovered
+        # Viewports without matrices are never cached
+        assert not cached([15, 15], MockViewport())
+        assert not cached([15, 15], MockViewport())
+
+        # Not cached while dragging
+        root.mouse_pressed(None, [15, 15], [15, 15], MouseButton.Left, modifier)
+        assert not cached([15, 15])
+        assert not cached([15, 15])
+        root.mouse_released(None, [15, 15], [15, 15], MouseButton.Left, modifier)
+        assert not cached([15, 15])
+        assert cached([15, 15])
+    finally:
+        instrument.disable()
+        instrument.reset()
+
+def test_hover_memo_matrices():
+    """Test camera changes invalidate the hover result"""
+    from met_viewport_utils.interfaces import MatrixViewport
+    from met_viewport_utils.shape.rect import Rect
+    viewport = MatrixViewport(rect=Rect([0, 0], [100, 100]))
+    root = PointItem()
+    root.flags = InteractionFlags.TracksMouse
+    modifier = KeyboardModifier.NoKeyboardModifier
+    instrument.enable()
+    try:
+        with instrument.frame() as stats:
+            root.mouse_moved(viewport, [50, 50], [50, 50], modifier)
+            root.mouse_moved(viewport, [50, 50], [50, 50], modifier)
+            assert root.state & ItemState.Hovered
+            viewport.set_matrices(view=[[1, 0, 0, 1], [0, 1, 0, 0], [0, 0, 1, 0], [0, 0, 0, 1]])
+            root.mouse_moved(viewport, [50, 50], [50, 50], modifier)
+        assert stats.counts["item.hover_cached"] == 1
+        assert not root.state & ItemState.Hovered
+    finally:
+        instrument.disable()
+        instrument.reset()
+
+def test_hover_memo_local_position():
+    """Test moves within a cached cell still update the local mouse position"""
+    root = PointItem()
+    root.is2d = True
+    item = PointItem()
+    item.is2d = True
+    item.parent = root
+    root.hover_cell_size = 10
+    modifier = KeyboardModifier.NoKeyboardModifier
+    instrument.enable()
+    try:
+        with instrument.frame() as stats:
+            root.mouse_moved(None, [1, 1], [1, 1], modifier)
+            root.mouse_moved(None, [2, 3], [2, 3], modifier)
+        assert stats.counts["item.hover_cached"] == 1
+        assert np.array_equal(root._local_mouse_position, [2, 3])
+        assert np.array_equal(item._local_mouse_position, [2, 3])
+    finally:
+        instrument.disable()
+        instrument.reset()
+
+def test_hover_memo_custom_hit_test():
+    """Test items with a custom hit test are tested on every move"""
+    class Custom(PointItem):
+        hit = False
+        def _is_under_mouse(self, viewport, local_position, screen_position):
+            return self.hit
+
+    root = PointItem()
+    root.is2d = True
+    item = Custom()
+    item.is2d = True
+    item.parent = root
+    modifier = KeyboardModifier.NoKeyboardModifier
+    root.mouse_moved(None, [0, 0], [0, 0], modifier)
+    assert not item.state & ItemState.Hovered
+    Custom.hit = True
+    root.mouse_moved(None, [0, 0], [0, 0], modifier)
+    assert item.state & ItemState.Hovered
+    # Other subtrees are still cached
+    other = PointItem()
+    other.is2d = True
+    item.flags = InteractionFlags.NoInteraction
+    other.parent = item
+    root.mouse_moved(None, [0, 0], [0, 0], modifier)
+    assert root._hover_memo is not None
+
+def test_hover_memo_margins():
+    """Test in place margins edits invalidate the hover result"""
+    from met_viewport_utils.items.hud_item import HudItem
+    from met_viewport_utils.constants import Align
+    root = HudItem()
+    root.size = [200, 200]
+    item = HudItem()
+    item.align = Align.TopLeft
+    item.parent = root
+    modifier = KeyboardModifier.NoKeyboardModifier
+    position = item.global_position()[:2].tolist()
+    root.mouse_moved(None, position, position, modifier)
+    assert item.state & ItemState.Hovered
+    root.margins.left = 50
+    root.mouse_moved(None, position, position, modifier)
+    assert not item.state & ItemState.Hovered
+
+def test_hover_memo_viewport_changes():
+    """Test the memo reads the wrapped viewport and its optional version"""
+    from met_viewport_utils.interfaces import MatrixViewport
+    from met_viewport_utils.items.frame_context import FrameContext
+    from met_viewport_utils.shape.rect import Rect
+
+    class HostViewport(MatrixViewport):
+        viewport_version = 0
+
+    viewport = HostViewport(rect=Rect([0, 0], [100, 100]))
+    context = FrameContext(viewport)
+    root = PointItem()
+    modifier = KeyboardModifier.NoKeyboardModifier
+    instrument.enable()
+    try:
+        with instrument.frame() as stats:
+            root.mouse_moved(context, [50, 50], [50, 50], modifier)
+            assert root.state & ItemState.Hovered
+            # The reused context memoized the old matrices
+            viewport.set_matrices(view=[[1, 0, 0, 1], [0, 1, 0, 0], [0, 0, 1, 0], [0, 0, 0, 1]])
+            root.mouse_moved(context, [50, 50], [50, 50], modifier)
+            viewport.viewport_version += 1
+            root.mouse_moved(context, [50, 50], [50, 50], modifier)
+            root.mouse_moved(context, [50, 50], [50, 50], modifier)
+        assert stats.counts["item.hover_cached"] == 1
+    finally:
+        instrument.disable()
+        instrument.reset()
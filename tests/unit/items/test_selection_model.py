@@ -0,0 +1,140 @@
+import pytest
+from met_viewport_utils.constants import ItemState, KeyboardModifier
+from met_viewport_utils.interfaces import IHierarchyItem
+from met_viewport_utils.items.point_item import PointItem
+from met_viewport_utils.items.selection_model import SelectionModel
+
+def _tree(count=5):
+    root = PointItem()
+    items = []
+    for _ in range(count):
+        item = PointItem()
+        item.parent = root
+        items.append(item)
+    return root, items
+
+def test_selection_model_state():
+    """Test membership and the Selected state stay in sync"""
+    root, items = _tree()
+    model = root.selection_model
+    assert items[0].selection_model is model
+    model.extend(items[:3])
+    assert model.items == tuple(items[:3])
+    assert all(item.state & ItemState.Selected for item in items[:3])
+    assert model.current is items[2]
+
+    model.toggle(items[2:4])
+    assert model.items == (items[0], items[1], items[3])
+    assert not items[2].state & ItemState.Selected
+
+    model.select([items[4]])
+    assert model.items == (items[4],)
+    assert not any(item.state & ItemState.Selected for item in items[:4])
+
+    model.clear()
+    assert not model
+    assert model.current is None
+    assert not items[4].state & ItemState.Selected
+
+def test_selection_model_item_state():
+    """Test setting the state on an item updates the model"""
+    root, items = _tree()
+    items[1].state |= ItemState.Selected
+    assert items[1] in root.selection_model
+    items[1].state &= ~ItemState.Selected
+    assert items[1] not in root.selection_model
+    # Other state changes do not select
+    items[1].state |= ItemState.Hovered
+    assert not root.selection_model
+
+def test_selection_model_callbacks():
+    """Test changes are notified once per call or batch"""
+    root, items = _tree()
+    model = root.selection_model
+    changes = []
+    callback = lambda added, removed: changes.append((added, removed))
+    model.add_callback(callback)
+    model.extend(items[:2])
+    assert changes == [(tuple(items[:2]), ())]
+    with model.batch():
+        model.clear()
+        model.extend([items[0], items[2]])
+    # items[0] was removed and added again
+    assert changes[1] == ((items[2],), (items[1],))
+    model.extend([items[0]])
+    assert len(changes) == 2
+    model.remove_callback(callback)
+    model.clear()
+    assert len(changes) == 2
+
+def test_selection_model_owner():
+    """Test items from other roots are rejected and reparented items are deselected"""
+    root, items = _tree()
+    other, other_items = _tree()
+    model = root.selection_model
+    with pytest.raises(ValueError):
+        model.extend([other_items[0]])
+    model.extend(items[:2])
+    items[0].parent = other
+    assert model.items == (items[1],)
+    assert not items[0].state & ItemState.Selected
+    # Moving within the root keeps the selection
+    items[1].parent = items[2]
+    assert model.items == (items[1],)
+    # Selected descendants of a moved item are deselected
+    items[2].parent = other
+    assert not model
+    assert not items[1].state & ItemState.Selected
+
+def test_selection_model_non_item_root():
+    """Test the top most PointItem owns the selection below other hierarchy items"""
+    root = IHierarchyItem()
+    top = PointItem()
+    top.parent = root
+    child = PointItem()
+    child.parent = top
+    assert child.selection_model is top.selection_model
+    assert child.selection_model.owner is top
+
+def test_update_selection():
+    """Test click selection only changes the items involved"""
+    root, items = _tree()
+    items[0]._update_selection(KeyboardModifier.NoKeyboardModifier)
+    items[1]._update_selection(KeyboardModifier.Shift)
+    assert root.selection_model.items == (items[0], items[1])
+    items[0]._update_selection(KeyboardModifier.Shift | KeyboardModifier.Ctrl)
+    assert root.selection_model.items == (items[1],)
+    items[2]._update_selection(KeyboardModifier.NoKeyboardModifier)
+    assert root.selection_model.items == (items[2],)
+    assert [bool(item.state & ItemState.Selected) for item in items] == [False, False, True, False, False]
+
+def test_selection_model_without_owner():
+    """Test a model without an owner accepts any item"""
+    model = SelectionModel()
+    item = PointItem()
+    model.extend([item])
+    assert item.state & ItemState.Selected
+    root, items = _tree()
+    items[0].state |= ItemState.Selected
+    # Selecting in another model moves the item
+    model.extend([items[0]])
+    assert items[0] not in root.selection_model
+    assert items[0]._selection_model is model
+
+def test_reparent_cost_with_other_selection(monkeypatch):
+    """Test reparenting only visits the moved subtree, not selections in other roots"""
+    def root_item_calls(selected):
+        _, selected_items = _tree(selected)
+        selected_items[0].selection_model.extend(selected_items)
+        root, items = _tree(20)
+        other = PointItem()
+        calls = []
+        root_item = PointItem._root_item
+        monkeypatch.setattr(PointItem, "_root_item", lambda self: calls.append(self) or root_item(self))
+        for item in items:
+            item.parent = other
+            item.parent = root
+        monkeypatch.undo()
+        return len(calls)
+
+    assert root_item_calls(10) == root_item_calls(5000)
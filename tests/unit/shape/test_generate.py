@@ -1,6 +1,6 @@
 import pytest
 import numpy as np
-from met_viewport_utils.shape.generate import square2d, border2d, circle2d, arc2d, arrow2d
+from met_viewport_utils.shape.generate import PointTracer2d, square2d, border2d, circle2d, arc2d, arrow2d
 from met_viewport_utils.shape.rect import Rect
 from met_viewport_utils.shape.margins import Margins
 
@@ -171,3 +171,20 @@ def test_arrow2d_quad_head():
     assert np.allclose(mesh.points[6], [60, 80])  # Top head tip
     assert np.allclose(mesh.points[12], [110, 50]) # Right head tip
     assert np.allclose(mesh.points[18], [60, 20]) # Bottom head tip
+
+def test_point_tracer_xy():
+    """Test tracer x/y aliases"""
+    tracer = PointTracer2d([1, 2])
+    assert tracer.x == 1
+    assert tracer.y == 2
+    tracer.x = 5
+    assert np.array_equal(tracer.position, [5, 2])
+
+def test_point_tracer_refs():
+    """Test references are not affected by later moves"""
+    tracer = PointTracer2d()
+    tracer.move_to(np.array([1, 2], dtype=np.float32), ref="start")
+    tracer.x = 5
+    tracer.move_by((1, 1))
+    assert np.array_equal(tracer.ref("start"), [1, 2])
+    assert np.array_equal(tracer.position, [6, 3])
@@ -96,17 +96,17 @@ def test_mesh_translate():
     assert mesh.bounds.left() == 2
     assert mesh.bounds.bottom() == 3
 
-# def test_mesh_rotate():
-#     """Test mesh rotation"""
-#     points = [types.as_vector3f([1, 0, 0])]  # Single point, 1 unit right of origin
-#     mesh = Mesh2D(points)
-#     mesh.compute_bounds()  # Ensure bounds are set
+def test_mesh_rotate():
+    """Test mesh rotation"""
+    points = [types.as_vector3f([1, 0, 0])]  # Single point, 1 unit right of origin
+    mesh = Mesh2D(points)
+    mesh.compute_bounds()  # Ensure bounds are set
     
-#     # Rotate 90 degrees counter-clockwise around origin
-#     mesh.rotate_around(90, types.as_vector2f([0, 0]))
-#     # Point should now be at (0, 1) approximately
-#     assert abs(mesh.points[0][0]) < 0.001
-#     assert abs(mesh.points[0][1] - 1) < 0.001
+    # Rotate 90 degrees counter-clockwise around origin
+    mesh.rotate_around(90, types.as_vector2f([0, 0]))
+    # Point should now be at (0, 1) approximately
+    assert abs(mesh.points[0][0]) < 0.001
+    assert abs(mesh.points[0][1] - 1) < 0.001
 
 def test_mesh_scale():
     """Test mesh scaling"""
@@ -119,17 +119,31 @@ def test_mesh_scale():
     # Point should now be at (2, 2)
     assert np.array_equal(mesh.points[0], [2, 2, 0])
 
-# def test_mesh_compound_transform():
-#     """Test multiple transformations"""
-#     points = [types.as_vector3f([1, 0, 0])]  # Point 1 unit right of origin
-#     mesh = Mesh2D(points)
-#     mesh.compute_bounds()  # Ensure bounds are set
+def test_mesh_compound_transform():
+    """Test multiple transformations"""
+    points = [types.as_vector3f([1, 0, 0])]  # Point 1 unit right of origin
+    mesh = Mesh2D(points)
+    mesh.compute_bounds()  # Ensure bounds are set
     
-#     # Translate, then rotate, then scale
-#     mesh.translate_by(types.as_vector3f([1, 0, 0]))  # Move to (2, 0)
-#     mesh.rotate_around(90, types.as_vector2f([0, 0]))  # Rotate to (0, 2)
-#     mesh.scale_by(types.as_vector3f([2, 2, 1]), types.as_vector3f([0, 0, 0]))  # Scale to (0, 4)
+    # Translate, then rotate, then scale
+    mesh.translate_by(types.as_vector3f([1, 0, 0]))  # Move to (2, 0)
+    mesh.rotate_around(90, types.as_vector2f([0, 0]))  # Rotate to (0, 2)
+    mesh.scale_by(types.as_vector3f([2, 2, 1]), types.as_vector3f([0, 0, 0]))  # Scale to (0, 4)
     
-#     # Check final position
-#     assert abs(mesh.points[0][0]) < 0.001
-#     assert abs(mesh.points[0][1] - 4) < 0.001
+    # Check final position
+    assert abs(mesh.points[0][0]) < 0.001
+    assert abs(mesh.points[0][1] - 4) < 0.001
+
+def test_mesh_compute_uvs_bounds():
+    """Test UV computation with explicit and degenerate bounds"""
+    points = [
+        types.as_vector2f([0, 0]),
+        types.as_vector2f([2, 0]),
+        types.as_vector2f([1, 0]),
+    ]
+    mesh = Mesh2D(points)
+    mesh.compute_uvs()
+    # Zero height bounds map v to 0
+    assert np.allclose(mesh.uvs, [[0, 0], [1, 0], [0.5, 0]])
+    mesh.compute_uvs(Rect([0, -1], [4, 2]))
+    assert np.allclose(mesh.uvs, [[0, 0.5], [0.5, 0.5], [0.25, 0.5]])
@@ -50,3 +50,33 @@ class TestRect:
         assert r.contains([5, 5])
         assert not r.contains([15, 15])
         assert r.contains(Rect([2, 2], [3, 3]))
+
+    def test_point_at(self):
+        r = Rect([0, 0], [10, 20])
+        assert np.array_equal(r.point_at(Align.TopRight), [10, 20])
+        assert np.array_equal(r.point_at(Align.Center), [5, 10])
+        assert np.array_equal(r.position, [0, 0])  # Rect is not modified
+
+    def test_adjust(self):
+        r = Rect([0, 0], [100, 100])
+        position = r.position
+        r.adjust(Margins(left=10, top=20, right=30, bottom=40))
+        assert np.array_equal(r.position, [10, 40])
+        assert np.array_equal(r.size, [60, 40])
+        assert r.position is position  # Adjusted in place
+        adjusted = r.adjusted([5, 5, 5, 5])
+        assert np.array_equal(adjusted.position, [15, 45])
+        assert np.array_equal(r.position, [10, 40])
+
+    def test_copy(self):
+        r = Rect([10, 20], [30, 40])
+        copied = r.copy()
+        copied.position[0] = 0
+        copied.size[0] = 0
+        assert np.array_equal(r.position, [10, 20])
+        assert np.array_equal(r.size, [30, 40])
+        # Read-only arrays are copied before aligning in place
+        position = np.array([10, 20], dtype=np.float32)
+        position.flags.writeable = False
+        centered = Rect(position, [20, 20], Align.Center)
+        assert np.array_equal(centered.position, [0, 10])
@@ -0,0 +1,44 @@
+import pytest
+import numpy as np
+from met_viewport_utils.shape.rect import Rect
+from met_viewport_utils.shape.rect_array import RectArray
+from met_viewport_utils.constants import Align
+
+def test_rect_array_from_rects():
+    """Test rects are stored as left, bottom, right, top"""
+    rects = RectArray.from_rects([Rect([0, 0], [10, 20]), Rect([5, 5], [1, 1])])
+    assert len(rects) == 2
+    assert rects.bounds.dtype == np.float32
+    assert np.array_equal(rects.bounds, [[0, 0, 10, 20], [5, 5, 6, 6]])
+    assert rects[1].is_approx(Rect([5, 5], [1, 1]))
+    assert len(RectArray.from_rects([])) == 0
+
+def test_rect_array_from_centers():
+    """Test centered rects match Rect with Align.Center"""
+    centers = [[10, 10], [0.1, 0.3]]
+    rects = RectArray.from_centers(centers, [20, 20])
+    for center, rect in zip(centers, [rects[0], rects[1]]):
+        assert rect.is_approx(Rect(center, [20, 20], Align.Center))
+    sizes = RectArray.from_centers(centers, [[2, 2], [4, 6]])
+    assert np.array_equal(sizes.bounds[1], np.float32([0.1 - 2, 0.3 - 3, 0.1 + 2, 0.3 + 3]))
+
+def test_rect_array_contains():
+    """Test containment matches Rect.contains for each rect"""
+    rng = np.random.default_rng(0)
+    rects = [Rect(rng.uniform(-50, 50, 2), rng.uniform(0, 30, 2)) for _ in range(50)]
+    array = RectArray.from_rects(rects)
+    for point in rng.uniform(-60, 80, (50, 2)):
+        assert array.contains(point).tolist() == [rect.contains(point) for rect in rects]
+    # Edges are inclusive
+    assert array.contains(rects[0].position)[0]
+
+def test_rect_array_intersects():
+    """Test intersection with touching edges"""
+    array = RectArray([[0, 0, 10, 10], [20, 20, 30, 30]])
+    assert array.intersects(Rect([10, 10], [5, 5])).tolist() == [True, False]
+    assert array.intersects(Rect([-5, -5], [100, 100])).tolist() == [True, True]
+
+def test_rect_array_invalid_shape():
+    """Test bounds must be (N, 4)"""
+    with pytest.raises(ValueError):
+        RectArray([[0, 0, 1]])
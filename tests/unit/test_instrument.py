@@ -0,0 +1,114 @@
+import json
+import pytest
+from unittest.mock import Mock
+from met_viewport_utils import instrument
+from met_viewport_utils.algorithm import types
+from met_viewport_utils.constants import InteractionFlags, KeyboardModifier
+from met_viewport_utils.interfaces.gpu_shader import IGPUShader
+from met_viewport_utils.interfaces.viewport import IViewport
+from met_viewport_utils.items.point_item import PointItem
+
+class MockViewport(IViewport):
+    def screen_to_world(self, screen_position, depth_point):
+        return types.as_vector3f(depth_point)
+
+    def screen_to_ray(self, screen_position):
+        return types.as_vector3f([0, 0, 0]), types.as_vector3f([0, 0, 1])
+
+    def world_to_screen(self, world_position):
+        return types.as_vector2f(world_position)
+
+class MockGPUShader(IGPUShader):
+    def __init__(self):
+        super().__init__(Mock())
+        self._last_batch = True
+
+    def draw(self, viewport, vertex_in, primitive_type=None, indices=None, size=None, state=None, **kwargs):
+        self.set_uniform("scale", [1.0])
+
+@pytest.fixture(autouse=True)
+def disable_instrument():
+    yield
+    instrument.disable()
+    instrument.reset()
+
+def _hierarchy():
+    root = PointItem()
+    child = PointItem()
+    child.parent = root
+    grandchild = PointItem()
+    grandchild.parent = child
+    for item in (root, child, grandchild):
+        item.flags = InteractionFlags.TracksMouse
+    return root
+
+def test_instrument_disabled():
+    """Test nothing is wrapped or recorded while disabled"""
+    original = PointItem.mouse_moved
+    instrument.enable()
+    assert PointItem.mouse_moved is not original
+    instrument.disable()
+    assert PointItem.mouse_moved is original
+    assert MockViewport.world_to_screen.__name__ == "world_to_screen"
+    assert not hasattr(MockViewport.world_to_screen, "_instrument_stat")
+    assert instrument.begin_frame() is None
+    assert instrument.frames() == []
+
+def test_instrument_frame_counts():
+    """Test item, viewport and shader calls are counted per frame"""
+    root = _hierarchy()
+    viewport = MockViewport()
+    shader = MockGPUShader()
+    instrument.enable()
+    with instrument.frame() as stats:
+        root.mouse_moved(viewport, [0, 0], [0, 0], KeyboardModifier.NoKeyboardModifier)
+        shader.draw(viewport, {})
+    assert instrument.last_frame() is stats
+    assert stats.end
+    # The dispatcher visits each item once
+    assert stats.counts["item.mouse_moved"] == 1
+    assert stats.counts["item.visit"] == 3
+    assert stats.item_visits == 3
+    # Items are projected once per event
+    assert stats.counts["viewport.world_to_screen_many"] == 1
+    assert stats.counts["viewport.world_to_screen"] == 3
+    assert "item.screen_position" not in stats.counts
+    assert stats.counts["shader.draw"] == 1
+    assert stats.counts["shader.set_uniform"] == 1
+    assert stats.time_ms("item.mouse_moved") > 0
+    # Stats continue into a new frame
+    with instrument.frame() as second:
+        shader.draw(viewport, {})
+    assert second.index == stats.index + 1
+    assert second.counts["shader.draw"] == 1
+    assert second.item_visits == 0
+
+def test_instrument_new_subclass():
+    """Test classes defined after enabling are instrumented on the next frame"""
+    instrument.enable()
+
+    class LateViewport(MockViewport):
+        def world_to_screen(self, world_position):
+            return super().world_to_screen(world_position)
+
+    with instrument.frame() as stats:
+        LateViewport().world_to_screen([1, 2, 3])
+    # super() calls are only counted once
+    assert stats.counts["viewport.world_to_screen"] == 1
+
+def test_instrument_chrome_trace(tmp_path):
+    """Test trace events are exported as chrome trace json"""
+    shader = MockGPUShader()
+    instrument.enable(trace=True)
+    with instrument.frame() as stats:
+        shader.draw(None, {})
+    assert [event[0] for event in stats.events] == ["shader.set_uniform", "shader.draw"]
+
+    path = tmp_path / "trace.json"
+    instrument.export_chrome_trace(str(path))
+    trace = json.loads(path.read_text())
+    names = [event["name"] for event in trace["traceEvents"]]
+    assert f"frame {stats.index}" in names
+    assert "shader.draw" in names
+    complete = [event for event in trace["traceEvents"] if event["ph"] == "X"]
+    assert all("ts" in event and "dur" in event for event in complete)